@@ -0,0 +1,106 @@
+################################################################################
+# benchmarks/benchmarks.py: Performance benchmarks for airspeed velocity (asv).
+#
+# Run with "asv run" from the repository root; results are written as JSON to
+# .asv/results. "asv continuous main HEAD" compares two commits and reports
+# regressions.
+################################################################################
+
+import numpy as np
+
+import solar
+import tabulation as tab
+
+MODELS = ['Colina', 'Kurucz', 'Rieke', 'STIS', 'STIS_Rieke']
+UNITS = list(solar.UNIT_DICT.keys())
+XUNITS = list(solar.XUNIT_DICT.keys())
+
+# A representative filter set: 500 shaped bandpasses between 0.2 and 2.4 micron
+_RNG = np.random.default_rng(2024)
+_CENTERS = _RNG.uniform(0.2, 2.4, 500)
+BANDPASSES = [tab.Tabulation(np.linspace(c - 0.02, c + 0.02, 11),
+                             np.sin(np.linspace(0., np.pi, 11)) + 0.01)
+              for c in _CENTERS]
+
+# The channels of a 4000-band spectrometer
+CHANNEL_CENTERS = np.linspace(0.3, 2.3, 4000)
+CHANNEL_WIDTHS = np.full(4000, 0.0005)
+
+
+def timeraw_import(model):
+    """Cold import of the package and one model, in a fresh interpreter."""
+
+    return f'import solar.{model.lower()}'
+
+
+timeraw_import.params = MODELS
+timeraw_import.param_names = ['model']
+
+
+class FluxDensity(object):
+    """flux_density for every model and every combination of units."""
+
+    params = (MODELS, UNITS, XUNITS)
+    param_names = ['model', 'units', 'xunits']
+
+    def setup(self, model, units, xunits):
+        solar.configure_cache()
+        solar.flux_density(model, units=units, xunits=xunits)
+
+    def teardown(self, model, units, xunits):
+        solar.cache_clear()
+
+    def time_cached(self, model, units, xunits):
+        solar.flux_density(model, units=units, xunits=xunits, sun_range=2.)
+
+    def time_uncached(self, model, units, xunits):
+        solar.cache_clear()
+        solar.flux_density(model, units=units, xunits=xunits, sun_range=2.)
+
+
+class Bandpass(object):
+    """Single and batched bandpass and boxcar means for every model."""
+
+    params = MODELS
+    param_names = ['model']
+
+    def setup(self, model):
+        solar.configure_cache()
+        solar.flux_density(model)
+
+    def time_bandpass_flux_density(self, model):
+        solar.bandpass_flux_density(BANDPASSES[0], model=model)
+
+    def time_bandpass_flux_densities_500(self, model):
+        solar.bandpass_flux_densities(BANDPASSES, model=model)
+
+    def time_mean_flux_density(self, model):
+        solar.mean_flux_density(1., 0.1, model=model)
+
+    def time_mean_f_4000(self, model):
+        solar.mean_f(CHANNEL_CENTERS, CHANNEL_WIDTHS, model=model)
+
+    def time_bandpass_f_ranges_100000(self, model):
+        solar.bandpass_f(BANDPASSES[0], model=model,
+                         sun_range=np.linspace(1., 40., 100000))
+
+
+class Sample(object):
+    """Point evaluation of every model at a million unordered wavelengths."""
+
+    params = MODELS
+    param_names = ['model']
+
+    def setup(self, model):
+        solar.configure_cache()
+        self.x = np.random.default_rng(7).uniform(0.2, 2.4, 1000000)
+        solar.sample_flux_density(self.x[:10], model=model)
+
+    def time_sample_flux_density(self, model):
+        solar.sample_flux_density(self.x, model=model)
+
+    def time_iter_flux_density(self, model):
+        for _ in solar.iter_flux_density(self.x, model=model, chunk_size=100000):
+            pass
+
+################################################################################
@@ -22,179 +22,1742 @@ of flux density.
 # When a user does a wildcard import (from solar import *), don't import any
 # solar models by default; but DO export the public interface functions and
 # variables.
-__all__ = ['flux_density', 'bandpass_flux_density', 'mean_flux_density',
-           'bandpass_f', 'mean_f', 'AU', 'C', 'TO_CGS', 'TO_PER_ANGSTROM',
-           'TO_PER_NM']
+__all__ = ['flux_density', 'flux_density_array', 'sample_flux_density',
+           'iter_flux_density', 'convolved_flux_density',
+           'resampled_flux_density', 'bandpass_flux_density',
+           'bandpass_flux_densities', 'batch_bandpass_flux_density',
+           'mean_flux_density', 'bandpass_f', 'batch_bandpass_f', 'mean_f',
+           'register_bandpass', 'registered_bandpasses', 'cache_info',
+           'cache_clear', 'configure_cache', 'configure_result_cache',
+           'share_models', 'unshare_models', 'register_model',
+           'register_composite_model', 'registered_models', 'AU', 'C',
+           'TO_CGS', 'TO_PER_ANGSTROM', 'TO_PER_NM']
 
-import functools
+import concurrent.futures
+import hashlib
 import importlib
+import os
 import numpy as np
 import tabulation as tab
 
+from solar import _composite
+from solar import _convolve
+from solar import _data
+from solar import _shared
+from solar._bandpass import BandpassRegistry
+from solar._cache import SpectrumCache
+from solar._registry import ModelRegistry
+from solar._results import ResultCache
+from solar._spectrum import INTEGRATION_VERSION, Spectrum
+from solar._store import ModelStore
+
 try:
     from ._version import __version__
 except ImportError:  # pragma no cover
     __version__ = 'Version unspecified'
 
 
-# Class constants to be used externally as needed
-AU = 149597870.7       # km
-C = 299792.458         # km/sec
-C_IN_UM_HZ = C * 1.e9  # um/sec
+# Class constants to be used externally as needed
+AU = 149597870.7       # km
+C = 299792.458         # km/sec
+C_IN_UM_HZ = C * 1.e9  # um/sec
+
+# Converts from W/m^2 to erg/s/cm^2
+TO_CGS = 1.e7 / 1.e4
+
+# Converts from flux per micron to flux per Angstrom
+TO_PER_ANGSTROM = 1.e-4
+
+# Converts from flux per micron to flux per nanometer
+TO_PER_NM = 1.e-3
+
+# First UNIT_DICT item is conversion factor from W/m^2/um or from W/m^2/Hz.
+# Second item is True if the units are per wavelength, False if per frequency.
+UNIT_DICT = {
+    'W/m^2/um'     : (1.   , True),     # default units
+    'W/m^2/nm'     : (1.e-3, True),
+    'W/m^2/A'      : (1.e-4, True),
+    'erg/s/cm^2/um': (1.e+3, True),
+    'erg/s/cm^2/nm': (1.   , True),
+    'erg/s/cm^2/A' : (1.e-1, True),
+
+    'W/m^2/Hz'     : (1.   , False),
+    'erg/s/cm^2/Hz': (1.e+3, False),
+    'Jy'           : (1.e26, False),
+    'uJy'          : (1.e32, False),
+}
+
+# First XUNIT_DICT item is conversion factor from um or from Hz.
+# Second item is True if the units are wavelength, False if frequency.
+XUNIT_DICT = {
+    'um': (1.  , True),
+    'nm': (1.e3, True),
+    'A' : (1.e4, True),
+    'Hz': (1.  , False),
+}
+
+# Names of the models provided by this package
+MODEL_NAMES = ('colina', 'kurucz', 'rieke', 'stis_rieke', 'stis')
+
+# Default number of points that sample_flux_density processes at a time
+SAMPLE_CHUNK_SIZE = 1 << 20
+
+# Default byte budget for the cache of unit-converted model spectra
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Unit-converted model spectra at 1 AU, keyed by (model, units, xunits), and
+# smoothed ones, keyed by (model, units, xunits, LSF)
+_SPECTRUM_CACHE = SpectrumCache(max_bytes=CACHE_MAX_BYTES)
+
+# Model spectra in their native units, keyed by lower-case model name and
+# loaded once each on first use
+_MODEL_STORE = ModelStore(lambda key: _load_model(key))
+
+# Solar models by lower-case name. The built-in models are imported from their
+# modules in this package on first use; others are registered at run time or
+# provided by other packages as entry points.
+_MODELS = ModelRegistry(lambda module: _module_spectrum(module))
+for _key in MODEL_NAMES:
+    _MODELS.register(_key, lambda key: _import_model(key))
+
+# Named filter bandpasses and their mean solar flux densities at 1 AU
+_BANDPASSES = BandpassRegistry()
+
+# Default maximum number of values in the persistent result cache
+RESULT_CACHE_MAX_ENTRIES = 100000
+
+# Persistent cache of bandpass means at 1 AU; None if disabled. It is enabled
+# at import if the environment variable RMS_SOLAR_RESULT_CACHE is the path of
+# the database, so that it is enabled in worker processes too.
+_RESULT_CACHE = (ResultCache(os.environ['RMS_SOLAR_RESULT_CACHE'],
+                             max_entries=RESULT_CACHE_MAX_ENTRIES)
+                 if os.environ.get('RMS_SOLAR_RESULT_CACHE') else None)
+
+
+#===============================================================================
+def flux_density(model='STIS_Rieke', *, units='W/m^2/um', xunits='um',
+                 sun_range=1., solar_f=False):
+    """
+    Compute the flux density of a solar model in the specified units.
+
+    Args:
+        model (str, optional): Name of the model.
+        units (str, optional): Units for the flux.
+            Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
+            "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
+            or "uJy". "u" represents "mu" meaning micro.
+        xunits (str, optional): Units for the x-axis.
+            Options are: "um", "nm", "A", or "Hz". "u" represents "mu"
+            meaning micro.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU.
+        solar_f (bool, optional): True to divide by pi, providing solar F
+            instead of solar flux density.
+
+    Returns:
+        Tabulation or np.ndarray: The model solar flux density in the specified
+        units. If `sun_range` is an array, this is an object array of the same
+        shape, containing one Tabulation per distance.
+
+    Note:
+        The model is converted to the requested units only once, at 1 AU; the
+        distance and the factor of pi are applied to that cached spectrum.
+        Each distance in an array `sun_range` still builds a full Tabulation,
+        however; for many distances, use `flux_density_array`, which returns
+        one row of flux density per distance, or the bandpass and mean
+        functions, which accept arrays of distances directly.
+    """
+
+    tabulation = _unit_spectrum(model, units, xunits).tabulation
+    return _scale_tabulation(tabulation, sun_range, solar_f)
+
+#===============================================================================
+def _scale_tabulation(tabulation, sun_range, solar_f):
+    """
+    A Tabulation of flux density at 1 AU, scaled to the given distance.
+
+    Args:
+        tabulation (Tabulation): The flux density at 1 AU.
+        sun_range (float or array-like): Distance from Sun to target in AU.
+        solar_f (bool): True to include the factor of 1/pi for solar F.
+
+    Returns:
+        Tabulation or np.ndarray: The scaled Tabulation, which is `tabulation`
+        itself if the factor is one, or an object array of them if `sun_range`
+        is an array.
+    """
+
+    factor = _scale_factor(sun_range, solar_f)
+
+    if np.ndim(factor):
+        result = np.empty(factor.shape, dtype=object)
+        for (index, value) in np.ndenumerate(factor):
+            result[index] = tabulation * float(value)
+        return result
+
+    if factor == 1.:
+        return tabulation
+
+    return tabulation * factor
+
+#===============================================================================
+def _scale_factor(sun_range, solar_f):
+    """
+    The factor that scales a flux density at 1 AU to the given distance.
+
+    Args:
+        sun_range (float or array-like): Distance from Sun to target in AU.
+        solar_f (bool): True to include the factor of 1/pi for solar F.
+
+    Returns:
+        float or np.ndarray: The scale factor, an array if `sun_range` is an
+        array.
+    """
+
+    factor = ((1./np.pi if solar_f else 1.) /
+              np.asarray(sun_range, dtype=np.float64)**2)
+    return factor if factor.ndim else float(factor)
+
+#===============================================================================
+def cache_info():
+    """
+    Report the statistics of the cache of unit-converted model spectra.
+
+    Returns:
+        CacheInfo: A named tuple (hits, misses, entries, currbytes, max_entries,
+        max_bytes).
+    """
+
+    return _SPECTRUM_CACHE.info()
+
+#===============================================================================
+def cache_clear():
+    """
+    Empty the cache of unit-converted model spectra and reset its statistics.
+    """
+
+    _SPECTRUM_CACHE.clear()
+
+#===============================================================================
+def configure_cache(max_bytes=CACHE_MAX_BYTES, max_entries=None):
+    """
+    Set the size limits of the cache of unit-converted model spectra.
+
+    The cache holds one spectrum at 1 AU per (model, units, xunits). When either
+    limit is exceeded, the least recently used spectra are evicted.
+
+    Args:
+        max_bytes (int, optional): The maximum total size of the cached spectra in
+            bytes; None for no limit.
+        max_entries (int, optional): The maximum number of cached spectra; None for
+            no limit.
+
+    Raises:
+        ValueError: If a limit is negative.
+    """
+
+    _SPECTRUM_CACHE.configure(max_bytes=max_bytes, max_entries=max_entries)
+
+#===============================================================================
+def configure_result_cache(enabled=True, *, path=None,
+                           max_entries=RESULT_CACHE_MAX_ENTRIES):
+    """
+    Enable or disable the persistent cache of bandpass results.
+
+    When enabled, each mean solar flux density computed by
+    `bandpass_flux_density` or `bandpass_f` for a named model is saved at 1 AU in
+    an SQLite database, keyed by a hash of the bandpass data, the model name and
+    a fingerprint of its data, the units of the flux and of the x-axis, and the
+    version of the integration algorithm. The distance and `solar_f` are not
+    part of the key; they are applied to the saved value. Later calls with the
+    same arguments, in any process, read the saved value instead. The database
+    is safe for concurrent use by many processes; when it holds more than
+    `max_entries` values, the least recently used ones are deleted.
+
+    The cache is disabled by default. It can also be enabled by setting the
+    environment variable RMS_SOLAR_RESULT_CACHE to the path of the database
+    before the package is imported, which enables it in worker processes too.
+
+    Args:
+        enabled (bool, optional): True to enable the cache, False to disable it.
+        path (str, optional): The path of the database file. By default, it is
+            "results.sqlite" in the cache directory.
+        max_entries (int, optional): The maximum number of cached values; None
+            for no limit.
+
+    Raises:
+        ValueError: If `max_entries` is negative, or if no path is given and the
+            cache directory is disabled.
+    """
+
+    global _RESULT_CACHE
+
+    if not enabled:
+        _RESULT_CACHE = None
+        return
+
+    if path is None:
+        directory = _data.cache_dir()
+        if directory is None:
+            raise ValueError('the cache directory is disabled; a path is required')
+        path = os.path.join(directory, 'results.sqlite')
+
+    _RESULT_CACHE = ResultCache(path, max_entries=max_entries)
+
+#===============================================================================
+def share_models(models=MODEL_NAMES):
+    """
+    Publish solar models in shared memory for use by child processes.
+
+    Each model is loaded in this process and its arrays are copied once into a
+    block of shared memory. Any child process started afterward, by fork,
+    spawn, or as a separate program that inherits the environment, attaches to
+    that block by name the first time it uses the model, instead of importing
+    and parsing the model's data. Its arrays are then read-only views of the
+    shared block, so each additional worker needs almost no memory for them.
+
+    The blocks belong to this process; they are removed by `unshare_models` or
+    when this process exits.
+
+    Args:
+        models (list or tuple, optional): Names of the models to publish; by
+            default, every model in this package.
+
+    Raises:
+        ValueError: If a model is undefined.
+    """
+
+    for model in models:
+        key = model.lower()
+        _shared.publish(key, _model_spectrum(key))
+
+#===============================================================================
+def register_model(name, model, *, units='W/m^2/um', xunits='um'):
+    """
+    Register a solar model from arrays in memory.
+
+    Once registered, the model's name can be used like that of any built-in
+    model, and the model is cached and converted to other units in the same way.
+
+    Args:
+        name (str): The name of the model; not case-sensitive.
+        model (Tabulation or tuple): The Tabulation of the solar flux density at
+            1 AU. Alternatively, a tuple of two arrays (x, flux), each of the
+            same size, with x increasing. Read-only arrays of float64, such as
+            memory-mapped ones, are used without being copied; other arrays are
+            copied, so later changes to them do not affect the model.
+        units (str, optional): Units of the flux.
+            Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
+            "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
+            or "uJy". "u" represents "mu" meaning micro.
+        xunits (str, optional): Units of the x-axis.
+            Options are: "um", "nm", "A", or "Hz". "u" represents "mu"
+            meaning micro.
+
+    Raises:
+        ValueError: If the name is already in use, the units are invalid, or the
+            arrays are invalid.
+    """
+
+    _check_units(units, xunits)
+
+    if isinstance(model, tab.Tabulation):
+        model = (model.x, model.y)
+
+    arrays = []
+    for array in model:
+        array = np.asarray(array)
+        if array.dtype != np.float64 or array.flags.writeable:
+            array = np.array(array, dtype=np.float64)
+            array.flags.writeable = False
+        arrays.append(array)
+
+    (x, y) = arrays
+    if (x.ndim != 1 or x.shape != y.shape or x.size < 2
+            or np.any(x[1:] <= x[:-1])):
+        raise ValueError(f'invalid arrays for solar model {name}: x and flux must '
+                         'be 1-D arrays of the same size, with x increasing')
+
+    spectrum = Spectrum(x, y, units=units, xunits=xunits)
+    _MODELS.register(name.lower(), lambda key: spectrum,
+                     recipe=(register_model, (name, (x, y)),
+                             {'units': units, 'xunits': xunits}))
+
+#===============================================================================
+def register_composite_model(name, models, splices, *, blends=0., xunits='um',
+                             persist=False):
+    """
+    Register a model spliced together from other models.
+
+    The composite follows the first model up to the first splice wavelength, the
+    second model from there up to the next splice wavelength, and so on. At each
+    splice, the composite can instead fade linearly from one model to the next
+    across a blended region centered on the splice wavelength.
+
+    The composite is in the native units of its first model; the other models
+    are converted to those units. It is built on first use and kept in memory,
+    where its unblended parts are views of the arrays of the models it is made
+    of. Once registered, its name can be used like that of any built-in model,
+    and it is cached and converted to other units in the same way.
+
+    Args:
+        name (str): The name of the composite model; not case-sensitive.
+        models (list or tuple): Names of the models to splice, in order of
+            increasing wavelength; built-in or previously registered models.
+        splices (list or tuple): The wavelengths at which each model gives way
+            to the next, one fewer than the models, in increasing order. A
+            splice wavelength of None is the end of the previous model.
+        blends (float, list, or tuple, optional): The width of the blended region
+            at each splice wavelength, or one width for all of them; zero for an
+            abrupt splice.
+        xunits (str, optional): Units of the splice wavelengths and blend widths.
+            Options are: "um", "nm", or "A". "u" represents "mu" meaning micro.
+        persist (bool, optional): True to save the merged arrays in the cache
+            directory, from which they are memory-mapped by later processes.
+
+    Raises:
+        ValueError: If the name is already in use, a model is undefined, the
+            units are invalid, or the numbers of splices and blend widths are
+            inconsistent with the number of models.
+
+    Note:
+        Registering an identical definition again does nothing. Invalid splice
+        points or blended regions, and a first model whose x-axis is not
+        wavelength, are reported when the model is first used.
+    """
+
+    if xunits not in XUNIT_DICT or not XUNIT_DICT[xunits][1]:
+        valid_xunits = ', '.join(key for (key, value) in XUNIT_DICT.items()
+                                 if value[1])
+        raise ValueError(f'invalid units: {xunits} (valid units are: '
+                         f'{valid_xunits})')
+
+    models = tuple(model.lower() for model in models)
+    splices = tuple(splices)
+    if np.ndim(blends) == 0:
+        blends = (float(blends),) * len(splices)
+    blends = tuple(float(blend) for blend in blends)
+    if not models or len(splices) != len(models) - 1 or len(blends) != len(splices):
+        raise ValueError(f'{len(models)} models require {len(models) - 1} splice '
+                         f'wavelengths and blend widths')
+
+    # Components must already exist, so a composite can never include itself
+    for model in models:
+        if model not in _MODELS:
+            raise ValueError(f'undefined solar model: {model}')
+
+    definition = (models, splices, blends, xunits, bool(persist))
+    _MODELS.register(name.lower(), lambda key: _load_composite(key, *definition),
+                     definition,
+                     recipe=(register_composite_model, (name, models, splices),
+                             {'blends': blends, 'xunits': xunits,
+                              'persist': bool(persist)}))
+
+#===============================================================================
+def registered_models():
+    """
+    The names of the solar models.
+
+    Returns:
+        list: The names of the built-in models, the models registered by
+        `register_model` and `register_composite_model`, and the models provided
+        by other installed packages.
+    """
+
+    return _MODELS.names()
+
+#===============================================================================
+def unshare_models():
+    """
+    Remove the shared memory blocks published by `share_models`.
+
+    Processes that are already attached keep their data; processes started
+    afterward load the models from their files.
+    """
+
+    _shared.release()
+
+#===============================================================================
+def _unit_spectrum(model, units, xunits):
+    """
+    The cached flux density of a solar model at 1 AU in the specified units.
+
+    Args:
+        model (str): Name of the model.
+        units (str): Units for the flux.
+        xunits (str): Units for the x-axis.
+
+    Returns:
+        Spectrum: The model solar flux density in the specified units.
+    """
+
+    return _SPECTRUM_CACHE.get((model.lower(), units, xunits),
+                               lambda: _convert_flux_density(model, units,
+                                                             xunits))
+
+#===============================================================================
+def flux_density_array(model='STIS_Rieke', *, units='W/m^2/um', xunits='um',
+                       sun_range=1., solar_f=False, out=None):
+    """
+    Compute the flux density of a solar model as a pair of arrays.
+
+    This returns the same samples as `flux_density`, but without constructing a
+    Tabulation. The x grid for each choice of `xunits` and the Jacobian of each
+    wavelength/frequency conversion are computed once per model and cached, so
+    a call is a single multiply into the output buffer.
+
+    Args:
+        model (str, optional): Name of the model.
+        units (str, optional): Units for the flux.
+            Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
+            "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
+            or "uJy". "u" represents "mu" meaning micro.
+        xunits (str, optional): Units for the x-axis.
+            Options are: "um", "nm", "A", or "Hz". "u" represents "mu"
+            meaning micro.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU.
+        solar_f (bool, optional): True to divide by pi, providing solar F
+            instead of solar flux density.
+        out (np.ndarray, optional): An array of float64 into which to write the
+            flux density, of shape (N,) or, if `sun_range` is an array,
+            `sun_range.shape + (N,)`, where N is the number of samples in the
+            model.
+
+    Returns:
+        tuple: A tuple (x, y). x is the read-only, cached, contiguous 1-D array
+        of x-coordinates in units of `xunits`, always in increasing order. y is
+        the array of flux density in units of `units`, in the same order, with
+        one row per distance if `sun_range` is an array; it is `out` if that was
+        provided.
+
+    Note:
+        Frequency decreases as wavelength increases, so when converting between
+        wavelength and frequency the model's samples are read in reverse order.
+        The reversal uses views of the model arrays; no reordered copies are
+        made.
+
+    Raises:
+        ValueError: If the model or units are invalid, or if `out` has the wrong
+            shape.
+    """
+
+    spectrum = _model_spectrum(model)
+    _check_units(units, xunits)
+    return _convert_arrays(spectrum, units, xunits,
+                           _scale_factor(sun_range, solar_f), out)
+
+#===============================================================================
+def _convert_arrays(spectrum, units, xunits, scale=1., out=None):
+    """
+    Convert a spectrum to the specified units, as a pair of arrays.
+
+    Args:
+        spectrum (Spectrum): The spectrum, with attributes `units` and `xunits`.
+        units (str): Units for the flux.
+        xunits (str): Units for the x-axis.
+        scale (float or np.ndarray, optional): An additional factor to apply; if
+            an array, the result has one row per element.
+        out (np.ndarray, optional): An array of float64 into which to write the
+            flux density.
+
+    Returns:
+        tuple: A tuple (x, y), as returned by `flux_density_array`.
+
+    Raises:
+        ValueError: If `out` has the wrong shape.
+    """
+
+    (x, y, jacobian, factor) = _conversion(spectrum, units, xunits)
+
+    factor = factor * scale
+    if np.ndim(factor):
+        factor = factor[..., np.newaxis]
+
+    shape = np.shape(factor)[:-1] + x.shape
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(f'output array has shape {out.shape}; '
+                         f'expected {shape}')
+
+    if jacobian is None:
+        np.multiply(y, factor, out=out)
+    else:
+        np.multiply(y, jacobian, out=out)
+        out *= factor
+
+    return (x, out)
+
+#===============================================================================
+def sample_flux_density(x, model='STIS_Rieke', *, units='W/m^2/um', xunits='um',
+                        sun_range=1., solar_f=False, out=None,
+                        chunk_size=SAMPLE_CHUNK_SIZE):
+    """
+    Evaluate the flux density of a solar model at arbitrary x-coordinates.
+
+    The values are those of `flux_density(...)(x)`, but they are interpolated
+    directly on the cached model grid without constructing any Tabulations. The
+    input is processed in chunks, so temporary memory stays bounded however
+    large `x` is; `x` may be a memory-mapped array.
+
+    Args:
+        x (array-like): The wavelengths or frequencies at which to evaluate the
+            model, in units of `xunits`.
+        model (str, optional): Name of the model.
+        units (str, optional): Units for the flux.
+            Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
+            "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
+            or "uJy". "u" represents "mu" meaning micro.
+        xunits (str, optional): Units for the x-axis.
+            Options are: "um", "nm", "A", or "Hz". "u" represents "mu"
+            meaning micro.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU. An array must be broadcastable to the shape of `x`.
+        solar_f (bool, optional): True to divide by pi, providing solar F
+            instead of solar flux density.
+        out (np.ndarray, optional): A contiguous array of float64, with the same
+            shape as `x`, into which to write the result.
+        chunk_size (int, optional): The number of points to process at a time.
+
+    Returns:
+        float or np.ndarray: The flux density at each x-coordinate; zero outside
+        the domain of the model. This is `out` if that was provided.
+
+    Raises:
+        ValueError: If the model or units are invalid, or if `out` has the wrong
+            shape.
+    """
+
+    spectrum = _unit_spectrum(model, units, xunits)
+    factor = _scale_factor(sun_range, solar_f)
+
+    x = np.asarray(x)
+    if out is None:
+        out = np.empty(x.shape)
+    elif out.shape != x.shape or not out.flags.c_contiguous:
+        raise ValueError(f'output array must be contiguous with shape {x.shape}')
+
+    # The iterator walks x, the broadcasted factor, and out together in blocks of
+    # at most chunk_size elements, buffering any block that is not contiguous, so
+    # neither the factor nor a contiguous copy of x is ever made in full
+    iterator = np.nditer([x, factor, out],
+                         flags=['external_loop', 'buffered', 'zerosize_ok'],
+                         op_flags=[['readonly'], ['readonly'], ['writeonly']],
+                         op_dtypes=[np.float64, np.float64, np.float64],
+                         buffersize=max(int(chunk_size), 1), order='C')
+    with iterator:
+        for (x_chunk, factor_chunk, out_chunk) in iterator:
+            spectrum.evaluate(x_chunk, out=out_chunk)
+            out_chunk *= factor_chunk
+
+    return out if out.ndim else float(out)
+
+#===============================================================================
+def iter_flux_density(chunks, model='STIS_Rieke', *, units='W/m^2/um',
+                      xunits='um', sun_range=1., solar_f=False,
+                      chunk_size=SAMPLE_CHUNK_SIZE):
+    """
+    Evaluate the flux density of a solar model over a stream of x-coordinates.
+
+    This is a generator that consumes the x-coordinates one chunk at a time and
+    yields the flux density for each chunk, so memory stays bounded however many
+    values there are. The model is resolved once; each chunk is then located
+    in the model grid through the model's cached lookup index, and evaluated
+    with its cached slopes, in a purely vectorized pass. A sorted chunk is
+    evaluated by np.interp instead, which is faster for sorted input. The
+    values are those of `sample_flux_density`.
+
+    Args:
+        chunks (np.ndarray or iterable): The wavelengths or frequencies at which
+            to evaluate the model, in units of `xunits`. If this is an array,
+            such as a memory-mapped array, it is consumed in blocks along its
+            first axis, each of about `chunk_size` values, or in slices of
+            `chunk_size` values if it is 1-D. Otherwise, it is an iterable of
+            array-like chunks, each of which is evaluated in turn.
+        model (str, optional): Name of the model.
+        units (str, optional): Units for the flux.
+            Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
+            "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
+            or "uJy". "u" represents "mu" meaning micro.
+        xunits (str, optional): Units for the x-axis.
+            Options are: "um", "nm", "A", or "Hz". "u" represents "mu"
+            meaning micro.
+        sun_range (float, optional): Distance from Sun to target in AU; a single
+            value for every chunk.
+        solar_f (bool, optional): True to divide by pi, providing solar F
+            instead of solar flux density.
+        chunk_size (int, optional): The approximate number of values per chunk
+            when `chunks` is an array.
+
+    Yields:
+        np.ndarray: The flux density for each chunk, with the shape of the chunk;
+        zero outside the domain of the model.
+
+    Raises:
+        ValueError: If the model or units are invalid, or `sun_range` is not a
+            scalar.
+    """
+
+    if np.ndim(sun_range):
+        raise ValueError('sun_range must be a scalar; use sample_flux_density to '
+                         'evaluate at a distance for each x-coordinate')
+
+    spectrum = _unit_spectrum(model, units, xunits)
+    factor = _scale_factor(sun_range, solar_f)
+
+    if isinstance(chunks, np.ndarray):
+        chunks = _array_chunks(chunks, max(int(chunk_size), 1))
+
+    for chunk in chunks:
+        values = spectrum.evaluate(np.asarray(chunk, dtype=np.float64))
+        values *= factor
+        yield values
+
+#===============================================================================
+def _array_chunks(array, chunk_size):
+    """
+    Iterate over an array in blocks along its first axis.
+
+    Args:
+        array (np.ndarray): The array.
+        chunk_size (int): The approximate number of values per block; every
+            block has at least one element of the first axis.
+
+    Yields:
+        np.ndarray: Each block, a view of the array.
+    """
+
+    if array.ndim == 0:
+        yield array
+        return
+
+    rows = max(chunk_size // max(array[:1].size, 1), 1)
+    for start in range(0, array.shape[0], rows):
+        yield array[start:start + rows]
+
+#===============================================================================
+def convolved_flux_density(model='STIS_Rieke', *, resolution=None, lsf=None,
+                           units='W/m^2/um', xunits='um', sun_range=1.,
+                           solar_f=False):
+    """
+    Compute the flux density of a solar model degraded to a spectral resolution.
+
+    The model is smoothed by a line-spread function (LSF) of constant resolving
+    power, either a Gaussian of given resolving power R or a tabulated profile.
+    It is resampled, conserving flux, onto a grid uniform in ln(wavelength), on
+    which the LSF is a fixed kernel, and convolved by FFT. The smoothed model is
+    cached per model and LSF in its native units, and then converted to the
+    requested units like any other model, so repeated calls are cheap.
+
+    Args:
+        model (str, optional): Name of the model.
+        resolution (float, optional): The resolving power R = lambda / FWHM of a
+            Gaussian LSF.
+        lsf (Tabulation or tuple, optional): A tabulated LSF, as a function of
+            the fractional offset in wavelength, d(lambda)/lambda, which is the
+            offset in ln(lambda). Alternatively, a tuple of two arrays (offset,
+            response), each of the same size. The normalization is irrelevant.
+            Exactly one of `resolution` and `lsf` must be given.
+        units (str, optional): Units for the flux.
+            Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
+            "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
+            or "uJy". "u" represents "mu" meaning micro.
+        xunits (str, optional): Units for the x-axis.
+            Options are: "um", "nm", "A", or "Hz". "u" represents "mu"
+            meaning micro.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU.
+        solar_f (bool, optional): True to divide by pi, providing solar F
+            instead of solar flux density.
+
+    Returns:
+        Tabulation or np.ndarray: The smoothed solar flux density in the
+        specified units. If `sun_range` is an array, this is an object array of
+        the same shape, containing one Tabulation per distance.
+
+    Raises:
+        ValueError: If the model or units are invalid, if neither or both of
+            `resolution` and `lsf` are given, or if the resolving power is not
+            positive.
+
+    Note:
+        The smoothing is performed on the model in its native units, i.e., on
+        the flux per unit wavelength for every model except Colina.
+    """
+
+    if (resolution is None) == (lsf is None):
+        raise ValueError('exactly one of resolution and lsf must be given')
+
+    _check_units(units, xunits)
+
+    if lsf is None:
+        sigma = _convolve.gaussian_sigma(resolution)
+        lsf_key = ('R', float(resolution))
+    else:
+        if not isinstance(lsf, tab.Tabulation):
+            lsf = tab.Tabulation(*lsf)
+        sigma = None
+        lsf_key = ('lsf', hashlib.sha1(lsf.x.tobytes() + lsf.y.tobytes())
+                   .hexdigest())
+
+    # Cache the smoothed model in its native units and in the requested units
+    native = _SPECTRUM_CACHE.get(
+        (model.lower(), None, None, lsf_key),
+        lambda: _convolve.convolve(_model_spectrum(model), sigma=sigma, lsf=lsf))
+    spectrum = _SPECTRUM_CACHE.get(
+        (model.lower(), units, xunits, lsf_key),
+        lambda: _convert_spectrum(native, units, xunits))
+
+    return _scale_tabulation(spectrum.tabulation, sun_range, solar_f)
+
+#===============================================================================
+def resampled_flux_density(model='STIS_Rieke', *, step, log=False, xmin=None,
+                           xmax=None, units='W/m^2/um', xunits='um',
+                           sun_range=1., solar_f=False):
+    """
+    Compute the flux density of a solar model on a regular grid.
+
+    Each value is the mean of the model over one cell of the grid, so the
+    resampling conserves flux. The grid points are the integer multiples of
+    `step` in x (or in ln(x) if `log` is True), so every model resampled with the
+    same step and units shares the same grid wherever they overlap; only cells
+    entirely within the domain of the model are included. The full grid for
+    each model, units, and step is computed once and cached, in memory and as a
+    .npy file in the cache directory, where it is identified by a fingerprint of
+    the model data.
+
+    On such a grid, the integral over a bandpass is a dot product. If `t` is the
+    throughput sampled on the same grid and `y` is the resampled flux density,
+    the mean flux density over the bandpass is `np.dot(y, t) / np.sum(t)` for a
+    linear grid, or `np.dot(y, t * x) / np.dot(t, x)` for a log grid, whose
+    cell widths are proportional to x.
+
+    Args:
+        model (str, optional): Name of the model.
+        step (float): The spacing of the grid, in units of `xunits` or, if `log`
+            is True, in ln(x).
+        log (bool, optional): True for a grid uniform in ln(x).
+        xmin (float, optional): The smallest grid point to return, in units of
+            `xunits`; by default, the grid starts at the start of the model.
+        xmax (float, optional): The largest grid point to return, in units of
+            `xunits`; by default, the grid ends at the end of the model.
+        units (str, optional): Units for the flux.
+            Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
+            "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
+            or "uJy". "u" represents "mu" meaning micro.
+        xunits (str, optional): Units for the x-axis.
+            Options are: "um", "nm", "A", or "Hz". "u" represents "mu"
+            meaning micro.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU.
+        solar_f (bool, optional): True to divide by pi, providing solar F
+            instead of solar flux density.
+
+    Returns:
+        Tabulation or np.ndarray: The resampled solar flux density in the
+        specified units. If `sun_range` is an array, this is an object array of
+        the same shape, containing one Tabulation per distance.
+
+    Raises:
+        ValueError: If the model or units are invalid, if the step is not
+            positive, or if fewer than two grid points remain.
+    """
+
+    _check_units(units, xunits)
+    if not step > 0.:
+        raise ValueError(f'invalid grid step: {step}')
+
+    step = float(step)
+    key = (model.lower(), units, xunits, ('log' if log else 'linear', step))
+    spectrum = _SPECTRUM_CACHE.get(key, lambda: _resample(model, units, xunits,
+                                                          step, log))
+
+    if xmin is None and xmax is None:
+        tabulation = spectrum.tabulation
+    else:
+        # Allow for round-off in grid points that equal the limits nominally
+        start = (0 if xmin is None
+                 else np.searchsorted(spectrum.x, xmin * (1. - 1e-12), 'left'))
+        stop = (spectrum.x.size if xmax is None
+                else np.searchsorted(spectrum.x, xmax * (1. + 1e-12), 'right'))
+        if stop - start < 2:
+            raise ValueError('fewer than two grid points between '
+                             f'{xmin} and {xmax}')
+        tabulation = tab.Tabulation(spectrum.x[start:stop],
+                                    spectrum.y[start:stop])
+
+    return _scale_tabulation(tabulation, sun_range, solar_f)
+
+#===============================================================================
+def _resample(model, units, xunits, step, log):
+    """
+    The flux density of a solar model at 1 AU, averaged over a regular grid.
+
+    Args:
+        model (str): Name of the model.
+        units (str): Units for the flux.
+        xunits (str): Units for the x-axis.
+        step (float): The spacing of the grid, in x or in ln(x).
+        log (bool): True for a grid uniform in ln(x).
+
+    Returns:
+        Spectrum: The resampled flux density, with read-only arrays.
+    """
+
+    spectrum = _unit_spectrum(model, units, xunits)
+    limits = np.array([spectrum.x[0], spectrum.x[-1]])
+    if log:
+        limits = np.log(limits)
+
+    # Grid points whose cells lie entirely within the domain
+    first = int(np.ceil(limits[0] / step + 0.5))
+    last = int(np.floor(limits[1] / step - 0.5))
+    if last <= first:
+        raise ValueError(f'grid step is too large for model {model}: {step}')
+
+    def build():
+        u = step * np.arange(first, last + 1)
+        (lo, hi) = (u - 0.5 * step, u + 0.5 * step)
+        if log:
+            (u, lo, hi) = (np.exp(u), np.exp(lo), np.exp(hi))
+        return np.vstack([u, spectrum.boxcar_means(lo, hi)])
+
+    kind = 'log' if log else 'linear'
+    name = (f'{model.lower()}.{units}.{xunits}.{kind}-{step!r}.'
+            f'{spectrum.fingerprint[:16]}.v{INTEGRATION_VERSION}.npy'
+            ).replace('/', '_')
+    array = _data.load_derived(name, build)
+    array.flags.writeable = False
+    return Spectrum(array[0], array[1], units=units, xunits=xunits)
+
+#===============================================================================
+def _model_spectrum(model):
+    """
+    The flux density of a solar model in its native units.
+
+    The model is loaded on first use and kept for the life of the process,
+    together with its unit-conversion kernels. This is thread-safe: concurrent
+    first requests for a model wait for a single load, and later requests read
+    the stored spectrum without taking a lock.
+
+    Args:
+        model (str): Name of the model.
+
+    Returns:
+        Spectrum: The model's native spectrum, with attributes `units` and
+        `xunits`.
+
+    Raises:
+        ValueError: If the model is undefined.
+    """
+
+    return _MODEL_STORE.get(model.lower())
+
+#===============================================================================
+def _load_model(key):
+    """
+    Load the flux density of a solar model in its native units.
+
+    Args:
+        key (str): Name of the model, in lower case.
+
+    Returns:
+        Spectrum: The model's native spectrum, with read-only arrays.
+
+    Raises:
+        ValueError: If the model is undefined.
+    """
+
+    # A model published in shared memory by a parent process is attached
+    spectrum = _shared.attach(key)
+    if spectrum is not None:
+        return spectrum
+
+    return _MODELS.load(key)
+
+#===============================================================================
+def _import_model(key):
+    """
+    Load a built-in solar model from its module.
+
+    Args:
+        key (str): Name of the model, in lower case.
+
+    Returns:
+        Spectrum: The model's native spectrum, with read-only arrays.
+    """
+
+    # Each built-in model is defined by the Python file solar/<name>.py,
+    # referenced as "solar.<name>" here. Note that modules are imported only if
+    # requested, not by default.
+    return _module_spectrum(importlib.import_module(f'solar.{key}'))
+
+#===============================================================================
+def _module_spectrum(module):
+    """
+    The spectrum of a solar model defined by a module.
+
+    The module defines WAVELENGTH and FLUX, the arrays of the model; or
+    FLUX_DENSITY, a Tabulation; or COMPONENTS and SPLICES, the models and splice
+    points of a composite model; together with UNITS and XUNITS. WAVELENGTH and
+    FLUX are used directly, so arrays memory-mapped from a file are shared by
+    every process that uses the model.
+
+    Args:
+        module (module or object): The module, or another object with the same
+            attributes.
+
+    Returns:
+        Spectrum: The model's native spectrum, with read-only arrays.
+    """
+
+    # A composite model is spliced from views of the models it is made of
+    if hasattr(module, 'COMPONENTS'):
+        return _splice_models(module.COMPONENTS, module.SPLICES)
+
+    # The arrays are shared by every thread, so no caller may modify them
+    if hasattr(module, 'WAVELENGTH') and hasattr(module, 'FLUX'):
+        spectrum = Spectrum(module.WAVELENGTH, module.FLUX, units=module.UNITS,
+                            xunits=module.XUNITS)
+    else:
+        spectrum = Spectrum.from_tabulation(module.FLUX_DENSITY, module.UNITS,
+                                            module.XUNITS)
+    spectrum.x.flags.writeable = False
+    spectrum.y.flags.writeable = False
+    return spectrum
+
+#===============================================================================
+def _check_units(units, xunits):
+    """
+    Raise ValueError if the units for the flux or the x-axis are invalid.
+
+    Args:
+        units (str): Units for the flux.
+        xunits (str): Units for the x-axis.
+    """
+
+    if units not in UNIT_DICT:
+        valid_units = ', '.join(UNIT_DICT.keys())
+        raise ValueError(f'invalid units: {units} (valid units are: '
+                         f'{valid_units})')
+
+    if xunits not in XUNIT_DICT:
+        valid_xunits = ', '.join(XUNIT_DICT.keys())
+        raise ValueError(f'invalid units: {xunits} (valid units are: '
+                         f'{valid_xunits})')
+
+#===============================================================================
+def _load_composite(key, models, splices, blends, xunits, persist):
+    """
+    Build a composite model registered by `register_composite_model`.
+
+    Args:
+        key (str): Name of the model, in lower case.
+        models (tuple): Names of the models to splice.
+        splices (tuple): The splice wavelengths.
+        blends (tuple): The widths of the blended regions.
+        xunits (str): Units of the splice wavelengths and blend widths.
+        persist (bool): True to memory-map the merged arrays from the cache
+            directory, saving them there first if necessary.
+
+    Returns:
+        Spectrum: The composite model's native spectrum.
+
+    Raises:
+        ValueError: If the splice points or blended regions are invalid.
+    """
+
+    spectrum = _splice_models(models, splices, blends, xunits)
+    if not persist:
+        return spectrum
+
+    name = f'composite.{key}.{spectrum.fingerprint[:16]}.npy'
+    array = _data.load_derived(name, lambda: np.vstack([spectrum.x, spectrum.y]))
+    array.flags.writeable = False
+    return Spectrum(array[0], array[1], units=spectrum.units,
+                    xunits=spectrum.xunits)
+
+#===============================================================================
+def _splice_models(models, splices, blends=None, xunits=None):
+    """
+    A composite spectrum spliced from the native spectra of other models.
+
+    The composite is in the units of the first model. Segments of models in the
+    same units are views of those models' arrays, which are shared with every
+    other use of the models; other models are converted first.
+
+    Args:
+        models (list): Names of the models, in order of increasing wavelength.
+        splices (list): The wavelengths at which each model gives way to the
+            next; None for the end of the previous model.
+        blends (list, optional): The widths of the blended regions at the splice
+            wavelengths; by default, every splice is abrupt.
+        xunits (str, optional): Units of the splice wavelengths and blend widths;
+            by default, the x units of the first model.
+
+    Returns:
+        CompositeSpectrum: The spliced spectrum.
+
+    Raises:
+        ValueError: If a model is undefined, the first model's x-axis is not
+            wavelength, or the splice points are invalid.
+    """
+
+    # Splices in a frequency would also reverse the order of the models
+    first = _model_spectrum(models[0])
+    if not XUNIT_DICT[first.xunits][1]:
+        raise ValueError(f'the first model of a composite must be tabulated in '
+                         f'wavelength; {models[0]} is in {first.xunits}')
+
+    spectra = [first] + [_convert_spectrum(_model_spectrum(model), first.units,
+                                           first.xunits)
+                         for model in models[1:]]
+
+    # Splice wavelengths and widths in the x units of the first model
+    if xunits is not None and xunits != first.xunits:
+        scale = XUNIT_DICT[first.xunits][0] / XUNIT_DICT[xunits][0]
+        splices = [None if splice_x is None else splice_x * scale
+                   for splice_x in splices]
+        if blends is not None:
+            blends = [blend * scale for blend in blends]
+
+    return _composite.splice(spectra, splices, blends, units=first.units,
+                             xunits=first.xunits)
+
+#===============================================================================
+def _conversion(spectrum, units, xunits):
+    """
+    The cached kernels that convert a model spectrum to the specified units.
+
+    Args:
+        spectrum (Spectrum): The model spectrum in its native units.
+        units (str): Units for the flux.
+        xunits (str): Units for the x-axis.
+
+    Returns:
+        tuple: A tuple (x, y, jacobian, factor). x is the array of
+        x-coordinates in units of `xunits`, in increasing order. y is the model's
+        array of flux density in the same order, possibly a reversed view. The
+        flux density in units of `units` is y times `jacobian` times `factor`,
+        where `jacobian` is an array in the same order, or None if the
+        conversion is only a scale factor, and `factor` is a float.
+    """
+
+    # Gather unit info
+    (scale, per_wavelength) = UNIT_DICT[units]
+    (xscale, x_is_wavelength) = XUNIT_DICT[xunits]
+
+    (model_scale, model_per_wavelength) = UNIT_DICT[spectrum.units]
+    (model_xscale, model_x_is_wavelength) = XUNIT_DICT[spectrum.xunits]
+
+    # The new x-values. Converting between wavelength and frequency reverses
+    # the order of the samples, so the new grid is computed from the reversed
+    # model grid and the y-values and Jacobian are read through reversed views.
+    if xunits == spectrum.xunits:
+        x = spectrum.x
+        order = slice(None)
+    elif x_is_wavelength == model_x_is_wavelength:
+        x = spectrum.kernel(('x', xunits),
+                            lambda: (xscale / model_xscale) * spectrum.x)
+        order = slice(None)
+    else:
+        x = spectrum.kernel(('x', xunits),
+                            lambda: (xscale * model_xscale * C_IN_UM_HZ) /
+                            spectrum.x[::-1])
+        order = slice(None, None, -1)
+
+    y = spectrum.y[order]
+
+    # The factor and Jacobian for the new y-values
+    factor = scale/model_scale
+
+    if per_wavelength == model_per_wavelength:
+        return (x, y, None, factor)
+
+    # w = wavelength in microns
+    # f = frequency in Hz
+    #
+    # We must satisfy:
+    #   flux_w dw = flux_f df
+    # so
+    #   flux_w = flux_f |df/dw|
+    # or
+    #   flux_f = flux_w |dw/df|
+    #
+    # We have
+    #   f = C/w
+    # so
+    #   |df/dw| = C/w^2 = f^2/C
+    # or
+    #   |dw/df| = C/f^2 = w^2/C
+    #
+    # If we need df/dw and the model is tabulated in wavelength, or we need
+    # dw/df and the model is tabulated in frequency, the Jacobian is 1/x^2;
+    # otherwise it is x^2. The constants go into the factor.
 
-# Converts from W/m^2 to erg/s/cm^2
-TO_CGS = 1.e7 / 1.e4
+    if per_wavelength == model_x_is_wavelength:
+        jacobian = spectrum.kernel('1/x^2', lambda: 1. / spectrum.x**2)
+        factor *= C_IN_UM_HZ * model_xscale**2
+    else:
+        jacobian = spectrum.kernel('x^2', lambda: spectrum.x**2)
+        factor /= C_IN_UM_HZ * model_xscale**2
 
-# Converts from flux per micron to flux per Angstrom
-TO_PER_ANGSTROM = 1.e-4
+    return (x, y, jacobian[order], factor)
 
-# Converts from flux per micron to flux per nanometer
-TO_PER_NM = 1.e-3
+#===============================================================================
+def _convert_flux_density(model, units, xunits):
+    """
+    The flux density of a solar model at 1 AU in the specified units.
 
-# First UNIT_DICT item is conversion factor from W/m^2/um or from W/m^2/Hz.
-# Second item is True if the units are per wavelength, False if per frequency.
-UNIT_DICT = {
-    'W/m^2/um'     : (1.   , True),     # default units
-    'W/m^2/nm'     : (1.e-3, True),
-    'W/m^2/A'      : (1.e-4, True),
-    'erg/s/cm^2/um': (1.e+3, True),
-    'erg/s/cm^2/nm': (1.   , True),
-    'erg/s/cm^2/A' : (1.e-1, True),
+    Args:
+        model (str): Name of the model.
+        units (str): Units for the flux.
+        xunits (str): Units for the x-axis.
 
-    'W/m^2/Hz'     : (1.   , False),
-    'erg/s/cm^2/Hz': (1.e+3, False),
-    'Jy'           : (1.e26, False),
-    'uJy'          : (1.e32, False),
-}
+    Returns:
+        Spectrum: The model solar flux density in the specified units.
+    """
 
-# First XUNIT_DICT item is conversion factor from um or from Hz.
-# Second item is True if the units are wavelength, False if frequency.
-XUNIT_DICT = {
-    'um': (1.  , True),
-    'nm': (1.e3, True),
-    'A' : (1.e4, True),
-    'Hz': (1.  , False),
-}
+    spectrum = _model_spectrum(model)
+    _check_units(units, xunits)
+    return _convert_spectrum(spectrum, units, xunits)
+
+#===============================================================================
+def _convert_spectrum(spectrum, units, xunits):
+    """
+    A spectrum converted to the specified units.
+
+    Args:
+        spectrum (Spectrum): The spectrum, with attributes `units` and `xunits`.
+        units (str): Units for the flux.
+        xunits (str): Units for the x-axis.
+
+    Returns:
+        Spectrum: The spectrum in the specified units; `spectrum` itself if it
+        already has them.
+    """
+
+    # If we have the desired units, return
+    if units == spectrum.units and xunits == spectrum.xunits:
+        return spectrum
+
+    # A composite is converted one segment at a time, straight into the new
+    # arrays, so that its own arrays are never concatenated
+    if isinstance(spectrum, _composite.CompositeSpectrum):
+        return _convert_composite(spectrum, units, xunits)
 
+    # The arrays are already in increasing order, so the Tabulation is built
+    # only if it is requested
+    (x, y) = _convert_arrays(spectrum, units, xunits)
+    y.flags.writeable = False
+    return Spectrum(x, y, units=units, xunits=xunits)
 
 #===============================================================================
-@functools.lru_cache(maxsize=4)
-def flux_density(model='STIS_Rieke', *, units='W/m^2/um', xunits='um',
-                 sun_range=1., solar_f=False):
+def _convert_composite(spectrum, units, xunits):
     """
-    Compute the flux density of a solar model in the specified units.
+    A composite spectrum converted to the specified units.
 
     Args:
-        model (str, optional): Name of the model.
+        spectrum (CompositeSpectrum): The spectrum, with attributes `units` and
+            `xunits`.
+        units (str): Units for the flux.
+        xunits (str): Units for the x-axis.
+
+    Returns:
+        Spectrum: The spectrum in the specified units, in new arrays.
+    """
+
+    pieces = spectrum.segment_arrays()
+
+    # Converting between wavelength and frequency reverses the order
+    if XUNIT_DICT[xunits][1] != XUNIT_DICT[spectrum.xunits][1]:
+        pieces.reverse()
+
+    x = np.empty(spectrum.size)
+    y = np.empty(spectrum.size)
+    start = 0
+    for (piece_x, piece_y) in pieces:
+        stop = start + piece_x.size
+        piece = Spectrum(piece_x, piece_y, units=spectrum.units,
+                         xunits=spectrum.xunits)
+        (x[start:stop], _) = _convert_arrays(piece, units, xunits,
+                                             out=y[start:stop])
+        start = stop
+
+    x.flags.writeable = False
+    y.flags.writeable = False
+    return Spectrum(x, y, units=units, xunits=xunits)
+
+#===============================================================================
+def bandpass_flux_density(bandpass, model='STIS_Rieke', *, units='W/m^2/um',
+                          xunits='um', sun_range=1., solar_f=False, validate=True):
+    """
+    Compute the average solar flux density over a filter bandpass.
+
+    Args:
+        bandpass (Tabulation, tuple, or str): The Tabulation of the filter
+            bandpass, with wavelength in units specified by `xunits` (if `model`
+            is a string) or in the same units as `model` (if `model` is a
+            Tabulation). Alternatively, a tuple of two arrays (wavelength,
+            fraction), each of the same size, or the name of a bandpass
+            registered with `register_bandpass`, which is in its own units.
+        model (str, Tabulation, or tuple, optional): Name of the model.
+            Alternatively, a Tabulation of the solar flux density, already in the
+            desired units, or a tuple of two arrays (wavelength, flux), each of
+            the same size.
         units (str, optional): Units for the flux.
             Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
             "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
-            or "uJy". "u" represents "mu" meaning micro.
+            or "uJy". "u" represents "mu" meaning micro. Ignored if `model` is a
+            Tabulation or tuple.
         xunits (str, optional): Units for the x-axis.
-            Options are: "um", "nm", "A", or "Hz". "u" represents "mu"
-            meaning micro.
-        sun_range (float, optional): Distance from Sun to target in AU.
+            Options are: "um", "nm", "A", or "Hz". "u" represents "mu" meaning
+            micro. Ignored if `model` is a Tabulation or tuple, or `bandpass`
+            is a name.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU.
         solar_f (bool, optional): True to divide by pi, providing solar F
             instead of solar flux density.
+        validate (bool, optional): False to skip the checks of a bandpass or
+            model given as arrays, which are then used directly, and to keep the
+            lookup tables built for a model given as a Tabulation or tuple for
+            later calls with the same objects. The caller must then ensure that
+            the arrays are valid and are never modified.
 
     Returns:
-        Tabulation: The model solar flux density in the specified units.
+        float or np.ndarray: The mean solar flux density or solar F within the
+        filter bandpass; an array of the same shape as `sun_range` if it is an
+        array.
+
+    Raises:
+        ValueError: If the bandpass is a name that is not registered, or if the
+            bandpass does not overlap the model.
+
+    Note:
+        If the bandpass of the filter is wider than the wavelength coverage of
+        the selected solar model, the computation will be restricted to the
+        wavelength range that is in common between the filter and the model.
+        For a registered bandpass and a named model, the mean is computed once
+        per model and units, and saved in the cache directory for use by later
+        processes; subsequent calls only apply the distance and the factor of
+        pi. For any other bandpass and a named model, the mean at 1 AU is saved
+        in the persistent result cache, if it is enabled with
+        `configure_result_cache`.
     """
 
-    # Each reference to a named model triggers the import of its associated
-    # Python file hosts/solar/<name>.py, referenced as "solar.<name>"
-    # here. Note that modules are imported only if requested, not by default.
-    try:
-        module = importlib.import_module(f'solar.{model.lower()}')
-    except ImportError:
-        raise ValueError(f'undefined solar model: {model} (valid models are: '
-                         'colina, kurucz, rieke, stis_rieke, stis)')
+    if isinstance(bandpass, str):
+        if isinstance(model, str):
+            mean = _registered_mean(bandpass, model, units)
+            return mean * _scale_factor(sun_range, solar_f)
+        bandpass = _BANDPASSES.get(bandpass).bandpass
 
-    # Check units
-    if units not in UNIT_DICT:
-        valid_units = ', '.join(UNIT_DICT.keys())
-        raise ValueError(f'invalid units: {units} (valid units are: '
-                         f'{valid_units})')
+    if validate and not isinstance(bandpass, tab.Tabulation):
+        bandpass = tab.Tabulation(*bandpass)
+
+    # The mean is computed at 1 AU in units of flux density; the distance and
+    # the factor of pi are applied to the result
+    if not isinstance(model, str):
+        mean = _bandpass_mean(bandpass, _array_spectrum(model, validate), validate)
+    elif _RESULT_CACHE is None:
+        mean = _bandpass_mean(bandpass, _unit_spectrum(model, units, xunits),
+                              validate)
+    else:
+        (bp_x, bp_y) = _bandpass_pair(bandpass)
+        key = '|'.join([Spectrum(bp_x, bp_y).fingerprint, model.lower(),
+                        _model_spectrum(model).fingerprint, units, xunits,
+                        f'v{INTEGRATION_VERSION}'])
+        mean = _RESULT_CACHE.get(key)
+        if mean is None:
+            mean = _bandpass_mean(bandpass, _unit_spectrum(model, units, xunits),
+                                  validate)
+            _RESULT_CACHE.put(key, mean)
+
+    return mean * _scale_factor(sun_range, solar_f)
+
+#===============================================================================
+def _bandpass_mean(bandpass, spectrum, validate=True):
+    """
+    The mean of a spectrum over a bandpass.
+
+    The integrals are those of the product of the two Tabulations, but they are
+    summed cell by cell from the samples of both without constructing the
+    product.
+
+    Args:
+        bandpass (Tabulation or tuple): The filter bandpass.
+        spectrum (Spectrum): The flux density.
+        validate (bool, optional): False to use the arrays of a tuple without
+            checking them.
+
+    Returns:
+        float: The mean flux density within the bandpass.
+
+    Raises:
+        ValueError: If the bandpass does not overlap the spectrum.
+    """
+
+    if validate:
+        (bp_x, bp_y) = _bandpass_arrays([bandpass])
+    else:
+        (bp_x, bp_y) = (array.reshape(1, -1) for array in _bandpass_pair(bandpass))
+
+    if not (min(bp_x[0, 0], bp_x[0, -1]) < spectrum.x[-1] and
+            max(bp_x[0, 0], bp_x[0, -1]) > spectrum.x[0]):
+        raise ValueError('domains do not overlap')
+
+    (numer, denom) = spectrum.bandpass_integrals(bp_x, bp_y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(numer[0] / denom[0])
+
+#===============================================================================
+def _bandpass_pair(bandpass):
+    """
+    The arrays of a bandpass, without copying them if possible.
+
+    Args:
+        bandpass (Tabulation or tuple): The filter bandpass.
+
+    Returns:
+        tuple: A tuple (x, y) of 1-D arrays of float64.
+    """
+
+    if isinstance(bandpass, tab.Tabulation):
+        return (bandpass.x, bandpass.y)
+
+    return (np.asarray(bandpass[0], dtype=np.float64),
+            np.asarray(bandpass[1], dtype=np.float64))
+
+#===============================================================================
+def _array_spectrum(model, validate):
+    """
+    The spectrum of a model given as a Tabulation or a tuple of arrays.
+
+    Args:
+        model (Tabulation or tuple): The flux density.
+        validate (bool): True to check the arrays of a tuple by constructing a
+            Tabulation; False to use them directly and to keep the spectrum, with
+            its lookup tables, in the spectrum cache for later calls with the
+            same objects, if they are a Tabulation or arrays of float64.
+
+    Returns:
+        Spectrum: The spectrum, which shares the arrays of the model.
+    """
+
+    if validate:
+        if not isinstance(model, tab.Tabulation):
+            model = tab.Tabulation(*model)
+        return Spectrum.from_tabulation(model)
+
+    # Each cached spectrum refers to its model's objects, so their IDs cannot be
+    # reused by other objects while it is cached
+    if isinstance(model, tab.Tabulation):
+        return _SPECTRUM_CACHE.get(('tabulation', id(model)),
+                                   lambda: Spectrum.from_tabulation(model))
+
+    (x, y) = (model[0], model[1])
+    if not all(isinstance(array, np.ndarray) and array.dtype == np.float64
+               for array in (x, y)):
+        return Spectrum(np.asarray(x, dtype=np.float64),
+                        np.asarray(y, dtype=np.float64))
+
+    return _SPECTRUM_CACHE.get(('arrays', id(x), id(y)), lambda: Spectrum(x, y))
+
+#===============================================================================
+def _registered_mean(name, model, units):
+    """
+    The mean flux density of a solar model at 1 AU over a registered bandpass.
+
+    Args:
+        name (str): The name of the bandpass.
+        model (str): Name of the model.
+        units (str): Units for the flux.
+
+    Returns:
+        float: The mean flux density.
+
+    Raises:
+        ValueError: If the bandpass is not registered, the model or units are
+            invalid, or the bandpass does not overlap the model.
+    """
+
+    def compute():
+        entry = _BANDPASSES.get(name)
+        (bp_x, bp_y) = _bandpass_arrays([entry.bandpass])
+        spectrum = _unit_spectrum(model, units, entry.xunits)
+        (numer, denom) = spectrum.bandpass_integrals(bp_x, bp_y)
+        if not denom[0] > 0.:
+            raise ValueError('domains do not overlap')
+        return numer[0] / denom[0]
+
+    return _BANDPASSES.mean(name, model.lower(), units,
+                            lambda: _model_spectrum(model).fingerprint, compute)
+
+#===============================================================================
+def register_bandpass(name, bandpass, *, xunits='um'):
+    """
+    Register a filter bandpass by name.
+
+    A registered bandpass can be passed by name to `bandpass_flux_density` and
+    `bandpass_f`. Its mean solar flux density is computed once per model and
+    units and saved, together with the integral of the bandpass, in the cache
+    directory, so later lookups, in this process or any other, need not
+    integrate again. Saved values are tagged with fingerprints of the bandpass
+    and the model data, and with the version of the integration algorithm, and
+    are recomputed if any of them changes.
+
+    Args:
+        name (str): The name of the bandpass, e.g., "ISS_CL1_GRN".
+        bandpass (Tabulation or tuple): The Tabulation of the filter bandpass.
+            Alternatively, a tuple of two arrays (wavelength, fraction), each of
+            the same size.
+        xunits (str, optional): Units of the bandpass's x-axis.
+            Options are: "um", "nm", "A", or "Hz". "u" represents "mu" meaning
+            micro.
+
+    Raises:
+        ValueError: If the units are invalid.
+
+    Note:
+        Registering a bandpass under an existing name replaces it.
+    """
 
     if xunits not in XUNIT_DICT:
         valid_xunits = ', '.join(XUNIT_DICT.keys())
         raise ValueError(f'invalid units: {xunits} (valid units are: '
                          f'{valid_xunits})')
 
-    # Get the tabulation
-    tabulation = module.FLUX_DENSITY
+    if not isinstance(bandpass, tab.Tabulation):
+        bandpass = tab.Tabulation(*bandpass)
 
-    # If we have the desired units, return
-    if units == module.UNITS and xunits == module.XUNITS:
-        return tabulation * ((1./np.pi if solar_f else 1.) / sun_range**2)
+    _BANDPASSES.register(name, bandpass, xunits)
 
-    # Gather unit info
-    (scale, per_wavelength) = UNIT_DICT[units]
-    (xscale, x_is_wavelength) = XUNIT_DICT[xunits]
+#===============================================================================
+def registered_bandpasses():
+    """
+    The registered filter bandpasses.
+
+    Returns:
+        dict: For each name, a named tuple (bandpass, xunits, integral), where
+        `bandpass` is the Tabulation, `xunits` the units of its x-axis, and
+        `integral` its integral over x.
+    """
 
-    (model_scale, model_per_wavelength) = UNIT_DICT[module.UNITS]
-    (model_xscale, model_x_is_wavelength) = XUNIT_DICT[module.XUNITS]
+    return {name: _BANDPASSES.get(name) for name in _BANDPASSES.names()}
 
-    # Create the new x-values
-    if x_is_wavelength == model_x_is_wavelength:
-        new_x = (xscale / model_xscale) * tabulation.x
-    else:
-        new_x = (xscale * model_xscale * C_IN_UM_HZ) / tabulation.x
+#===============================================================================
+def batch_bandpass_flux_density(filters, sun_range=1., model='STIS_Rieke',
+                                units='W/m^2/um', *, solar_f=False,
+                                max_workers=None):
+    """
+    Compute the average solar flux density for each row of a columnar table.
 
-    # Create the new y-values
-    factor = scale/model_scale * (1./np.pi if solar_f else 1.) / sun_range**2
+    Each row is a registered filter bandpass, a distance, a model, and units,
+    and its result is exactly `bandpass_flux_density(filter, model,
+    units=units, sun_range=sun_range, solar_f=solar_f)`. The rows are reduced to
+    their unique combinations of filter, model, and units; the means at 1 AU of
+    any combinations not already known are computed in parallel by a
+    `concurrent.futures.ProcessPoolExecutor`, and the distances and the factor
+    of pi are then applied to every row at once.
 
-    if per_wavelength == model_per_wavelength:
-        new_y = factor * tabulation.y
+    Workers receive only the bandpass arrays and the names of the models and
+    units, plus, once per worker, the definitions of any models registered by
+    `register_model` or `register_composite_model`, so that workers started by
+    any method can use them. Each worker loads the built-in models itself from
+    their binary copies, and computes from the memory-mapped arrays directly, so
+    the model data is shared through the operating system's page cache rather
+    than pickled. Only the unit-converted copies that a worker needs are
+    private. The results are also saved by the bandpass registry, so later
+    batches, in any process, reuse them.
 
-    else:
-        # w = wavelength in microns
-        # f = frequency in Hz
-        #
-        # We must satisfy:
-        #   flux_w dw = flux_f df
-        # so
-        #   flux_w = flux_f |df/dw|
-        # or
-        #   flux_f = flux_w |dw/df|
-        #
-        # We have
-        #   f = C/w
-        # so
-        #   |df/dw| = C/w^2 = f^2/C
-        # or
-        #   |dw/df| = C/f^2 = w^2/C
-
-        if per_wavelength:  # we need df/dw
-            if model_x_is_wavelength:  # pragma: no cover
-                new_y = ((factor * C_IN_UM_HZ * model_xscale**2) *
-                         tabulation.y / tabulation.x**2)
-            else:  # pragma: no cover - There are currently no models in Hz
-                new_y = ((factor / C_IN_UM_HZ / model_xscale**2) *
-                         tabulation.y * tabulation.x**2)
-
-        else:               # we need dw/df
-            if model_x_is_wavelength:  # pragma: no cover
-                new_y = ((factor / C_IN_UM_HZ / model_xscale**2) *
-                         tabulation.y * tabulation.x**2)
-            else:  # pragma: no cover - There are currently no models in Hz
-                new_y = ((factor * C_IN_UM_HZ * model_xscale**2) *
-                         tabulation.y / tabulation.x**2)
-
-    return tab.Tabulation(new_x, new_y)
+    Args:
+        filters (array-like): The names of registered bandpasses, one per row.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU, one per row or a single value for all rows.
+        model (str or array-like, optional): Name of the model, one per row or a
+            single name for all rows.
+        units (str or array-like, optional): Units for the flux, one per row or
+            a single value for all rows.
+            Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
+            "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
+            or "uJy". "u" represents "mu" meaning micro.
+        solar_f (bool, optional): True to divide by pi, providing solar F
+            instead of solar flux density.
+        max_workers (int, optional): The maximum number of worker processes;
+            by default, the number of processors. Use 1 to compute every
+            combination in this process.
+
+    Returns:
+        np.ndarray: The mean solar flux density or solar F of each row, in
+        input order, with the broadcasted shape of the columns.
+
+    Raises:
+        ValueError: If a filter is not registered, or a model or units are
+            invalid.
+    """
+
+    (filters, sun_range, model, units) = np.broadcast_arrays(
+        np.asarray(filters, dtype=str), np.asarray(sun_range, dtype=np.float64),
+        np.asarray(model, dtype=str), np.asarray(units, dtype=str))
+
+    # Reduce the rows to their unique combinations of filter, model, and units
+    columns = [np.unique(column.ravel(), return_inverse=True)
+               for column in (filters, model, units)]
+    index = np.zeros(filters.size, dtype=np.int64)
+    for (values, inverse) in columns:
+        index = index * values.size + inverse.ravel()
+    (combinations, inverse) = np.unique(index, return_inverse=True)
+
+    keys = []
+    for combination in combinations:
+        key = []
+        for (values, _) in columns[::-1]:
+            (combination, i) = divmod(combination, values.size)
+            key.append(str(values[i]))
+        keys.append(tuple(key[::-1]))
+
+    # Compute the unknown means in worker processes
+    missing = [key for key in keys
+               if not _BANDPASSES.has_mean(key[0], key[1].lower(), key[2])]
+    if len(missing) > 1 and max_workers != 1:
+        tasks = []
+        for (name, model_name, unit) in missing:
+            entry = _BANDPASSES.get(name)
+            tasks.append((name, entry.bandpass.x, entry.bandpass.y, entry.xunits,
+                          model_name, unit))
+
+        recipes = _model_recipes({key[1] for key in missing})
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers, initializer=_batch_init,
+                initargs=(recipes,)) as executor:
+            values = list(executor.map(_batch_mean, tasks))
+
+        for ((name, model_name, unit), value) in zip(missing, values):
+            _BANDPASSES.mean(name, model_name.lower(), unit,
+                             lambda: _model_spectrum(model_name).fingerprint,
+                             lambda: value)
+
+    means = np.array([_registered_mean(*key) for key in keys])
+    result = means[inverse] * _scale_factor(sun_range.ravel(), solar_f)
+    return result.reshape(filters.shape)
 
 #===============================================================================
-def bandpass_flux_density(bandpass, model='STIS_Rieke', *, units='W/m^2/um',
-                          xunits='um', sun_range=1., solar_f=False):
+def _model_recipes(models):
     """
-    Compute the average solar flux density over a filter bandpass.
+    The recipes that register the given models and the models they are made of.
 
     Args:
-        bandpass (Tabulation or tuple): The Tabulation of the filter bandpass,
-            with wavelength in units specified by `xunits` (if `model` is a
-            string) or in the same units as `model` (if `model` is a
-            Tabulation). Alternatively, a tuple of two arrays (wavelength,
-            fraction), each of the same size.
+        models (iterable): Names of models.
+
+    Returns:
+        list: Tuples (name, recipe) for the models registered at run time, in
+        order of registration, so each composite follows its components.
+    """
+
+    needed = set()
+    pending = [model.lower() for model in models]
+    while pending:
+        key = pending.pop()
+        recipe = _MODELS.recipe(key)
+        if recipe is None or key in needed:
+            continue
+
+        needed.add(key)
+        if recipe[0] is register_composite_model:
+            pending.extend(recipe[1][1])
+
+    return [(key, _MODELS.recipe(key)) for key in _MODELS.names() if key in needed]
+
+#===============================================================================
+def _batch_init(recipes):
+    """
+    Register the models defined at run time in a worker process.
+
+    Args:
+        recipes (list): Tuples (name, (function, args, kwargs)) from
+            `_model_recipes`.
+    """
+
+    # A worker that was forked from the caller already has them
+    for (key, (function, args, kwargs)) in recipes:
+        if key not in _MODELS:
+            function(*args, **kwargs)
+
+#===============================================================================
+def _batch_mean(task):
+    """
+    Compute the mean over a registered bandpass in a worker process.
+
+    Args:
+        task (tuple): A tuple (name, x, y, xunits, model, units) with the name
+            and arrays of the bandpass, the units of its x-axis, the name of the
+            model, and the units for the flux.
+
+    Returns:
+        float: The mean flux density at 1 AU.
+    """
+
+    (name, x, y, xunits, model, units) = task
+
+    # A worker that was not forked from the caller must register the bandpass
+    if name not in _BANDPASSES.names():
+        register_bandpass(name, (x, y), xunits=xunits)
+
+    return _registered_mean(name, model, units)
+
+#===============================================================================
+def batch_bandpass_f(filters, sun_range=1., model='STIS_Rieke', units='W/m^2/um',
+                     *, max_workers=None):
+    """
+    Compute the solar F averaged over a filter bandpass for each row of a table.
+
+    Args:
+        filters (array-like): The names of registered bandpasses, one per row.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU, one per row or a single value for all rows.
+        model (str or array-like, optional): Name of the model, one per row or a
+            single name for all rows.
+        units (str or array-like, optional): Units for the flux, one per row or
+            a single value for all rows.
+            Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
+            "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
+            or "uJy". "u" represents "mu" meaning micro.
+        max_workers (int, optional): The maximum number of worker processes;
+            by default, the number of processors. Use 1 to compute every
+            combination in this process.
+
+    Returns:
+        np.ndarray: The mean solar F of each row, in input order, with the
+        broadcasted shape of the columns.
+
+    Raises:
+        ValueError: If a filter is not registered, or a model or units are
+            invalid.
+    """
+
+    return batch_bandpass_flux_density(filters, sun_range, model, units,
+                                       solar_f=True, max_workers=max_workers)
+
+#===============================================================================
+def bandpass_flux_densities(bandpasses, model='STIS_Rieke', *, units='W/m^2/um',
+                            xunits='um', sun_range=1., solar_f=False):
+    """
+    Compute the average solar flux density over each of a stack of bandpasses.
+
+    This is the vectorized equivalent of calling `bandpass_flux_density` once for
+    each bandpass. All of the bandpasses are integrated against the model in a
+    single pass over the model's wavelength grid, without constructing any
+    intermediate Tabulations.
+
+    Args:
+        bandpasses (list or tuple): The filter bandpasses. Either a sequence whose
+            elements are Tabulations or tuples of two arrays (wavelength,
+            fraction), or a tuple of two 2-D np.ndarrays (wavelength, fraction),
+            each of shape (number of bandpasses, number of samples). In the 2-D
+            form, bandpasses with fewer samples are padded at the end with NaN
+            wavelengths. Wavelengths are in units specified by `xunits` (if
+            `model` is a string) or in the same units as `model` (if `model` is
+            a Tabulation).
         model (str or Tabulation, optional): Name of the model. Alternatively, a
             Tabulation of the solar flux density, already in the desired units.
         units (str, optional): Units for the flux.
@@ -205,38 +1768,93 @@ def bandpass_flux_density(bandpass, model='STIS_Rieke', *, units='W/m^2/um',
         xunits (str, optional): Units for the x-axis.
             Options are: "um", "nm", "A", or "Hz". "u" represents "mu" meaning
             micro. Ignored if `model` is a Tabulation.
-        sun_range (float, optional): Distance from Sun to target in AU.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU.
         solar_f (bool, optional): True to divide by pi, providing solar F
             instead of solar flux density.
 
     Returns:
-        float: The mean solar flux density or solar F within the filter
-        bandpass.
+        np.ndarray: The mean solar flux density or solar F within each filter
+        bandpass. The value is NaN for any bandpass that does not overlap the
+        model. If `sun_range` is an array, it is broadcast against the 1-D array
+        of bandpass means.
+
+    Raises:
+        ValueError: If the wavelengths of a bandpass are not monotonic, or if
+            the wavelength and fraction arrays do not have the same shape.
 
     Note:
-        If the bandpass of the filter is wider than the wavelength coverage of
+        If the bandpass of a filter is wider than the wavelength coverage of
         the selected solar model, the computation will be restricted to the
         wavelength range that is in common between the filter and the model.
     """
 
-    if not isinstance(bandpass, tab.Tabulation):
-        bandpass = tab.Tabulation(*bandpass)
+    (bp_x, bp_y) = _bandpass_arrays(bandpasses)
 
     if isinstance(model, tab.Tabulation):
-        flux = model * (1./np.pi if solar_f else 1.) / sun_range**2
+        spectrum = Spectrum.from_tabulation(model)
+    else:
+        spectrum = _unit_spectrum(model, units, xunits)
+
+    (numer, denom) = spectrum.bandpass_integrals(bp_x, bp_y)
+
+    factor = _scale_factor(sun_range, solar_f)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return factor * (numer / denom)
+
+#===============================================================================
+def _bandpass_arrays(bandpasses):
+    """
+    Convert a stack of bandpasses to a pair of NaN-padded 2-D arrays.
+
+    Args:
+        bandpasses (list or tuple): The filter bandpasses, as accepted by
+            `bandpass_flux_densities`.
+
+    Returns:
+        tuple: A tuple (x, y) of 2-D arrays of shape (number of bandpasses,
+        number of samples). Unused trailing elements of x are NaN.
+    """
+
+    # Only a pair of 2-D arrays is the padded form; a tuple of two bandpasses,
+    # each a pair of sequences, also has two elements
+    if (isinstance(bandpasses, tuple) and len(bandpasses) == 2
+            and all(isinstance(array, np.ndarray) and array.ndim == 2
+                    for array in bandpasses)):
+        bp_x = np.array(bandpasses[0], dtype=np.float64)
+        bp_y = np.array(bandpasses[1], dtype=np.float64)
+        if bp_x.shape != bp_y.shape:
+            raise ValueError('bandpass wavelength and fraction arrays do not have '
+                             'the same shape')
+        bp_y[np.isnan(bp_x)] = 0.
+
     else:
-        flux = flux_density(model, units=units, xunits=xunits,
-                            sun_range=sun_range, solar_f=solar_f)
+        pairs = []
+        for bandpass in bandpasses:
+            if isinstance(bandpass, tab.Tabulation):
+                pairs.append((bandpass.x, bandpass.y))
+                continue
+
+            x = np.asarray(bandpass[0], dtype=np.float64)
+            y = np.asarray(bandpass[1], dtype=np.float64)
+            if x.ndim != 1 or x.shape != y.shape:
+                raise ValueError('bandpass wavelength and fraction arrays do not '
+                                 'have the same size')
+            pairs.append((x, y))
 
-    # Multiply together the bandpass and the solar spectrum Tabulations
-    product = bandpass * flux
+        size = max([x.size for (x, _) in pairs] + [2])
+        bp_x = np.full((len(pairs), size), np.nan)
+        bp_y = np.zeros((len(pairs), size))
+        for (i, (x, y)) in enumerate(pairs):
+            bp_x[i, :x.size] = x
+            bp_y[i, :y.size] = y
 
-    # Resample the bandpass at the same wavelengths for a more reliable
-    # normalization
-    bandpass = bandpass.resample(product.x)
+    # Each bandpass must be monotonic, either increasing or decreasing
+    dx = np.diff(bp_x, axis=1)
+    if np.any(np.any(dx < 0., axis=1) & np.any(dx > 0., axis=1)):
+        raise ValueError('bandpass x-coordinates are not monotonic')
 
-    # Return the ratio of integrals
-    return product.integral() / bandpass.integral()
+    return (bp_x, bp_y)
 
 #===============================================================================
 def mean_flux_density(center, width, model='STIS_Rieke', *, units='W/m^2/um',
@@ -245,8 +1863,11 @@ def mean_flux_density(center, width, model='STIS_Rieke', *, units='W/m^2/um',
     Compute average solar flux density over the bandpass of a "boxcar" filter.
 
     Args:
-        center (float): The center of the bandpass (microns).
-        width (float): The full width of the bandpass (microns).
+        center (float or array-like): The center of the bandpass, in units
+            specified by `xunits` (if `model` is a string) or in the same units
+            as `model` (if `model` is a Tabulation).
+        width (float or array-like): The full width of the bandpass, in the
+            same units as `center`.
         model (str or Tabulation, optional): Name of the model. Alternatively, a
             Tabulation of the solar flux density, already in the desired units.
         units (str, optional): Units for the flux.
@@ -257,53 +1878,83 @@ def mean_flux_density(center, width, model='STIS_Rieke', *, units='W/m^2/um',
         xunits (str, optional): Units for the x-axis.
             Options are: "um", "nm", "A", or "Hz". "u" represents "mu" meaning
             micro. Ignored if `model` is a Tabulation.
-        sun_range (float, optional): Distance from Sun to target in AU.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU.
         solar_f (bool, optional): True to divide by pi, providing solar F
             instead of solar flux density.
 
     Returns:
-        float: The mean solar flux density or solar F within the filter bandpass.
+        float or np.ndarray: The mean solar flux density or solar F within the
+        filter bandpass. If any of `center`, `width`, and `sun_range` is an
+        array, this is an array with their broadcasted shape; in that case,
+        the value is NaN for any bandpass that does not overlap the model.
+
+    Raises:
+        ValueError: If `center` and `width` are scalars and the bandpass does not
+            overlap the model.
 
     Note:
         If the bandpass of the filter is wider than the wavelength coverage
         of the selected solar model, the computation will be restricted to the
         wavelength range that is in common between the filter and the model.
+        All of the bandpasses are evaluated in a single vectorized pass, by
+        summing the cells of the model within each of them.
     """
 
-    # Create a boxcar filter Tabulation
-    bandpass = tab.Tabulation((center - width/2., center + width/2.), (1., 1.))
+    if isinstance(model, tab.Tabulation):
+        spectrum = Spectrum.from_tabulation(model)
+    else:
+        spectrum = _unit_spectrum(model, units, xunits)
 
-    # Return the mean over the filter
-    return bandpass_flux_density(bandpass, model=model, units=units,
-                                 xunits=xunits, sun_range=sun_range,
-                                 solar_f=solar_f)
+    center = np.asarray(center, dtype=np.float64)
+    half_width = 0.5 * np.asarray(width, dtype=np.float64)
+    mean = spectrum.boxcar_means(center - half_width, center + half_width)
+    if mean.ndim == 0 and np.isnan(mean):
+        raise ValueError('domains do not overlap')
+
+    return mean[()] * _scale_factor(sun_range, solar_f)
 
 #===============================================================================
 def bandpass_f(bandpass, model='STIS_Rieke', *, units='W/m^2/um', xunits='um',
-               sun_range=1.):
+               sun_range=1., validate=True):
     """
     Compute the solar F averaged over a filter bandpass.
 
     Args:
-        bandpass (Tabulation or tuple): The Tabulation of the filter bandpass,
-            with wavelength in units specified by `xunits` (if `model` is a
-            string) or in the same units as `model` (if `model` is a
+        bandpass (Tabulation, tuple, or str): The Tabulation of the filter
+            bandpass, with wavelength in units specified by `xunits` (if `model`
+            is a string) or in the same units as `model` (if `model` is a
             Tabulation). Alternatively, a tuple of two arrays (wavelength,
-            fraction), each of the same size.
-        model (str or Tabulation, optional): Name of the model. Alternatively, a
-            Tabulation of the solar flux density, already in the desired units.
+            fraction), each of the same size, or the name of a bandpass
+            registered with `register_bandpass`, which is in its own units.
+        model (str, Tabulation, or tuple, optional): Name of the model.
+            Alternatively, a Tabulation of the solar flux density, already in the
+            desired units, or a tuple of two arrays (wavelength, flux), each of
+            the same size.
         units (str, optional): Units for the flux.
             Options are: "W/m^2/um", "W/m^2/nm", "W/m^2/A", "erg/s/cm^2/um",
             "erg/s/cm^2/nm", "erg/s/cm^2/A", "W/m^2/Hz", "erg/s/cm^2/Hz", "Jy",
             or "uJy". "u" represents "mu" meaning micro. Ignored if `model` is a
-            Tabulation.
+            Tabulation or tuple.
         xunits (str, optional): Units for the x-axis.
             Options are: "um", "nm", "A", or "Hz". "u" represents "mu" meaning
-            micro. Ignored if `model` is a Tabulation.
-        sun_range (float, optional): Distance from Sun to target in AU.
+            micro. Ignored if `model` is a Tabulation or tuple, or `bandpass`
+            is a name.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU.
+        validate (bool, optional): False to skip the checks of a bandpass or
+            model given as arrays, which are then used directly, and to keep the
+            lookup tables built for a model given as a Tabulation or tuple for
+            later calls with the same objects. The caller must then ensure that
+            the arrays are valid and are never modified.
 
     Returns:
-        float: The mean solar F within the filter bandpass.
+        float or np.ndarray: The mean solar F within the filter bandpass; an
+        array of the same shape as `sun_range` if it is an array.
+
+    Raises:
+        ValueError: If the bandpass is a name that is not registered, or if the
+            bandpass does not overlap the model.
 
     Note:
         If the bandpass of the filter is wider than the wavelength coverage
@@ -313,7 +1964,7 @@ def bandpass_f(bandpass, model='STIS_Rieke', *, units='W/m^2/um', xunits='um',
 
     return bandpass_flux_density(bandpass, model=model, units=units,
                                  xunits=xunits, sun_range=sun_range,
-                                 solar_f=True)
+                                 solar_f=True, validate=validate)
 
 #===============================================================================
 def mean_f(center, width, model='STIS_Rieke', *, units='W/m^2/um', xunits='um',
@@ -322,8 +1973,11 @@ def mean_f(center, width, model='STIS_Rieke', *, units='W/m^2/um', xunits='um',
     Compute average solar F over the bandpass of a "boxcar" filter.
 
     Args:
-        center (float): The center of the bandpass (microns).
-        width (float): The full width of the bandpass (microns).
+        center (float or array-like): The center of the bandpass, in units
+            specified by `xunits` (if `model` is a string) or in the same units
+            as `model` (if `model` is a Tabulation).
+        width (float or array-like): The full width of the bandpass, in the
+            same units as `center`.
         model (str or Tabulation, optional): Name of the model. Alternatively, a
             Tabulation of the solar flux density, already in the desired units.
         units (str, optional): Units for the flux.
@@ -334,11 +1988,18 @@ def mean_f(center, width, model='STIS_Rieke', *, units='W/m^2/um', xunits='um',
         xunits (str, optional): Units for the x-axis.
             Options are: "um", "nm", "A", or "Hz". "u" represents "mu" meaning
             micro. Ignored if `model` is a Tabulation.
-        sun_range (float, optional): Distance from Sun to target in AU.
+        sun_range (float or array-like, optional): Distance from Sun to target
+            in AU.
 
     Returns:
-        float: The mean solar flux density or solar F within the filter
-        bandpass.
+        float or np.ndarray: The mean solar F within the filter bandpass. If any
+        of `center`, `width`, and `sun_range` is an array, this is an array
+        with their broadcasted shape; in that case, the value is NaN for any
+        bandpass that does not overlap the model.
+
+    Raises:
+        ValueError: If `center` and `width` are scalars and the bandpass does not
+            overlap the model.
 
     Note:
         If the bandpass of the filter is wider than the wavelength coverage
@@ -0,0 +1,177 @@
+################################################################################
+# solar/_bandpass.py: Registry of named filter bandpasses and their solar means.
+################################################################################
+
+import collections
+import threading
+
+from solar import _data
+from solar._spectrum import INTEGRATION_VERSION, Spectrum
+
+RegisteredBandpass = collections.namedtuple('RegisteredBandpass',
+                                            ['bandpass', 'xunits', 'integral'])
+RegisteredBandpass.__doc__ = """A bandpass in a BandpassRegistry, with its integral."""
+
+
+class BandpassRegistry(object):
+    """
+    Filter bandpasses registered by name, with their precomputed solar means.
+
+    The mean solar flux density over each bandpass is computed once per model
+    and units and then kept in memory, so later lookups are dictionary reads. It
+    is also saved, together with the integral of the bandpass, in a JSON file in
+    the cache directory, so that other processes do not compute it again. Each
+    saved value is tagged with fingerprints of the bandpass and of the model
+    data, and is recomputed and replaced if either one has changed. The
+    fingerprint of the bandpass includes the version of the integration
+    algorithm, so values saved by an earlier version are recomputed too.
+    """
+
+    def __init__(self, filename='bandpasses.json'):
+        """
+        Constructor for a BandpassRegistry.
+
+        Args:
+            filename (str, optional): The name of the JSON file in the cache
+                directory.
+        """
+
+        self._filename = filename
+        self._bandpasses = {}   # name -> (RegisteredBandpass, fingerprint)
+        self._means = {}        # (name, model, units) -> mean at 1 AU
+        self._lock = threading.RLock()
+
+    def register(self, name, bandpass, xunits):
+        """
+        Register a bandpass, replacing any bandpass of the same name.
+
+        Args:
+            name (str): The name of the bandpass.
+            bandpass (Tabulation): The bandpass.
+            xunits (str): Units of the bandpass's x-axis.
+
+        Returns:
+            RegisteredBandpass: The registered bandpass.
+        """
+
+        fingerprint = (f'{Spectrum.from_tabulation(bandpass).fingerprint}|{xunits}'
+                       f'|v{INTEGRATION_VERSION}')
+        entry = RegisteredBandpass(bandpass, xunits, float(bandpass.integral()))
+
+        with self._lock:
+            self._bandpasses[name] = (entry, fingerprint)
+            for key in [key for key in self._means if key[0] == name]:
+                del self._means[key]
+
+            store = _data.load_json(self._filename)
+            record = store.get(name)
+            if (not isinstance(record, dict)
+                    or record.get('fingerprint') != fingerprint):
+                store[name] = {'fingerprint': fingerprint, 'xunits': xunits,
+                               'integral': entry.integral, 'means': {}}
+                _data.save_json(self._filename, store)
+
+        return entry
+
+    def get(self, name):
+        """
+        A registered bandpass.
+
+        Args:
+            name (str): The name of the bandpass.
+
+        Returns:
+            RegisteredBandpass: The bandpass, its units, and its integral.
+
+        Raises:
+            ValueError: If no bandpass has this name.
+        """
+
+        entry = self._bandpasses.get(name)
+        if entry is None:
+            raise ValueError(f'unregistered bandpass: {name}')
+
+        return entry[0]
+
+    def names(self):
+        """
+        The names of the registered bandpasses.
+
+        Returns:
+            list: The names, in order of registration.
+        """
+
+        return list(self._bandpasses)
+
+    def has_mean(self, name, model, units):
+        """
+        True if the mean over a registered bandpass is already in memory.
+
+        Args:
+            name (str): The name of the bandpass.
+            model (str): Name of the model, in lower case.
+            units (str): Units for the flux.
+
+        Returns:
+            bool: True if `mean` would return without loading or computing.
+        """
+
+        return (name, model, units) in self._means
+
+    def mean(self, name, model, units, fingerprint, compute):
+        """
+        The mean solar flux density at 1 AU over a registered bandpass.
+
+        Args:
+            name (str): The name of the bandpass.
+            model (str): Name of the model, in lower case.
+            units (str): Units for the flux.
+            fingerprint (callable): A function of no arguments that returns the
+                fingerprint of the model data; called only if the mean is not
+                in memory.
+            compute (callable): A function of no arguments that returns the mean;
+                called only if no valid saved mean exists.
+
+        Returns:
+            float: The mean.
+
+        Raises:
+            ValueError: If no bandpass has this name.
+        """
+
+        key = (name, model, units)
+        mean = self._means.get(key)
+        if mean is not None:
+            return mean
+
+        with self._lock:
+            (_, bandpass_fingerprint) = self._bandpasses.get(name, (None, None))
+            if bandpass_fingerprint is None:
+                raise ValueError(f'unregistered bandpass: {name}')
+
+            model_fingerprint = fingerprint()
+            store = _data.load_json(self._filename)
+            record = store.get(name)
+            if (not isinstance(record, dict)
+                    or record.get('fingerprint') != bandpass_fingerprint):
+                entry = self.get(name)
+                record = {'fingerprint': bandpass_fingerprint,
+                          'xunits': entry.xunits, 'integral': entry.integral,
+                          'means': {}}
+                store[name] = record
+
+            saved = record['means'].get(f'{model}|{units}')
+            if (isinstance(saved, dict)
+                    and saved.get('fingerprint') == model_fingerprint):
+                mean = float(saved['mean'])
+            else:
+                mean = float(compute())
+                record['means'][f'{model}|{units}'] = {
+                    'fingerprint': model_fingerprint, 'mean': mean}
+                _data.save_json(self._filename, store)
+
+            self._means[key] = mean
+
+        return mean
+
+################################################################################
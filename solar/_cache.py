@@ -0,0 +1,181 @@
+################################################################################
+# solar/_cache.py: In-memory LRU cache of unit-converted model spectra.
+################################################################################
+
+import collections
+import threading
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'entries',
+                                                 'currbytes', 'max_entries',
+                                                 'max_bytes'])
+CacheInfo.__doc__ = """Statistics of a SpectrumCache, as returned by its info() method."""
+
+
+class SpectrumCache(object):
+    """
+    A least-recently-used cache whose size is limited by a byte budget.
+
+    Values are created on demand by a loader function and evicted, oldest use
+    first, whenever the total size of the cached values exceeds `max_bytes` or the
+    number of values exceeds `max_entries`. A value larger than the whole budget is
+    returned to the caller but never stored. The size of a value is measured again
+    each time it is requested, so memory that it acquires after it is cached, such
+    as a lookup index, is counted. The cache is thread-safe, and
+    concurrent requests for a key that is not cached wait for a single call to
+    its loader.
+    """
+
+    def __init__(self, max_bytes=None, max_entries=None, sizeof=None):
+        """
+        Constructor for a SpectrumCache.
+
+        Args:
+            max_bytes (int, optional): The maximum total size of the cached values
+                in bytes; None for no limit.
+            max_entries (int, optional): The maximum number of cached values; None
+                for no limit.
+            sizeof (callable, optional): A function that returns the size in bytes
+                of a cached value. By default, the `nbytes` attribute of the value
+                is used if it has one; otherwise, the value counts as zero bytes.
+        """
+
+        self._sizeof = sizeof or (lambda value: getattr(value, 'nbytes', 0))
+        self._entries = collections.OrderedDict()   # key -> (value, nbytes)
+        self._loading = {}                          # key -> lock held while loading
+        self._lock = threading.RLock()
+        self._max_bytes = None
+        self._max_entries = None
+        self._currbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self.configure(max_bytes=max_bytes, max_entries=max_entries)
+
+    def get(self, key, loader):
+        """
+        The cached value for a key, calling the loader if it is not cached.
+
+        Args:
+            key (hashable): The cache key.
+            loader (callable): A function of no arguments that returns the value
+                for this key. Any exception it raises propagates to the caller and
+                nothing is cached.
+
+        Returns:
+            object: The cached or newly loaded value.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                self._remeasure(key, entry)
+                return entry[0]
+            self._misses += 1
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        # Concurrent requests for the same key wait for a single load
+        with loading:
+            try:
+                with self._lock:
+                    if key in self._entries:    # another thread loaded it
+                        return self._entries[key][0]
+
+                value = loader()
+                nbytes = self._sizeof(value)
+
+                with self._lock:
+                    if self._max_bytes is not None and nbytes > self._max_bytes:
+                        return value
+
+                    self._entries[key] = (value, nbytes)
+                    self._currbytes += nbytes
+                    self._evict()
+
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+
+        return value
+
+    def configure(self, max_bytes=None, max_entries=None):
+        """
+        Change the size limits of the cache, evicting values as necessary.
+
+        Args:
+            max_bytes (int, optional): The maximum total size of the cached values
+                in bytes; None for no limit.
+            max_entries (int, optional): The maximum number of cached values; None
+                for no limit.
+
+        Raises:
+            ValueError: If a limit is negative.
+        """
+
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f'invalid cache max_bytes: {max_bytes}')
+        if max_entries is not None and max_entries < 0:
+            raise ValueError(f'invalid cache max_entries: {max_entries}')
+
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._max_entries = max_entries
+            self._evict()
+
+    def info(self):
+        """
+        The current statistics of the cache.
+
+        Returns:
+            CacheInfo: A named tuple (hits, misses, entries, currbytes, max_entries,
+            max_bytes).
+        """
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._entries),
+                             self._currbytes, self._max_entries, self._max_bytes)
+
+    def clear(self):
+        """
+        Remove every value from the cache and reset the statistics.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._currbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def _remeasure(self, key, entry):
+        """
+        Update the size of a cached value, evicting values as necessary.
+
+        The caller must hold the lock.
+
+        Args:
+            key (hashable): The cache key.
+            entry (tuple): The cached tuple (value, nbytes).
+        """
+
+        (value, nbytes) = entry
+        new_nbytes = self._sizeof(value)
+        if new_nbytes != nbytes:
+            self._entries[key] = (value, new_nbytes)
+            self._currbytes += new_nbytes - nbytes
+            self._evict()
+
+    def _evict(self):
+        """
+        Remove least-recently-used values until the cache is within its limits.
+
+        The caller must hold the lock.
+        """
+
+        while self._entries and (
+                (self._max_bytes is not None and self._currbytes > self._max_bytes)
+                or (self._max_entries is not None
+                    and len(self._entries) > self._max_entries)):
+            (_, (_, nbytes)) = self._entries.popitem(last=False)
+            self._currbytes -= nbytes
+
+################################################################################
@@ -0,0 +1,228 @@
+################################################################################
+# solar/_composite.py: Model spectra spliced together from other model spectra.
+################################################################################
+
+import hashlib
+import threading
+
+import numpy as np
+
+from solar._spectrum import Spectrum
+
+
+class CompositeSpectrum(Spectrum):
+    """
+    A spectrum spliced together from contiguous ranges of other spectra.
+
+    Each segment is a range of the samples of another spectrum, referenced as
+    views of its arrays rather than copied. Between the last sample of one
+    segment and the first sample of the next, the spectrum is linear, as it is
+    between any two samples. The arrays of the whole spectrum are concatenated
+    only when they are first needed and then kept; a conversion to other units,
+    by `segment_arrays`, never needs them.
+    """
+
+    def __init__(self, segments, units=None, xunits=None):
+        """
+        Constructor for a CompositeSpectrum.
+
+        Args:
+            segments (list): A list of tuples (spectrum, start, stop), each
+                selecting the samples start:stop of a Spectrum. All the spectra
+                must be in the same units and the segments must be in increasing
+                order of x, without overlaps.
+            units (str, optional): Units of y, if known.
+            xunits (str, optional): Units of x, if known.
+        """
+
+        self.segments = tuple(segments)
+        self._materialize_lock = threading.Lock()
+        Spectrum.__init__(self, None, None, units=units, xunits=xunits)
+
+    @property
+    def x(self):
+        """The x-coordinates, concatenated on first use."""
+
+        if self._x is None:
+            self._materialize()
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._x = value
+
+    @property
+    def y(self):
+        """The y-values, concatenated on first use."""
+
+        if self._y is None:
+            self._materialize()
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._y = value
+
+    @property
+    def size(self):
+        """The number of samples."""
+
+        return sum(stop - start for (_, start, stop) in self.segments)
+
+    @property
+    def nbytes(self):
+        """
+        The memory used by this spectrum once its arrays are concatenated,
+        including its cumulative integrals, lookup index, and kernels if they
+        have been built.
+        """
+
+        nbytes = sum(spectrum.x[start:stop].nbytes
+                     for (spectrum, start, stop) in self.segments)
+        return 2 * nbytes + self._derived_nbytes()
+
+    @property
+    def fingerprint(self):
+        """A hexadecimal digest that identifies the samples of this spectrum."""
+
+        if self._fingerprint is None:
+            digest = hashlib.sha1()
+            for (spectrum, start, stop) in self.segments:
+                digest.update(f'{spectrum.fingerprint}[{start}:{stop}]'.encode())
+            self._fingerprint = digest.hexdigest()
+
+        return self._fingerprint
+
+    def segment_arrays(self):
+        """
+        The arrays of each segment, as read-only views of the parent spectra.
+
+        Returns:
+            list: A list of tuples (x, y).
+        """
+
+        return [(spectrum.x[start:stop], spectrum.y[start:stop])
+                for (spectrum, start, stop) in self.segments]
+
+    def _materialize(self):
+        """
+        Concatenate the arrays of the segments into the arrays of this spectrum.
+        """
+
+        with self._materialize_lock:
+            if self._y is not None:
+                return
+
+            pieces = self.segment_arrays()
+            x = np.concatenate([piece[0] for piece in pieces])
+            y = np.concatenate([piece[1] for piece in pieces])
+            x.flags.writeable = False
+            y.flags.writeable = False
+            self._x = x
+            self._y = y         # assigned last; it marks the arrays as complete
+
+#===============================================================================
+def splice(spectra, splices, blends=None, units=None, xunits=None):
+    """
+    Splice spectra in the same units into a CompositeSpectrum.
+
+    The composite follows the first spectrum up to the first splice point, the
+    second from there up to the second splice point, and so on. Each spectrum
+    contributes its samples that are greater than the previous splice point and
+    no greater than the next one.
+
+    A splice point can instead be blended over a region of given width centered
+    on it, within which the composite fades linearly from one spectrum to the
+    next. The blended region is sampled at the samples of both spectra within it
+    and at its limits, where it meets each spectrum exactly.
+
+    Args:
+        spectra (list): The Spectrum objects, in order of increasing x.
+        splices (list): The splice points, one fewer than the spectra, in
+            increasing order. A splice point of None is the end of the domain of
+            the spectrum before it.
+        blends (list, optional): The width of the blended region at each splice
+            point; zero for an abrupt splice. By default, every splice is abrupt.
+        units (str, optional): Units of y, if known.
+        xunits (str, optional): Units of x, if known.
+
+    Returns:
+        CompositeSpectrum: The spliced spectrum.
+
+    Raises:
+        ValueError: If the numbers of spectra, splice points, and blend widths
+            are inconsistent, if the splice points or blended regions are not
+            increasing, if both spectra do not cover a blended region, or if
+            fewer than two samples remain.
+    """
+
+    if len(spectra) < 1 or len(splices) != len(spectra) - 1:
+        raise ValueError(f'{len(spectra)} spectra require {len(spectra) - 1} '
+                         f'splice points; got {len(splices)}')
+
+    blends = [0.] * len(splices) if blends is None else [float(b) for b in blends]
+    if len(blends) != len(splices) or any(b < 0. for b in blends):
+        raise ValueError(f'invalid blend widths for {len(splices)} splice points: '
+                         f'{blends}')
+
+    points = [spectrum.x[-1] if splice_x is None else float(splice_x)
+              for (spectrum, splice_x) in zip(spectra, splices)]
+    lows = [p - 0.5 * b for (p, b) in zip(points, blends)]
+    highs = [p + 0.5 * b for (p, b) in zip(points, blends)]
+    if np.any(np.diff(points) <= 0.) or np.any(np.array(lows[1:]) <= highs[:-1]):
+        raise ValueError(f'splice points are not increasing: {points}')
+
+    last = len(spectra) - 1
+    segments = []
+    for (k, spectrum) in enumerate(spectra):
+        lower = -np.inf if k == 0 else highs[k-1]
+        upper = np.inf if k == last else lows[k]
+        start = np.searchsorted(spectrum.x, lower, side='right')
+        stop = np.searchsorted(spectrum.x, upper,
+                               side='left' if k < last and blends[k] else 'right')
+        if stop > start:
+            segments.append((spectrum, int(start), int(stop)))
+
+        if k < last and blends[k]:
+            blend = _blend(spectrum, spectra[k+1], lows[k], highs[k])
+            segments.append((blend, 0, blend.x.size))
+
+    composite = CompositeSpectrum(segments, units=units, xunits=xunits)
+    if composite.size < 2:
+        raise ValueError('spliced spectrum has fewer than two samples')
+
+    return composite
+
+#===============================================================================
+def _blend(first, second, lo, hi):
+    """
+    The linear cross-fade from one spectrum to another over a region.
+
+    Args:
+        first (Spectrum): The spectrum at the lower limit.
+        second (Spectrum): The spectrum at the upper limit.
+        lo (float): The lower limit of the region.
+        hi (float): The upper limit of the region.
+
+    Returns:
+        Spectrum: The blended spectrum within the region, with read-only arrays.
+
+    Raises:
+        ValueError: If either spectrum does not cover the region.
+    """
+
+    for spectrum in (first, second):
+        if spectrum.x[0] > lo or spectrum.x[-1] < hi:
+            raise ValueError(f'blended region {lo} to {hi} is outside the domain '
+                             f'{spectrum.x[0]} to {spectrum.x[-1]}')
+
+    inside = [spectrum.x[(spectrum.x > lo) & (spectrum.x < hi)]
+              for spectrum in (first, second)]
+    x = np.hstack([[lo], np.union1d(*inside), [hi]])
+    t = (x - lo) / (hi - lo)
+    y = (1. - t) * first.evaluate(x) + t * second.evaluate(x)
+    x.flags.writeable = False
+    y.flags.writeable = False
+    return Spectrum(x, y, units=first.units, xunits=first.xunits)
+
+################################################################################
@@ -0,0 +1,210 @@
+################################################################################
+# solar/_convolve.py: Smoothing of model spectra by a line-spread function.
+################################################################################
+
+import math
+
+import numpy as np
+
+from solar._spectrum import Spectrum
+
+# Ratio of the full width at half maximum of a Gaussian to its sigma
+FWHM_PER_SIGMA = np.sqrt(8. * np.log(2.))
+
+# Number of sigmas beyond which a Gaussian line-spread function is truncated
+GAUSSIAN_SIGMAS = 6.
+
+# Number of log-wavelength samples per sigma of the line-spread function
+SAMPLES_PER_SIGMA = 3.
+
+# Largest factor by which the log-wavelength grid may be finer than the median
+# spacing of the model grid
+MAX_OVERSAMPLING = 4.
+
+# The error function, applied element by element
+_ERF = np.frompyfunc(math.erf, 1, 1)
+
+#===============================================================================
+def gaussian_sigma(resolution):
+    """
+    The sigma of the Gaussian line-spread function for a resolving power.
+
+    Args:
+        resolution (float): The resolving power R = lambda / FWHM.
+
+    Returns:
+        float: The sigma of the Gaussian in units of ln(lambda).
+
+    Raises:
+        ValueError: If the resolving power is not positive.
+    """
+
+    if not resolution > 0.:
+        raise ValueError(f'invalid resolving power: {resolution}')
+
+    return 1. / (resolution * FWHM_PER_SIGMA)
+
+#===============================================================================
+def lsf_sigma(lsf):
+    """
+    The RMS width of a tabulated line-spread function.
+
+    Args:
+        lsf (Tabulation): The line-spread function versus offset in ln(lambda).
+
+    Returns:
+        float: The RMS width about the centroid, in units of ln(lambda).
+
+    Raises:
+        ValueError: If the line-spread function has no positive area.
+    """
+
+    spectrum = Spectrum.from_tabulation(lsf)
+    (c0, c1) = spectrum.cumulative
+    area = c0[-1]
+    if not area > 0.:
+        raise ValueError('line-spread function has no positive area')
+
+    x = lsf.x
+    y = lsf.y
+    x2y = x * x * y
+    second = np.sum(0.5 * (x2y[:-1] + x2y[1:]) * np.diff(x)) / area
+    mean = c1[-1] / area
+    return float(np.sqrt(max(second - mean**2, 0.)))
+
+#===============================================================================
+def log_grid(spectrum, sigma):
+    """
+    A grid uniform in ln(x) that resolves a line-spread function.
+
+    The step is a fraction of the width of the line-spread function, but it is
+    never coarser than the median step of the model grid, so no detail is lost,
+    and never finer than a fraction of it, so the grid size stays bounded for
+    very narrow line-spread functions.
+
+    Args:
+        spectrum (Spectrum): The model spectrum.
+        sigma (float): The width of the line-spread function in ln(x).
+
+    Returns:
+        tuple: A tuple (u, du), where u is the grid of ln(x) spanning the domain
+        of the spectrum and du is its step.
+    """
+
+    (u0, u1) = np.log([spectrum.x[0], spectrum.x[-1]])
+    native = np.median(np.diff(np.log(spectrum.x)))
+    du = min(native, max(sigma / SAMPLES_PER_SIGMA, native / MAX_OVERSAMPLING))
+
+    count = int((u1 - u0) / du) + 1
+    return (u0 + du * np.arange(count), du)
+
+#===============================================================================
+def gaussian_kernel(sigma, du):
+    """
+    A Gaussian line-spread function integrated over the cells of a grid.
+
+    Each element of the kernel is the integral of the Gaussian over one grid
+    cell, so a Gaussian narrower than the grid step is not lost.
+
+    Args:
+        sigma (float): The sigma of the Gaussian in ln(x).
+        du (float): The grid step in ln(x).
+
+    Returns:
+        np.ndarray: The kernel, of odd length, centered, and normalized to unit
+        sum.
+    """
+
+    half = int(np.ceil(GAUSSIAN_SIGMAS * sigma / du + 0.5))
+    edges = du * (np.arange(-half, half + 2) - 0.5) / (np.sqrt(2.) * sigma)
+    kernel = np.diff(_ERF(edges).astype(np.float64))
+    return kernel / np.sum(kernel)
+
+#===============================================================================
+def tabulated_kernel(lsf, du):
+    """
+    A tabulated line-spread function integrated over the cells of a grid.
+
+    Each element of the kernel is the integral of the line-spread function over
+    one grid cell, so a function narrower than the grid step is not lost.
+
+    Args:
+        lsf (Tabulation): The line-spread function versus offset in ln(x).
+        du (float): The grid step in ln(x).
+
+    Returns:
+        np.ndarray: The kernel, of odd length, centered, and normalized to unit
+        sum.
+    """
+
+    spectrum = Spectrum.from_tabulation(lsf)
+    (lo, hi) = (lsf.x[0], lsf.x[-1])
+    half = int(np.ceil(max(-lo, hi) / du + 0.5))
+    edges = du * (np.arange(-half, half + 2) - 0.5)
+    edges = np.clip(edges, lo, hi)
+    kernel = spectrum.integrals(edges[:-1], edges[1:])
+    return kernel / np.sum(kernel)
+
+#===============================================================================
+def fft_convolve(y, kernel):
+    """
+    Convolve an array with a centered kernel using the FFT.
+
+    The array is extended at each end by its end value, so the result near the
+    ends is not darkened by the absence of data beyond them.
+
+    Args:
+        y (np.ndarray): The array to convolve.
+        kernel (np.ndarray): The kernel, of odd length and centered.
+
+    Returns:
+        np.ndarray: The convolution, the same size as `y`.
+    """
+
+    half = kernel.size // 2
+    padded = np.pad(y, half, mode='edge')
+    size = padded.size + kernel.size - 1
+    nfft = 1 << (size - 1).bit_length()
+
+    full = np.fft.irfft(np.fft.rfft(padded, nfft) * np.fft.rfft(kernel, nfft), nfft)
+    return full[2*half:2*half + y.size]
+
+#===============================================================================
+def convolve(spectrum, sigma=None, lsf=None):
+    """
+    A spectrum smoothed by a Gaussian or tabulated line-spread function.
+
+    The spectrum is averaged over the cells of a grid uniform in ln(x), on which
+    a line-spread function of constant resolving power is a fixed kernel, and
+    convolved with that kernel by FFT.
+
+    Args:
+        spectrum (Spectrum): The model spectrum.
+        sigma (float, optional): The sigma of a Gaussian line-spread function in
+            ln(x).
+        lsf (Tabulation, optional): A tabulated line-spread function versus
+            offset in ln(x); used if `sigma` is None.
+
+    Returns:
+        Spectrum: The smoothed spectrum on the log grid, with read-only arrays
+        and the units of `spectrum`.
+    """
+
+    width = sigma if lsf is None else lsf_sigma(lsf)
+    (u, du) = log_grid(spectrum, width)
+
+    # Average the model over each cell of the log grid, conserving flux
+    x = np.exp(u)
+    y = spectrum.boxcar_means(np.exp(u - 0.5*du), np.exp(u + 0.5*du))
+
+    if lsf is None:
+        kernel = gaussian_kernel(sigma, du)
+    else:
+        kernel = tabulated_kernel(lsf, du)
+
+    y = fft_convolve(y, kernel)
+    x.flags.writeable = False
+    y.flags.writeable = False
+    return Spectrum(x, y, units=spectrum.units, xunits=spectrum.xunits)
+
+################################################################################
@@ -0,0 +1,307 @@
+################################################################################
+# solar/_data.py: Loading of model data files via a binary cache.
+################################################################################
+
+import json
+import os
+import tempfile
+
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data_files')
+
+#===============================================================================
+def data_file_path(filename):
+    """
+    The full path to a file in the package's data_files directory.
+
+    Args:
+        filename (str): The name of the file.
+
+    Returns:
+        str: The path to the file.
+    """
+
+    return os.path.join(DATA_DIR, filename)
+
+#===============================================================================
+def cache_dir():
+    """
+    The directory for binary copies of model data files.
+
+    The directory is given by the environment variable RMS_SOLAR_CACHE_DIR if it
+    is defined; if it is defined but empty, the binary cache is disabled.
+    Otherwise it is "rms-solar" inside the user's cache directory, i.e.,
+    $XDG_CACHE_HOME, %LOCALAPPDATA%, or ~/.cache.
+
+    Returns:
+        str or None: The path to the directory, or None if the cache is disabled.
+    """
+
+    path = os.environ.get('RMS_SOLAR_CACHE_DIR')
+    if path is not None:
+        return path or None
+
+    base = (os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+            or os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'rms-solar')
+
+#===============================================================================
+def cache_path(source, suffix='npy'):
+    """
+    The path of the cached binary copy of a data file.
+
+    The name of the cached file includes the size and modification time of the
+    source, so a cached copy becomes stale, and is ignored, as soon as the
+    source changes.
+
+    Args:
+        source (str): The path to the data file.
+        suffix (str, optional): The extension of the cached file.
+
+    Returns:
+        str or None: The path of the cached file, or None if the cache is disabled.
+
+    Raises:
+        OSError: If the source file cannot be accessed.
+    """
+
+    directory = cache_dir()
+    if directory is None:
+        return None
+
+    stat = os.stat(source)
+    name = os.path.basename(source)
+    fingerprint = f'{stat.st_size}-{stat.st_mtime_ns}'
+    return os.path.join(directory, f'{name}.{fingerprint}.{suffix}')
+
+#===============================================================================
+def prebuilt_path(source):
+    """
+    The path of the prebuilt binary copy of a data file.
+
+    A prebuilt copy is a .npy file with the same name as the data file, in the
+    same directory. Prebuilt copies are shipped with the package for data files
+    whose parser depends on an optional package, and are regenerated with
+    "python -m solar._data" whenever the data file changes.
+
+    Args:
+        source (str): The path to the data file.
+
+    Returns:
+        str: The path of the prebuilt copy, which might not exist.
+    """
+
+    return os.path.splitext(source)[0] + '.npy'
+
+#===============================================================================
+def load_array(source, parser, suffix=None):
+    """
+    An array parsed from a data file, loaded from a binary copy if possible.
+
+    If a prebuilt copy of the data file exists, the array is memory-mapped
+    read-only from it and the data file is never opened. Otherwise, on first
+    use, the data file is parsed and the result saved as a .npy file in the cache
+    directory, from which the array is memory-mapped afterward. If the cache is
+    disabled, unwritable, missing, stale, or corrupt, the data file is parsed
+    again.
+
+    Args:
+        source (str): The path to the data file.
+        parser (callable): A function that takes the path to the data file and
+            returns the array.
+        suffix (str, optional): The extension of the cached file, for an array
+            derived from the data file rather than parsed from it. Such an array
+            is never loaded from the prebuilt copy.
+
+    Returns:
+        np.ndarray: The array of float64 values, read-only if memory-mapped.
+    """
+
+    prebuilt = prebuilt_path(source)
+    if suffix is None and os.path.exists(prebuilt):
+        return np.load(prebuilt, mmap_mode='r')
+
+    return _load_cached(cache_path(source, suffix or 'npy'),
+                        lambda: parser(source))
+
+#===============================================================================
+def load_derived(name, builder):
+    """
+    An array derived from model data, loaded from the cache directory if possible.
+
+    On first use, the array is built and saved under the given name in the cache
+    directory, from which it is memory-mapped afterward. The name must identify
+    the content completely, e.g., by including a fingerprint of the data it was
+    derived from.
+
+    Args:
+        name (str): The file name of the cached array, without a directory.
+        builder (callable): A function of no arguments that returns the array.
+
+    Returns:
+        np.ndarray: The array of float64 values, read-only if memory-mapped.
+    """
+
+    directory = cache_dir()
+    path = None if directory is None else os.path.join(directory, name)
+    return _load_cached(path, builder)
+
+#===============================================================================
+def _load_cached(path, builder):
+    """
+    An array memory-mapped from a .npy file, built and saved if necessary.
+
+    Args:
+        path (str or None): The path of the .npy file; None to always build.
+        builder (callable): A function of no arguments that returns the array.
+
+    Returns:
+        np.ndarray: The array of float64 values, read-only if memory-mapped.
+    """
+
+    if path is not None:
+        try:
+            return np.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            pass
+
+    array = np.ascontiguousarray(builder(), dtype=np.float64)
+    if path is not None:
+        save_array(path, array)
+
+    return array
+
+#===============================================================================
+def load_columns(source, parser, suffix=None):
+    """
+    The columns of a data table, loaded from a binary cache if possible.
+
+    This is `load_array` for a parser that returns a sequence of equal-length
+    columns. The columns are stored as the rows of a single native-endian
+    float64 array, so each one is a contiguous, read-only, memory-mapped view of
+    the cached file that every process using the file can share.
+
+    Args:
+        source (str): The path to the data file.
+        parser (callable): A function that takes the path to the data file and
+            returns a sequence of 1-D arrays of the same size.
+        suffix (str, optional): The extension of the cached file, for columns
+            derived from the data file rather than parsed from it.
+
+    Returns:
+        tuple: The columns as 1-D float64 arrays.
+    """
+
+    array = load_array(source, lambda path: np.vstack(parser(path)), suffix)
+    array.flags.writeable = False
+    return tuple(array)
+
+#===============================================================================
+def save_array(path, array):
+    """
+    Save an array as a .npy file, atomically and ignoring any failure.
+
+    The array is written to a temporary file that is then renamed, so concurrent
+    readers and writers never see a partial file.
+
+    Args:
+        path (str): The path of the .npy file.
+        array (np.ndarray): The array to save.
+
+    Returns:
+        bool: True if the file was saved.
+    """
+
+    return _save_atomic(path, 'wb', lambda f: np.save(f, array))
+
+#===============================================================================
+def load_json(name):
+    """
+    A JSON object saved in the cache directory.
+
+    Args:
+        name (str): The file name of the object, without a directory.
+
+    Returns:
+        dict: The object; empty if the cache is disabled or the file is missing,
+        unreadable, or corrupt.
+    """
+
+    directory = cache_dir()
+    if directory is None:
+        return {}
+
+    try:
+        with open(os.path.join(directory, name)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+#===============================================================================
+def save_json(name, data):
+    """
+    Save a JSON object in the cache directory, atomically and ignoring any failure.
+
+    Args:
+        name (str): The file name of the object, without a directory.
+        data (dict): The object to save.
+
+    Returns:
+        bool: True if the file was saved.
+    """
+
+    directory = cache_dir()
+    if directory is None:
+        return False
+
+    return _save_atomic(os.path.join(directory, name), 'w',
+                        lambda f: json.dump(data, f, indent=1, sort_keys=True))
+
+#===============================================================================
+def _save_atomic(path, mode, write):
+    """
+    Write a file via a temporary file that is then renamed, ignoring any failure.
+
+    Args:
+        path (str): The path of the file.
+        mode (str): The mode in which to open the temporary file.
+        write (callable): A function that takes the open file and writes it.
+
+    Returns:
+        bool: True if the file was saved.
+    """
+
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        (handle, temp_path) = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, mode) as f:
+                write(f)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    except OSError:
+        return False
+
+    return True
+
+
+if __name__ == '__main__':  # pragma: no cover
+
+    # Regenerate the prebuilt binary copies of the FITS files. This is the only
+    # use of astropy.
+    import solar.rieke
+    import solar.stis
+
+    for module in (solar.stis, solar.rieke):
+        columns = module._read_columns(module.filepath)
+        np.save(prebuilt_path(module.filepath),
+                np.vstack(columns).astype(np.float64))
+        print(prebuilt_path(module.filepath))
+
+################################################################################
@@ -0,0 +1,163 @@
+################################################################################
+# solar/_registry.py: Registry of solar models by name.
+################################################################################
+
+import threading
+
+# The entry-point group through which other packages provide solar models
+ENTRY_POINT_GROUP = 'rms_solar.models'
+
+
+class ModelRegistry(object):
+    """
+    Solar models by name, each with a function that loads it.
+
+    A name is resolved by a single dictionary lookup; nothing is loaded until
+    the model is requested. Models provided by other installed packages, as
+    entry points in the group "rms_solar.models", are discovered the first time
+    a name is not found or the names are listed. Each entry point refers to a
+    module or object with the same attributes as the model modules of this
+    package.
+    """
+
+    def __init__(self, load_entry_point, group=ENTRY_POINT_GROUP):
+        """
+        Constructor for a ModelRegistry.
+
+        Args:
+            load_entry_point (callable): A function that takes the object an
+                entry point refers to and returns its spectrum.
+            group (str, optional): The entry-point group to discover.
+        """
+
+        self._load_entry_point = load_entry_point
+        self._group = group
+        self._loaders = {}      # name -> (loader, definition, recipe)
+        self._discovered = False
+        self._lock = threading.RLock()
+
+    def register(self, name, loader, definition=None, recipe=None):
+        """
+        Register a model.
+
+        Args:
+            name (str): The name of the model, in lower case.
+            loader (callable): A function that takes the name and returns the
+                model's spectrum in its native units.
+            definition (hashable, optional): A description of the model. If it
+                is not None, registering the same name again with an equal
+                definition does nothing.
+            recipe (tuple, optional): A picklable tuple (function, args, kwargs)
+                that registers the same model when called in another process.
+
+        Raises:
+            ValueError: If the name is already registered otherwise.
+        """
+
+        with self._lock:
+            entry = self._loaders.get(name)
+            if entry is not None:
+                if definition is not None and entry[1] == definition:
+                    return
+                raise ValueError(f'solar model is already defined: {name}')
+
+            self._loaders[name] = (loader, definition, recipe)
+
+    def load(self, name):
+        """
+        Load a model.
+
+        Args:
+            name (str): The name of the model, in lower case.
+
+        Returns:
+            Spectrum: The model's spectrum in its native units.
+
+        Raises:
+            ValueError: If the model is undefined.
+        """
+
+        if name not in self:
+            raise ValueError(f'undefined solar model: {name} (valid models are: '
+                             f'{", ".join(self.names())})')
+
+        return self._loaders[name][0](name)
+
+    def recipe(self, name):
+        """
+        The recipe that registers a model in another process.
+
+        Args:
+            name (str): The name of the model, in lower case.
+
+        Returns:
+            tuple or None: The tuple (function, args, kwargs) given when the model
+            was registered; None if there was none or the model is undefined.
+        """
+
+        entry = self._loaders.get(name)
+        return None if entry is None else entry[2]
+
+    def names(self):
+        """
+        The names of the models.
+
+        Returns:
+            list: The names, in order of registration.
+        """
+
+        self._discover()
+        return list(self._loaders)
+
+    def __contains__(self, name):
+        if name in self._loaders:
+            return True
+
+        self._discover()
+        return name in self._loaders
+
+    def _discover(self):
+        """
+        Register the models provided by other packages, once.
+
+        An entry point never replaces a model that is already registered.
+        """
+
+        if self._discovered:
+            return
+
+        # Imported here because the import is slow and rarely needed
+        import importlib.metadata
+
+        with self._lock:
+            if self._discovered:
+                return
+
+            try:
+                entry_points = importlib.metadata.entry_points(group=self._group)
+            except TypeError:       # pragma: no cover (Python < 3.10)
+                entry_points = importlib.metadata.entry_points().get(self._group,
+                                                                     [])
+
+            for entry_point in entry_points:
+                name = entry_point.name.lower()
+                if name not in self._loaders:
+                    self._loaders[name] = (self._entry_point_loader(entry_point),
+                                           None, None)
+
+            self._discovered = True
+
+    def _entry_point_loader(self, entry_point):
+        """
+        The loader of a model provided by an entry point.
+
+        Args:
+            entry_point (EntryPoint): The entry point.
+
+        Returns:
+            callable: A function that takes the name and returns the spectrum.
+        """
+
+        return lambda name: self._load_entry_point(entry_point.load())
+
+################################################################################
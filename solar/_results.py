@@ -0,0 +1,154 @@
+################################################################################
+# solar/_results.py: Persistent cache of computed results in an SQLite database.
+################################################################################
+
+import os
+import sqlite3
+import threading
+import time
+
+# Failures of the cache that are never raised to the caller
+_ERRORS = (sqlite3.Error, OSError)
+
+
+class ResultCache(object):
+    """
+    A persistent least-recently-used cache of floats, keyed by strings.
+
+    The values are kept in an SQLite database in write-ahead-log mode, so any
+    number of threads and processes can read and write the same cache at once.
+    Each process and thread uses its own connection, opened on first use. When
+    the number of values exceeds `max_entries`, the least recently used values
+    are deleted.
+
+    The cache never raises a database error: a value that cannot be read is a
+    miss, and a value that cannot be written is dropped.
+    """
+
+    def __init__(self, path, max_entries=None, timeout=30.):
+        """
+        Constructor for a ResultCache.
+
+        Args:
+            path (str): The path of the database file, which is created if
+                necessary.
+            max_entries (int, optional): The maximum number of cached values;
+                None for no limit.
+            timeout (float, optional): The number of seconds to wait for another
+                writer before giving up.
+
+        Raises:
+            ValueError: If `max_entries` is negative.
+        """
+
+        if max_entries is not None and max_entries < 0:
+            raise ValueError(f'invalid cache max_entries: {max_entries}')
+
+        self.path = path
+        self.max_entries = max_entries
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def get(self, key):
+        """
+        The cached value for a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            float or None: The value, or None if it is not cached.
+        """
+
+        try:
+            with self._connection() as connection:
+                row = connection.execute('SELECT value FROM results WHERE key = ?',
+                                         (key,)).fetchone()
+                if row is None:
+                    return None
+                connection.execute('UPDATE results SET used = ? WHERE key = ?',
+                                   (time.time(), key))
+        except _ERRORS:
+            return None
+
+        return row[0]
+
+    def put(self, key, value):
+        """
+        Cache a value, evicting the least recently used values as necessary.
+
+        Args:
+            key (str): The cache key.
+            value (float): The value.
+
+        Returns:
+            bool: True if the value was cached.
+        """
+
+        try:
+            with self._connection() as connection:
+                connection.execute('INSERT OR REPLACE INTO results (key, value, used) '
+                                   'VALUES (?, ?, ?)', (key, float(value),
+                                                        time.time()))
+                if self.max_entries is not None:
+                    (count,) = connection.execute('SELECT COUNT(*) FROM results'
+                                                  ).fetchone()
+                    if count > self.max_entries:
+                        connection.execute('DELETE FROM results WHERE key IN '
+                                           '(SELECT key FROM results '
+                                           'ORDER BY used LIMIT ?)',
+                                           (count - self.max_entries,))
+        except _ERRORS:
+            return False
+
+        return True
+
+    def clear(self):
+        """
+        Remove every value from the cache.
+        """
+
+        try:
+            with self._connection() as connection:
+                connection.execute('DELETE FROM results')
+        except _ERRORS:
+            pass
+
+    def __len__(self):
+        try:
+            (count,) = self._connection().execute('SELECT COUNT(*) FROM results'
+                                                  ).fetchone()
+        except _ERRORS:
+            return 0
+
+        return count
+
+    def _connection(self):
+        """
+        The database connection of this process and thread, opened if necessary.
+
+        A connection is never shared with a child process, which opens its own.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            connection = sqlite3.connect(self.path, timeout=self._timeout)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('CREATE TABLE IF NOT EXISTS results '
+                               '(key TEXT PRIMARY KEY, value REAL, used REAL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS results_used '
+                               'ON results (used)')
+            local.connection = connection
+            local.pid = os.getpid()
+
+        return local.connection
+
+################################################################################
@@ -0,0 +1,175 @@
+################################################################################
+# solar/_shared.py: Model spectra published in shared memory for other processes.
+################################################################################
+
+import atexit
+import json
+import os
+import secrets
+import sys
+
+import numpy as np
+
+from solar._spectrum import Spectrum
+
+# The environment variable through which child processes find the published
+# spectra. It holds a JSON object that maps each model name to the name of its
+# shared memory block, the number of samples, and the units.
+ENVIRONMENT_VARIABLE = 'RMS_SOLAR_SHARED_MODELS'
+
+_PUBLISHED = {}     # model -> SharedMemory created by this process
+_ATTACHED = {}      # model -> SharedMemory attached by this process
+_PUBLISHER = None   # ID of the process that created the blocks in _PUBLISHED
+
+#===============================================================================
+def manifest():
+    """
+    The spectra published in shared memory, as visible to this process.
+
+    Returns:
+        dict: For each model name, a dict with keys "name", "size", "units", and
+        "xunits".
+    """
+
+    try:
+        data = json.loads(os.environ.get(ENVIRONMENT_VARIABLE) or '{}')
+    except ValueError:
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+#===============================================================================
+def publish(model, spectrum):
+    """
+    Copy a spectrum into a new shared memory block and announce it.
+
+    The block is announced through the environment, so it is visible to every
+    child process started afterward, however it is started. The block is removed
+    by `release`, or when this process exits.
+
+    Args:
+        model (str): The model name, in lower case.
+        spectrum (Spectrum): The spectrum, with attributes `units` and `xunits`.
+    """
+
+    from multiprocessing import shared_memory
+
+    global _PUBLISHER
+
+    # A forked child does not own the blocks published by its parent
+    if _PUBLISHER != os.getpid():
+        _PUBLISHED.clear()
+        _PUBLISHER = os.getpid()
+        atexit.register(release)
+
+    if model in _PUBLISHED:
+        return
+
+    size = spectrum.x.size
+    block = shared_memory.SharedMemory(create=True, size=2 * size * 8,
+                                       name=f'rms_solar_{secrets.token_hex(4)}')
+    array = np.ndarray((2, size), dtype=np.float64, buffer=block.buf)
+    array[0] = spectrum.x
+    array[1] = spectrum.y
+    del array
+
+    _PUBLISHED[model] = block
+    entries = manifest()
+    entries[model] = {'name': block.name, 'size': size, 'units': spectrum.units,
+                      'xunits': spectrum.xunits}
+    os.environ[ENVIRONMENT_VARIABLE] = json.dumps(entries)
+
+#===============================================================================
+def attach(model):
+    """
+    A spectrum published in shared memory by another process, if there is one.
+
+    Args:
+        model (str): The model name, in lower case.
+
+    Returns:
+        Spectrum or None: The spectrum, whose read-only arrays are views of the
+        shared memory block, or None if the model is not published or its block
+        no longer exists.
+    """
+
+    entry = manifest().get(model)
+    if not isinstance(entry, dict):
+        return None
+
+    try:
+        block = _open(entry['name'])
+        array = np.ndarray((2, int(entry['size'])), dtype=np.float64,
+                           buffer=block.buf)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    array.flags.writeable = False
+    _ATTACHED[model] = block
+    return Spectrum(array[0], array[1], units=entry['units'],
+                    xunits=entry['xunits'])
+
+#===============================================================================
+def _open(name):
+    """
+    Attach to an existing shared memory block without taking ownership of it.
+
+    Normally, Python's resource tracker removes every block that a process has
+    attached to when that process exits, which would remove the block from under
+    every other process. The block belongs to the process that published it.
+
+    Args:
+        name (str): The name of the block.
+
+    Returns:
+        SharedMemory: The block.
+    """
+
+    # Imported here because the import is slow and sharing is rarely used
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    block = shared_memory.SharedMemory(name=name)
+
+    # Only POSIX systems have a resource tracker; on Windows, a block is removed
+    # when its last handle is closed
+    if os.name == 'posix':
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(block._name, 'shared_memory')
+
+    return block
+
+#===============================================================================
+def release():
+    """
+    Remove the shared memory blocks published by this process.
+
+    Processes that are already attached keep their views of the data; new
+    processes load the models from their files instead. This does nothing in
+    a child process, which does not own the blocks it inherited.
+    """
+
+    if os.getpid() != _PUBLISHER:
+        return
+
+    entries = manifest()
+    for (model, block) in list(_PUBLISHED.items()):
+        try:
+            block.close()
+        except BufferError:     # pragma: no cover
+            pass
+        try:
+            block.unlink()
+        except OSError:         # pragma: no cover
+            pass
+        entries.pop(model, None)
+        del _PUBLISHED[model]
+
+    if entries:
+        os.environ[ENVIRONMENT_VARIABLE] = json.dumps(entries)
+    else:
+        os.environ.pop(ENVIRONMENT_VARIABLE, None)
+
+################################################################################
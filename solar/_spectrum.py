@@ -0,0 +1,467 @@
+################################################################################
+# solar/_spectrum.py: Model spectra with precomputed lookup structures.
+################################################################################
+
+import hashlib
+import threading
+
+import numpy as np
+import tabulation as tab
+
+# Largest number of bins in the lookup index per sample of the spectrum
+MAX_INDEX_BINS_PER_SAMPLE = 8
+
+# Approximate number of grid cells summed at a time by the integrals
+CELL_CHUNK_SIZE = 1 << 20
+
+# Version of the integration algorithm. It is part of the keys and names under
+# which integrals are saved, so those saved by an earlier version are recomputed.
+INTEGRATION_VERSION = 2
+
+
+class Spectrum(object):
+    """
+    A model spectrum in fixed units, sampled on a monotonically increasing grid.
+
+    The spectrum is linear between its samples and zero outside its domain, like
+    the Tabulation it represents. Lookup structures used to integrate it are
+    built lazily on first use and then kept for the life of the object, which is
+    normally the life of its entry in the spectrum cache. Each is built once,
+    under a lock, and is read-only, so a Spectrum can be shared by any number of
+    threads.
+    """
+
+    def __init__(self, x, y, tabulation=None, units=None, xunits=None):
+        """
+        Constructor for a Spectrum.
+
+        Args:
+            x (np.ndarray): The monotonically increasing x-coordinates.
+            y (np.ndarray): The y-values at each x-coordinate.
+            tabulation (Tabulation, optional): The equivalent Tabulation, if it
+                already exists.
+            units (str, optional): Units of y, if known.
+            xunits (str, optional): Units of x, if known.
+        """
+
+        self.x = x
+        self.y = y
+        self.units = units
+        self.xunits = xunits
+        self._tabulation = tabulation
+        self._cumulative = None
+        self._index = None
+        self._kernels = {}
+        self._fingerprint = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def from_tabulation(tabulation, units=None, xunits=None):
+        """
+        The Spectrum equivalent to a Tabulation.
+
+        Args:
+            tabulation (Tabulation): The Tabulation.
+            units (str, optional): Units of the Tabulation's y, if known.
+            xunits (str, optional): Units of the Tabulation's x, if known.
+
+        Returns:
+            Spectrum: A Spectrum sharing the arrays of the Tabulation.
+        """
+
+        return Spectrum(tabulation.x, tabulation.y, tabulation, units, xunits)
+
+    @property
+    def tabulation(self):
+        """The Tabulation of this spectrum."""
+
+        if self._tabulation is None:
+            with self._lock:
+                if self._tabulation is None:
+                    tabulation = tab.Tabulation(self.x, self.y)
+                    tabulation.x.flags.writeable = False
+                    tabulation.y.flags.writeable = False
+                    self._tabulation = tabulation
+
+        return self._tabulation
+
+    @property
+    def nbytes(self):
+        """
+        The memory used by this spectrum, including its cumulative integrals,
+        lookup index, and kernels if they have been built.
+        """
+
+        return 2 * self.x.nbytes + self._derived_nbytes()
+
+    def _derived_nbytes(self):
+        """
+        The memory used by the cumulative integrals, lookup index, and kernels
+        built so far.
+        """
+
+        nbytes = 0
+        cumulative = self._cumulative
+        if cumulative is not None:
+            nbytes += cumulative[0].nbytes + cumulative[1].nbytes
+
+        index = self._index
+        if index is not None:
+            nbytes += index[2].nbytes + index[3].nbytes
+
+        return nbytes + sum(kernel.nbytes for kernel in list(self._kernels.values()))
+
+    @property
+    def fingerprint(self):
+        """A hexadecimal digest that identifies the samples of this spectrum."""
+
+        if self._fingerprint is None:
+            digest = hashlib.sha1(np.ascontiguousarray(self.x).tobytes())
+            digest.update(np.ascontiguousarray(self.y).tobytes())
+            self._fingerprint = digest.hexdigest()
+
+        return self._fingerprint
+
+    @property
+    def cumulative(self):
+        """
+        The cumulative trapezoidal integrals of y and of x*y.
+
+        This is a tuple (c0, c1) of arrays the same size as x, where c0[i] is the
+        trapezoidal integral of y from x[0] to x[i] and c1[i] is the same for x*y.
+        """
+
+        if self._cumulative is None:
+            with self._lock:
+                if self._cumulative is None:
+                    self._cumulative = self._build_cumulative()
+
+        return self._cumulative
+
+    def _build_cumulative(self):
+        """
+        Compute the cumulative integrals returned by the `cumulative` property.
+        """
+
+        x = self.x
+        y = self.y
+        dx = np.diff(x)
+        xy = x * y
+
+        c0 = np.zeros(x.size)
+        c1 = np.zeros(x.size)
+        np.cumsum(0.5 * (y[:-1] + y[1:]) * dx, out=c0[1:])
+        np.cumsum(0.5 * (xy[:-1] + xy[1:]) * dx, out=c1[1:])
+        c0.flags.writeable = False
+        c1.flags.writeable = False
+
+        return (c0, c1)
+
+    @property
+    def index(self):
+        """
+        A lookup table that locates any x in the grid in constant time.
+
+        This is a tuple (u0, scale, table, slopes). The domain is divided into
+        bins uniform in ln(x), each normally no wider than the narrowest grid
+        cell, and table[b] is the index of the grid cell that contains the start
+        of bin b. The cell containing x is therefore table[b] or, rarely, a
+        neighbor, where b = int((ln(x) - u0) * scale). slopes[i] is the slope of
+        the spectrum in cell i.
+        """
+
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._build_index()
+
+        return self._index
+
+    def _build_index(self):
+        """
+        Compute the lookup table returned by the `index` property.
+        """
+
+        x = self.x
+        u = np.log(x)
+        span = u[-1] - u[0]
+        nbins = int(min(span / np.min(np.diff(u)),
+                        MAX_INDEX_BINS_PER_SAMPLE * x.size)) + 1
+        scale = nbins / span
+
+        starts = u[0] + np.arange(nbins) / scale
+        table = np.searchsorted(u, starts, side='right') - 1
+        np.clip(table, 0, x.size - 2, out=table)
+        slopes = np.diff(self.y) / np.diff(x)
+        table.flags.writeable = False
+        slopes.flags.writeable = False
+
+        return (u[0], scale, table, slopes)
+
+    def evaluate(self, x, out=None):
+        """
+        The spectrum at arbitrary x-coordinates; zero outside its domain.
+
+        The result is identical to that of np.interp, and to evaluating the
+        Tabulation. Sorted input is evaluated by np.interp, which exploits the
+        order; otherwise each x is located in the grid via the lookup index, in
+        constant time, so the cost is purely vectorized.
+
+        Args:
+            x (np.ndarray): The x-coordinates.
+            out (np.ndarray, optional): An array of float64, with the same shape
+                as `x`, into which to write the result.
+
+        Returns:
+            np.ndarray: The values, which are in `out` if it was provided.
+        """
+
+        grid = self.x
+        y = self.y
+        if out is None:
+            out = np.empty(np.shape(x))
+
+        if (grid[0] <= 0. or x.size < 2 or np.all(x[1:] >= x[:-1])):
+            out[...] = np.interp(x, grid, y, left=0., right=0.)
+            return out
+
+        (u0, scale, table, slopes) = self.index
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bins = ((np.log(x) - u0) * scale).astype(np.int64)
+        np.clip(bins, 0, table.size - 1, out=bins)
+        j = table[bins]
+
+        # Step forward to the cell containing x, and back once for round-off
+        last = grid.size - 2
+        while True:
+            step = (x >= grid[j + 1]) & (j < last)
+            if not step.any():
+                break
+            j += step
+        j -= (x < grid[j]) & (j > 0)
+
+        np.multiply(slopes[j], x - grid[j], out=out)
+        out += y[j]
+        out[(x < grid[0]) | (x > grid[-1])] = 0.
+        out[x == grid[-1]] = y[-1]
+        return out
+
+    def kernel(self, key, builder):
+        """
+        A read-only array derived from this spectrum, built once on first use.
+
+        Kernels are the precomputed arrays, such as alternative x grids and
+        Jacobians, that turn a unit conversion into a single multiply.
+
+        Args:
+            key (hashable): The name of the kernel.
+            builder (callable): A function of no arguments that returns the
+                array, called only if the kernel does not exist yet.
+
+        Returns:
+            np.ndarray: The kernel.
+        """
+
+        array = self._kernels.get(key)
+        if array is None:
+            with self._lock:
+                array = self._kernels.get(key)
+                if array is None:
+                    array = builder()
+                    array.flags.writeable = False
+                    self._kernels[key] = array
+
+        return array
+
+    def integrals(self, lo, hi):
+        """
+        The integrals of the spectrum between pairs of limits.
+
+        Within a grid cell the spectrum is linear, so the trapezoidal integral
+        over a part of a cell is exact. Each integral is the sum of the cells
+        between its limits, plus the parts of the cells that contain them, so it
+        is identical to the trapezoidal integral over the union of the model grid
+        and the limits. The cells are summed directly, rather than as a
+        difference of cumulative integrals, so the result is as accurate far from
+        the peak of the spectrum as near it.
+
+        Args:
+            lo (np.ndarray): The lower limits of integration, which must be within
+                the domain.
+            hi (np.ndarray): The upper limits, of the same shape, which must be
+                within the domain and no less than the lower limits.
+
+        Returns:
+            np.ndarray: The integrals, with the shape of the limits.
+        """
+
+        x = self.x
+        y = self.y
+        areas = self.kernel('cell_areas',
+                            lambda: 0.5 * (y[:-1] + y[1:]) * np.diff(x))
+
+        shape = np.shape(lo)
+        lo = np.ravel(lo)
+        hi = np.ravel(hi)
+        y_lo = np.interp(lo, x, y)
+        y_hi = np.interp(hi, x, y)
+
+        # Grid points strictly inside each interval run from index i to k
+        i = np.searchsorted(x, lo, side='right')
+        k = np.searchsorted(x, hi, side='left') - 1
+        inside = i <= k
+        full = np.zeros(lo.size)
+        for (interval, cells) in _cells(i, k):
+            full += np.bincount(interval, areas[cells], minlength=lo.size)
+
+        i = np.minimum(i, x.size - 1)
+        k = np.maximum(k, 0)
+        left = 0.5 * (y_lo + y[i]) * (x[i] - lo)
+        right = 0.5 * (y[k] + y_hi) * (hi - x[k])
+        result = np.where(inside, full + left + right, 0.5 * (y_lo + y_hi) * (hi - lo))
+        return result.reshape(shape)
+
+    def boxcar_means(self, xmin, xmax):
+        """
+        The mean of the spectrum between pairs of limits.
+
+        Each interval is restricted to the domain of the spectrum. An interval of
+        zero width within the domain returns the value of the spectrum at that
+        point; an interval entirely outside the domain returns NaN.
+
+        Args:
+            xmin (array-like): The lower limits.
+            xmax (array-like): The upper limits.
+
+        Returns:
+            np.ndarray: The means, with the broadcasted shape of the limits.
+        """
+
+        (xmin, xmax) = np.broadcast_arrays(np.asarray(xmin, dtype=np.float64),
+                                           np.asarray(xmax, dtype=np.float64))
+        lo = np.clip(np.minimum(xmin, xmax), self.x[0], self.x[-1])
+        hi = np.clip(np.maximum(xmin, xmax), self.x[0], self.x[-1])
+        overlap = (np.maximum(xmin, xmax) >= self.x[0]) & (np.minimum(xmin, xmax)
+                                                           <= self.x[-1])
+
+        width = hi - lo
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = self.integrals(lo, hi) / width
+
+        means = np.where(width > 0., means, np.interp(lo, self.x, self.y))
+        return np.where(overlap, means, np.nan)
+
+    def bandpass_integrals(self, bp_x, bp_y):
+        """
+        Integrate the spectrum times each of a stack of bandpasses.
+
+        Each bandpass is linear between its own samples, so over one bandpass
+        segment the trapezoidal integral of the product, evaluated at the union of
+        the model and bandpass x-coordinates, is the sum of the products over the
+        model cells within the segment, plus two partial model cells at the
+        segment ends. This is exactly the integral that Tabulation multiplication
+        followed by Tabulation.integral() would compute, but it is evaluated for
+        every segment of every bandpass at once. Each cell is summed directly,
+        rather than as a difference of cumulative integrals, so the result is as
+        accurate far from the peak of the spectrum as near it.
+
+        Args:
+            bp_x (np.ndarray): The 2-D, NaN-padded bandpass x-coordinates.
+            bp_y (np.ndarray): The 2-D bandpass fractions.
+
+        Returns:
+            tuple: A tuple (numer, denom) of 1-D arrays, containing for each
+            bandpass the integral of the spectrum times the bandpass and the
+            integral of the bandpass, both restricted to the domain of the
+            spectrum.
+        """
+
+        x = self.x
+        y = self.y
+
+        # Orient every bandpass segment so that xa <= xb
+        xa = bp_x[:, :-1]
+        xb = bp_x[:, 1:]
+        ta = bp_y[:, :-1]
+        tb = bp_y[:, 1:]
+
+        swap = xa > xb
+        (xa, xb) = (np.where(swap, xb, xa), np.where(swap, xa, xb))
+        (ta, tb) = (np.where(swap, tb, ta), np.where(swap, ta, tb))
+
+        # Clip each segment to the model domain and discard the empty ones; NaN
+        # padding fails the comparison and is discarded too
+        lo = np.maximum(xa, x[0])
+        hi = np.minimum(xb, x[-1])
+        mask = hi > lo
+        rows = np.nonzero(mask)[0]
+
+        xa = xa[mask]
+        ta = ta[mask]
+        lo = lo[mask]
+        hi = hi[mask]
+        slope = (tb[mask] - ta) / (xb[mask] - xa)
+
+        # Bandpass and model values at the ends of each clipped segment
+        t_lo = ta + slope * (lo - xa)
+        t_hi = ta + slope * (hi - xa)
+        p_lo = t_lo * np.interp(lo, x, y)
+        p_hi = t_hi * np.interp(hi, x, y)
+
+        # Model grid points strictly inside each segment run from index i to k
+        i = np.searchsorted(x, lo, side='right')
+        k = np.searchsorted(x, hi, side='left') - 1
+        inside = i <= k
+        full = np.zeros(i.size)
+        for (segment, j) in _cells(i, k):
+            t_j = ta[segment] + slope[segment] * (x[j] - xa[segment])
+            t_next = ta[segment] + slope[segment] * (x[j+1] - xa[segment])
+            full += np.bincount(segment, 0.5 * (t_j * y[j] + t_next * y[j+1])
+                                * (x[j+1] - x[j]), minlength=i.size)
+
+        i = np.minimum(i, x.size - 1)
+        k = np.maximum(k, 0)
+        x_i = x[i]
+        x_k = x[k]
+        left = 0.5 * (p_lo + (ta + slope * (x_i - xa)) * y[i]) * (x_i - lo)
+        right = 0.5 * ((ta + slope * (x_k - xa)) * y[k] + p_hi) * (hi - x_k)
+
+        numer = np.where(inside, full + left + right,
+                         0.5 * (p_lo + p_hi) * (hi - lo))
+        denom = 0.5 * (t_lo + t_hi) * (hi - lo)
+
+        nbands = bp_x.shape[0]
+        return (np.bincount(rows, numer, minlength=nbands),
+                np.bincount(rows, denom, minlength=nbands))
+
+#===============================================================================
+def _cells(start, stop, chunk_size=CELL_CHUNK_SIZE):
+    """
+    The grid cells within each of many ranges, a bounded number at a time.
+
+    Args:
+        start (np.ndarray): The index of the first cell of each range.
+        stop (np.ndarray): The index after the last cell of each range; a range
+            with stop <= start is empty.
+        chunk_size (int, optional): The approximate number of cells per chunk. A
+            single range is never divided.
+
+    Yields:
+        tuple: A tuple (ranges, cells) of 1-D arrays of the same size, with the
+        index of a range and the index of one of its cells.
+    """
+
+    counts = np.maximum(stop - start, 0)
+    ends = np.cumsum(counts)
+    first = 0
+    while first < counts.size:
+        last = max(int(np.searchsorted(ends, ends[first] - counts[first]
+                                       + chunk_size, side='right')), first + 1)
+        sizes = counts[first:last]
+        ranges = np.repeat(np.arange(first, last), sizes)
+        offsets = np.arange(ranges.size) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        yield (ranges, start[ranges] + offsets)
+        first = last
+
+################################################################################
@@ -0,0 +1,63 @@
+################################################################################
+# solar/_store.py: Thread-safe store of values loaded once per key.
+################################################################################
+
+import threading
+
+
+class ModelStore(object):
+    """
+    A thread-safe store of values, each loaded exactly once on first use.
+
+    Reading a value that is already loaded takes no lock: it is a single
+    dictionary lookup, which is atomic in CPython and in free-threaded builds.
+    The first request for a key takes a lock that belongs to that key only, so
+    concurrent first requests for one key wait for a single load, while requests
+    for other keys proceed. A load that raises an exception stores nothing, and
+    the next request tries again.
+    """
+
+    def __init__(self, loader):
+        """
+        Constructor for a ModelStore.
+
+        Args:
+            loader (callable): A function that takes a key and returns its value,
+                which must not be None.
+        """
+
+        self._loader = loader
+        self._values = {}
+        self._locks = {}
+        self._lock = threading.Lock()   # protects self._locks only
+
+    def get(self, key):
+        """
+        The value for a key, loaded if this is the first request for it.
+
+        Args:
+            key (hashable): The key.
+
+        Returns:
+            object: The value.
+        """
+
+        value = self._values.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            value = self._values.get(key)
+            if value is None:
+                value = self._loader(key)
+                self._values[key] = value
+
+        return value
+
+    def __contains__(self, key):
+        return key in self._values
+
+################################################################################
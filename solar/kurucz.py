@@ -5,9 +5,9 @@
 ################################################################################
 
 import numpy as np
-import os
 
 import solar
+import solar._data as data
 import tabulation as tab
 
 # From http://kurucz.harvard.edu/stars/sun/00asun.readme
@@ -28,20 +28,35 @@ import tabulation as tab
 RSUN = 695700.
 FACTOR = 4 * np.pi * (RSUN/solar.AU)**2
 
-# Read the file
-filepath = os.path.join(os.path.split(solar.__file__)[0],
-                        'data_files', 'kurucz-fsunallp.2000resam125.txt')
-array = np.fromfile(filepath, sep=' ')
-array = array.reshape(-1, 3)
+# Read the file. The text is parsed only once; afterward, a binary copy of the
+# wavelength and flux density columns is memory-mapped from the user's cache
+# directory, so every process shares the same pages.
+filepath = data.data_file_path('kurucz-fsunallp.2000resam125.txt')
 
-# column 1 is wavelength in nm
-# column 2 "flux moment"; see notes above for conversion
 
-wavelength = array[:, 0]
-flux = array[:, 1] * FACTOR
+def _flux_density_columns(path):
+    # column 1 is wavelength in nm
+    # column 2 "flux moment"; see notes above for conversion
+    table = np.fromfile(path, sep=' ').reshape(-1, 3)
+    return (table[:, 0], table[:, 1] * FACTOR)
+
+
+(WAVELENGTH, FLUX) = data.load_columns(filepath, _flux_density_columns,
+                                       suffix='flux_density.npy')
+wavelength = WAVELENGTH
+flux = FLUX
 
-FLUX_DENSITY = tab.Tabulation(wavelength, flux)
 UNITS = 'W/m^2/um'
 XUNITS = 'nm'
 
+
+def __getattr__(name):
+    # The Tabulation copies the arrays, so it is built only if it is requested
+    if name == 'FLUX_DENSITY':
+        global FLUX_DENSITY
+        FLUX_DENSITY = tab.Tabulation(WAVELENGTH, FLUX)
+        return FLUX_DENSITY
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 ################################################################################
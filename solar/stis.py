@@ -4,25 +4,40 @@
 # From Bohlin, Dickinson, & Calzetti 2001, Astron. J.
 ################################################################################
 
-import os
+import numpy as np
 
-import astropy.io.fits as pyfits
-import solar
+import solar._data as data
 import tabulation as tab
 
-# Read the file
-filepath = os.path.join(os.path.split(solar.__file__)[0],
-                        'data_files', 'stis-sun_reference_stis_002.fits')
-hdulist = pyfits.open(filepath)
-try:
-    table = hdulist[1].data
-    wavelength = table['WAVELENGTH']    # Angstroms
-    flux = table['FLUX']                # erg/s/cm^2/A
-finally:
-    hdulist.close()
-
-FLUX_DENSITY = tab.Tabulation(wavelength, flux)
+
+def _read_columns(filepath):
+    # astropy is needed only if the prebuilt binary copy is missing
+    import astropy.io.fits as pyfits
+
+    with pyfits.open(filepath) as hdulist:
+        table = hdulist[1].data
+        return (np.array(table['WAVELENGTH']),    # Angstroms
+                np.array(table['FLUX']))          # erg/s/cm^2/A
+
+
+# Read the file. WAVELENGTH and FLUX are read-only memory-mapped views of the
+# native-endian binary copy of the columns shipped in data_files. Without it,
+# the columns are extracted with astropy into the user's cache directory.
+filepath = data.data_file_path('stis-sun_reference_stis_002.fits')
+(WAVELENGTH, FLUX) = data.load_columns(filepath, _read_columns)
+
 UNITS = 'erg/s/cm^2/A'
 XUNITS = 'A'
 
+
+def __getattr__(name):
+    # The Tabulation copies the arrays, so it is built only if it is requested;
+    # the model itself is computed from the memory-mapped arrays
+    if name == 'FLUX_DENSITY':
+        global FLUX_DENSITY
+        FLUX_DENSITY = tab.Tabulation(WAVELENGTH, FLUX)
+        return FLUX_DENSITY
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 ################################################################################
@@ -1,27 +1,27 @@
 ################################################################################
 # solar/stis_rieke.py: STIS and Rieke models merged.
+#
+# This is a composite model: the STIS model over its whole domain, followed by
+# the Rieke model beyond it. The merged spectrum is spliced from views of the two
+# models' arrays when it is first used, so importing this module loads nothing.
 ################################################################################
 
-import numpy as np
+# The models that make up this one, in order of increasing wavelength, and the
+# wavelengths at which each gives way to the next, in the XUNITS of the first.
+# None is the end of the previous model's domain.
+COMPONENTS = ('stis', 'rieke')
+SPLICES = (None,)
 
-import solar.stis as stis
-import solar.rieke as rieke
+UNITS = 'erg/s/cm^2/A'
+XUNITS = 'A'
 
-import tabulation as tab
 
-assert stis.UNITS == rieke.UNITS
-assert stis.XUNITS == rieke.XUNITS
+def __getattr__(name):
+    # The merged Tabulation is built only if it is requested
+    if name == 'FLUX_DENSITY':
+        import solar
+        return solar._model_spectrum('stis_rieke').tabulation
 
-tab1 = stis.FLUX_DENSITY
-tab2 = rieke.FLUX_DENSITY
-
-mask = (tab2.x > np.max(tab1.x))
-
-merged_x = np.hstack((tab1.x, tab2.x[mask]))
-merged_y = np.hstack((tab1.y, tab2.y[mask]))
-
-FLUX_DENSITY = tab.Tabulation(merged_x, merged_y)
-UNITS = stis.UNITS
-XUNITS = stis.XUNITS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 ################################################################################
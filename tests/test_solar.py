@@ -2,9 +2,23 @@
 # tests/test_solar.py
 ################################################################################
 
+import concurrent.futures
+import functools
+import importlib.metadata
+import multiprocessing
 import numpy as np
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
+from unittest import mock
+
 import solar
+import solar._data
+import solar._fake
 import tabulation as tab
 
 
@@ -12,6 +26,43 @@ NAMES = ['STIS_Rieke', 'stis', 'RIEKE', 'Kurucz', 'Colina']
 UNITS = list(solar.UNIT_DICT.keys())
 XUNITS = list(solar.XUNIT_DICT.keys())
 
+# The fake model used by many tests
+solar.register_model('_fake', solar._fake.FLUX_DENSITY, units=solar._fake.UNITS,
+                     xunits=solar._fake.XUNITS)
+
+
+# The temporary cache directory of the test session and its environment patch
+_SESSION = {}
+
+
+def setUpModule():
+    # Binary copies of the model data and derived files are written to a
+    # temporary directory, not to the user's cache directory
+    _SESSION['dir'] = tempfile.mkdtemp()
+    _SESSION['environ'] = mock.patch.dict(os.environ, {'RMS_SOLAR_CACHE_DIR':
+                                                       _SESSION['dir']})
+    _SESSION['environ'].start()
+
+
+def tearDownModule():
+    _SESSION['environ'].stop()
+    solar.cache_clear()
+
+    # Models memory-mapped from the directory keep their files open, which
+    # prevents their removal on some systems
+    shutil.rmtree(_SESSION['dir'], ignore_errors=True)
+
+
+def _product_mean(bandpass, model):
+    # The mean by Tabulation multiplication and integration
+    product = bandpass * model
+    return product.integral() / bandpass.resample(product.x).integral()
+
+
+def _put_results(path, start, count):
+    cache = solar._results.ResultCache(path)
+    return sum(cache.put(f'key{i}', float(i)) for i in range(start, start + count))
+
 
 class TestSolar(unittest.TestCase):
     def test_flux_density(self):
@@ -77,9 +128,771 @@ class TestSolar(unittest.TestCase):
             self.assertTrue(np.allclose(model0.y, model2.y, rtol=1e-15, atol=1e-15))
             self.assertTrue(np.allclose(model0.y, model3.y, rtol=1e-15, atol=1e-15))
 
+        # An array of distances gives an object array of Tabulations, which
+        # match the rows of flux_density_array
+        models = solar.flux_density('Kurucz', sun_range=[[1., 2., 4.]])
+        self.assertEqual((models.shape, models.dtype), ((1, 3), object))
+        (x, y) = solar.flux_density_array('Kurucz', sun_range=[[1., 2., 4.]])
+        for (model, row) in zip(models[0], y[0]):
+            self.assertIsInstance(model, tab.Tabulation)
+            self.assertTrue(np.all(model.x == x))
+            self.assertTrue(np.allclose(model.y, row, rtol=1e-15, atol=0.))
+
         with self.assertRaises(ValueError):
             solar.flux_density('Fred')
 
+    def test_flux_density_array(self):
+        for name in NAMES:
+            for unit in UNITS:
+                for xunit in XUNITS:
+                    model = solar.flux_density(name, units=unit, xunits=xunit,
+                                               sun_range=2., solar_f=True)
+                    (x, y) = solar.flux_density_array(name, units=unit,
+                                                      xunits=xunit, sun_range=2.,
+                                                      solar_f=True)
+                    self.assertFalse(x.flags.writeable)
+                    self.assertTrue(x.flags.c_contiguous)
+                    self.assertTrue(y.flags.c_contiguous)
+                    self.assertTrue(np.all(np.diff(x) > 0.))
+                    self.assertTrue(np.all(x == model.x))
+                    self.assertTrue(np.allclose(y, model.y, rtol=1e-15, atol=0))
+
+        # The grid and Jacobian are computed once and reused
+        (x0, y0) = solar.flux_density_array('Kurucz', units='Jy', xunits='Hz')
+        (x1, y1) = solar.flux_density_array('Kurucz', units='Jy', xunits='Hz')
+        self.assertIs(x0, x1)
+        self.assertIsNot(y0, y1)
+
+        # Output buffer
+        out = np.empty(x0.shape)
+        (_, y2) = solar.flux_density_array('Kurucz', units='Jy', xunits='Hz',
+                                           out=out)
+        self.assertIs(y2, out)
+        self.assertTrue(np.all(out == y0))
+
+        # Array of distances
+        out = np.empty((3,) + x0.shape)
+        (_, y3) = solar.flux_density_array('Kurucz', units='Jy', xunits='Hz',
+                                           sun_range=[1., 2., 4.], out=out)
+        self.assertIs(y3, out)
+        self.assertTrue(np.allclose(y3[2], y0 / 16., rtol=1e-15, atol=0))
+
+        with self.assertRaises(ValueError):
+            solar.flux_density_array('Kurucz', out=np.empty(3))
+        with self.assertRaises(ValueError):
+            solar.flux_density_array('Kurucz', units='Fred')
+        with self.assertRaises(ValueError):
+            solar.flux_density_array('Fred')
+
+    def test_sample_flux_density(self):
+        rng = np.random.default_rng(7)
+        for name in NAMES:
+            for (unit, xunit, scale) in [('W/m^2/um', 'um', 1.),
+                                         ('Jy', 'nm', 1.e3),
+                                         ('W/m^2/Hz', 'Hz', None)]:
+                x = rng.uniform(0.1, 3., (40, 25))
+                x = solar.C_IN_UM_HZ / x if scale is None else x * scale
+                model = solar.flux_density(name, units=unit, xunits=xunit,
+                                           sun_range=3., solar_f=True)
+                values = solar.sample_flux_density(x, name, units=unit,
+                                                   xunits=xunit, sun_range=3.,
+                                                   solar_f=True, chunk_size=77)
+                self.assertEqual(values.shape, x.shape)
+                self.assertTrue(np.allclose(values, model(x), rtol=1e-14,
+                                            atol=0.))
+
+        # Zero outside the domain, exact at the samples, and scalar input
+        model = solar.flux_density('_fake')
+        values = solar.sample_flux_density([0.1, 0.16, 0.18, 0.66, 0.7],
+                                           '_fake')
+        self.assertTrue(np.all(values == [0., model.y[0], model.y[0],
+                                          model.y[-1], 0.]))
+        self.assertEqual(solar.sample_flux_density(0.18, '_fake', solar_f=True),
+                         1.)
+
+        # Output buffer and per-point distances
+        out = np.empty(3)
+        values = solar.sample_flux_density([0.18, 0.18, 0.62], '_fake',
+                                           solar_f=True, sun_range=[1., 2., 2.],
+                                           out=out, chunk_size=2)
+        self.assertIs(values, out)
+        self.assertTrue(np.allclose(out, [1., 0.25, 0.5]))
+
+        # Input that is not contiguous and broadcast distances are processed in
+        # bounded blocks, without full-size copies
+        x = rng.uniform(0.2, 3., (60, 100))[:, ::2]
+        sun_range = np.linspace(1., 2., 50)
+        evaluate = solar.Spectrum.evaluate
+        sizes = []
+
+        def record(spectrum, x, out=None):
+            sizes.append(x.size)
+            return evaluate(spectrum, x, out)
+
+        with mock.patch.object(solar.Spectrum, 'evaluate', record):
+            values = solar.sample_flux_density(x, 'Kurucz', sun_range=sun_range,
+                                               chunk_size=128)
+        self.assertEqual(sum(sizes), x.size)
+        self.assertLessEqual(max(sizes), 128)
+        self.assertTrue(np.allclose(values, solar.flux_density('Kurucz')(x)
+                                    / sun_range**2, rtol=1e-14, atol=0.))
+
+        with self.assertRaises(ValueError):
+            solar.sample_flux_density([0.18, 0.19], '_fake', out=np.empty(3))
+        with self.assertRaises(ValueError):
+            solar.sample_flux_density([0.18, 0.19], '_fake',
+                                      out=np.empty(4)[::2])
+
+    def test_iter_flux_density(self):
+        rng = np.random.default_rng(20)
+        with tempfile.TemporaryDirectory() as tempdir:
+            cube = np.lib.format.open_memmap(os.path.join(tempdir, 'cube.npy'),
+                                             mode='w+', shape=(50, 20, 30))
+            cube[...] = rng.uniform(0.1, 3., cube.shape)
+            cube.flush()
+            cube = np.load(os.path.join(tempdir, 'cube.npy'), mmap_mode='r')
+
+            # Blocks along the first axis, matching sample_flux_density
+            chunks = list(solar.iter_flux_density(cube, 'Kurucz', units='Jy',
+                                                  sun_range=2., solar_f=True,
+                                                  chunk_size=1000))
+            self.assertEqual([chunk.shape for chunk in chunks],
+                             [(1, 20, 30)] * 50)
+            expected = solar.sample_flux_density(np.array(cube), 'Kurucz',
+                                                 units='Jy', sun_range=2.,
+                                                 solar_f=True)
+            self.assertTrue(np.all(np.concatenate(chunks) == expected))
+
+            chunks = list(solar.iter_flux_density(cube, 'Kurucz', units='Jy',
+                                                  sun_range=2., solar_f=True,
+                                                  chunk_size=3000))
+            self.assertEqual(len(chunks), 10)
+            self.assertTrue(np.all(np.concatenate(chunks) == expected))
+            del cube, chunks
+
+        # Any iterable of chunks
+        stream = (rng.uniform(2000., 30000., 100) for _ in range(5))
+        values = list(solar.iter_flux_density(stream, 'STIS_Rieke', xunits='A'))
+        self.assertEqual(len(values), 5)
+        self.assertTrue(all(value.shape == (100,) for value in values))
+        self.assertTrue(all(np.all(value > 0.) for value in values))
+
+        # A distance cannot be broadcast across chunks
+        with self.assertRaises(ValueError):
+            list(solar.iter_flux_density([[0.5, 0.6]], 'Kurucz', sun_range=[1., 2.]))
+
+        # The lookup index matches np.interp exactly, including at the samples,
+        # outside the domain, in sorted or unsorted order, and for NaN
+        for name in NAMES:
+            for xunits in XUNITS:
+                spectrum = solar._unit_spectrum(name, 'W/m^2/um', xunits)
+                x = rng.uniform(0.9 * spectrum.x[0], 1.1 * spectrum.x[-1], 20000)
+                samples = spectrum.x[::10]
+                x[:samples.size] = samples
+                x[-3:] = [spectrum.x[0], spectrum.x[-1], np.nan]
+                expected = np.interp(x, spectrum.x, spectrum.y, left=0., right=0.)
+                values = spectrum.evaluate(x)
+                self.assertTrue(np.array_equal(values, expected, equal_nan=True))
+                self.assertTrue(np.array_equal(spectrum.evaluate(np.sort(x)),
+                                               np.interp(np.sort(x), spectrum.x,
+                                                         spectrum.y, left=0.,
+                                                         right=0.),
+                                               equal_nan=True))
+                self.assertIs(spectrum.index, spectrum.index)
+
+    def test_convolved_flux_density(self):
+        solar.cache_clear()
+
+        # Smoothing conserves flux away from the ends of the model
+        for name in ('STIS_Rieke', 'Kurucz'):
+            for resolution in (300., 3000., 1.e5):
+                model = solar.convolved_flux_density(name, resolution=resolution)
+                self.assertTrue(np.all(np.diff(model.x) > 0.))
+                ratio = (solar.mean_flux_density(1., 0.8, model) /
+                         solar.mean_flux_density(1., 0.8, name))
+                self.assertAlmostEqual(ratio, 1., delta=1.e-4)
+
+        # A low resolution removes structure; a very high one leaves the model
+        # nearly unchanged
+        x = np.linspace(0.4, 0.6, 2001)
+        original = solar.sample_flux_density(x, 'STIS')
+        smooth = solar.convolved_flux_density('STIS', resolution=50.)(x)
+        sharp = solar.convolved_flux_density('STIS', resolution=1.e5)
+        self.assertLess(np.std(np.diff(smooth, 2)),
+                        0.1 * np.std(np.diff(original, 2)))
+        centers = np.arange(0.4, 0.6, 0.005)
+        self.assertTrue(np.allclose(solar.mean_flux_density(centers, 0.005, sharp),
+                                    solar.mean_flux_density(centers, 0.005,
+                                                            'STIS'),
+                                    rtol=1.e-3))
+
+        # A tabulated Gaussian LSF matches the equivalent resolving power
+        sigma = 1. / (1000. * np.sqrt(8. * np.log(2.)))
+        offset = np.linspace(-6., 6., 401) * sigma
+        gaussian = np.exp(-0.5 * (offset / sigma)**2)
+        tabulated = solar.convolved_flux_density('STIS', lsf=(offset, gaussian))
+        expected = solar.convolved_flux_density('STIS', resolution=1000.)
+        self.assertTrue(np.allclose(tabulated(x), expected(x), rtol=1.e-3))
+
+        # Units, distance, and solar F are applied after smoothing, and the
+        # results are cached
+        info = solar.cache_info()
+        model = solar.convolved_flux_density('STIS', resolution=1000.,
+                                             units='Jy', xunits='Hz',
+                                             sun_range=2., solar_f=True)
+        self.assertEqual(solar.cache_info().hits, info.hits + 1)
+        wave = expected.x
+        converted = expected.y * wave**2 / solar.C_IN_UM_HZ * 1.e26 / 4. / np.pi
+        self.assertTrue(np.allclose(model.x, solar.C_IN_UM_HZ / wave[::-1],
+                                    rtol=1.e-12))
+        self.assertTrue(np.allclose(model.y, converted[::-1], rtol=1.e-12))
+
+        info = solar.cache_info()
+        self.assertIs(solar.convolved_flux_density('STIS', resolution=1000.),
+                      expected)
+        self.assertEqual(solar.cache_info().hits, info.hits + 2)
+
+        with self.assertRaises(ValueError):
+            solar.convolved_flux_density('STIS')
+        with self.assertRaises(ValueError):
+            solar.convolved_flux_density('STIS', resolution=100.,
+                                         lsf=(offset, gaussian))
+        with self.assertRaises(ValueError):
+            solar.convolved_flux_density('STIS', resolution=0.)
+
+    def test_resampled_flux_density(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            with mock.patch.dict(os.environ, {'RMS_SOLAR_CACHE_DIR': tempdir}):
+                solar.cache_clear()
+
+                # Grid points are multiples of the step, and each value is the
+                # mean of the model over its cell, so flux is conserved
+                model = solar.resampled_flux_density('STIS_Rieke', step=0.01)
+                first = model
+                self.assertTrue(np.allclose(model.x / 0.01,
+                                            np.round(model.x / 0.01)))
+                self.assertTrue(np.allclose(np.diff(model.x), 0.01))
+                means = solar.mean_flux_density(model.x, 0.01, 'STIS_Rieke')
+                self.assertTrue(np.allclose(model.y, means, rtol=1e-12))
+                self.assertEqual(len(os.listdir(tempdir)), 1)
+
+                # A log grid, units, distance, and solar F
+                model = solar.resampled_flux_density('Kurucz', step=1e-3,
+                                                     log=True, units='Jy',
+                                                     xunits='nm', sun_range=2.,
+                                                     solar_f=True)
+                log_x = np.log(model.x) / 1e-3
+                self.assertTrue(np.allclose(log_x, np.round(log_x)))
+                full = solar.mean_flux_density(model.x * np.cosh(5e-4),
+                                               2. * model.x * np.sinh(5e-4),
+                                               'Kurucz', units='Jy', xunits='nm')
+                self.assertTrue(np.allclose(model.y, full / 4. / np.pi,
+                                            rtol=1e-9))
+
+                # Bandpass integration becomes a dot product
+                model = solar.resampled_flux_density('STIS_Rieke', step=0.001,
+                                                     xmin=0.5, xmax=0.7)
+                self.assertAlmostEqual(model.x[0], 0.5)
+                self.assertAlmostEqual(model.x[-1], 0.7)
+                throughput = np.ones(model.x.size)
+                self.assertAlmostEqual(np.dot(model.y, throughput) /
+                                       np.sum(throughput),
+                                       solar.mean_flux_density(
+                                           0.6, 0.201, 'STIS_Rieke'),
+                                       delta=1e-12 * model.y[0])
+
+                # A second process loads the grid from the disk cache
+                solar.cache_clear()
+                with mock.patch.object(solar.Spectrum, 'boxcar_means') as means:
+                    again = solar.resampled_flux_density('STIS_Rieke',
+                                                         step=0.01)
+                    self.assertEqual(means.call_count, 0)
+                self.assertTrue(np.all(again.x == first.x))
+                self.assertTrue(np.all(again.y == first.y))
+
+                with self.assertRaises(ValueError):
+                    solar.resampled_flux_density('STIS', step=0.)
+                with self.assertRaises(ValueError):
+                    solar.resampled_flux_density('STIS', step=100.)
+                with self.assertRaises(ValueError):
+                    solar.resampled_flux_density('STIS', step=0.01, xmin=5.)
+
+                # Release the memory-mapped grids before the directory is removed
+                solar.cache_clear()
+                del model, first, again
+
+    def test_array_sun_range(self):
+        sun_range = np.array([[1., 2.], [4., 9.]])
+        expected = 1. / sun_range**2
+
+        models = solar.flux_density('Kurucz', sun_range=sun_range, solar_f=True)
+        self.assertEqual(models.shape, (2, 2))
+        model0 = solar.flux_density('Kurucz', solar_f=True)
+        for (index, model) in np.ndenumerate(models):
+            self.assertTrue(np.allclose(model.y, model0.y * expected[index],
+                                        rtol=1e-15, atol=0))
+
+        bandpass = tab.Tabulation((0.18, 0.19), (1, 1))
+        values = solar.bandpass_flux_density(bandpass, model='_fake',
+                                             solar_f=True, sun_range=sun_range)
+        self.assertTrue(np.allclose(values, expected))
+
+        values = solar.bandpass_f(bandpass, model='_fake', sun_range=sun_range)
+        self.assertTrue(np.allclose(values, expected))
+
+        values = solar.mean_flux_density(0.6, 0.04, model='_fake',
+                                         sun_range=sun_range)
+        self.assertTrue(np.allclose(values, np.pi * expected))
+
+        values = solar.mean_f(0.6, 0.04, model='_fake', sun_range=[1., 2.])
+        self.assertTrue(np.allclose(values, [1., 0.25]))
+
+        values = solar.bandpass_flux_densities([bandpass, bandpass], model='_fake',
+                                               solar_f=True,
+                                               sun_range=sun_range)
+        self.assertTrue(np.allclose(values, expected))
+
+        self.assertIsInstance(solar.flux_density('Kurucz', sun_range=2.),
+                              tab.Tabulation)
+
+    def test_cache(self):
+        try:
+            solar.cache_clear()
+            info = solar.cache_info()
+            self.assertEqual((info.hits, info.misses, info.entries,
+                              info.currbytes), (0, 0, 0, 0))
+
+            model0 = solar.flux_density('Kurucz', units='Jy')
+            solar.flux_density('kurucz', units='Jy', sun_range=2.)
+            solar.flux_density('KURUCZ', units='Jy', solar_f=True)
+            info = solar.cache_info()
+            self.assertEqual((info.hits, info.misses, info.entries), (2, 1, 1))
+            self.assertEqual(info.currbytes, 2 * model0.x.nbytes)
+
+            # LRU eviction by number of entries
+            solar.configure_cache(max_entries=2)
+            solar.flux_density('Kurucz', units='W/m^2/nm')
+            solar.flux_density('Kurucz', units='Jy')
+            solar.flux_density('Kurucz', units='uJy')
+            self.assertEqual(solar.cache_info().entries, 2)
+            solar.flux_density('Kurucz', units='Jy')
+            self.assertEqual(solar.cache_info().hits, 4)
+            solar.flux_density('Kurucz', units='W/m^2/nm')
+            self.assertEqual(solar.cache_info().misses, 4)
+
+            # LRU eviction by byte budget; an oversized spectrum is not stored
+            solar.configure_cache(max_bytes=info.currbytes)
+            info = solar.cache_info()
+            self.assertEqual((info.entries, info.max_bytes, info.max_entries),
+                             (1, info.currbytes, None))
+            solar.configure_cache(max_bytes=100)
+            model1 = solar.flux_density('Kurucz', units='Jy')
+            self.assertEqual(solar.cache_info().entries, 0)
+            self.assertTrue(np.all(model0.y == model1.y))
+
+            with self.assertRaises(ValueError):
+                solar.configure_cache(max_bytes=-1)
+
+            # A lookup index and kernels built later are counted when the spectrum
+            # is next requested
+            solar.configure_cache()
+            solar.cache_clear()
+            spectrum = solar._unit_spectrum('Kurucz', 'Jy', 'um')
+            currbytes = solar.cache_info().currbytes
+            (_, _, table, slopes) = spectrum.index
+            spectrum.kernel('test', lambda: np.zeros(10))
+            self.assertIs(solar._unit_spectrum('Kurucz', 'Jy', 'um'), spectrum)
+            self.assertEqual(solar.cache_info().currbytes,
+                             currbytes + table.nbytes + slopes.nbytes + 80)
+            self.assertEqual(spectrum.nbytes, solar.cache_info().currbytes)
+
+        finally:
+            solar.configure_cache()
+            solar.cache_clear()
+
+    def test_thread_safety(self):
+        # Many threads make their first requests for every model at once
+        loads = []
+        conversions = []
+
+        def load(key):
+            loads.append(key)
+            return solar._load_model(key)
+
+        def convert(model, units, xunits):
+            conversions.append((model, units, xunits))
+            return solar._convert_spectrum(solar._model_spectrum(model), units,
+                                           xunits)
+
+        nthreads = 32
+        barrier = threading.Barrier(nthreads)
+        results = [None] * nthreads
+        errors = []
+
+        def work(i):
+            try:
+                barrier.wait()
+                start = i % len(NAMES)
+                results[i] = {name: solar.flux_density(name, units='Jy',
+                                                       xunits='Hz')
+                              for name in NAMES[start:] + NAMES[:start]}
+            except Exception as e:      # pragma: no cover
+                errors.append(e)
+
+        with mock.patch.object(solar, '_MODEL_STORE',
+                               solar._store.ModelStore(load)), \
+             mock.patch.object(solar, '_SPECTRUM_CACHE',
+                               solar._cache.SpectrumCache()), \
+             mock.patch.object(solar, '_convert_flux_density', convert):
+            threads = [threading.Thread(target=work, args=(i,))
+                       for i in range(nthreads)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(loads), sorted(name.lower() for name in NAMES))
+        self.assertEqual(len(conversions), len(NAMES))
+
+        # Every thread got the same shared, read-only Tabulation per model
+        for name in NAMES:
+            tabulations = {id(result[name]) for result in results}
+            self.assertEqual(len(tabulations), 1)
+
+        model = results[0]['Kurucz']
+        self.assertFalse(model.x.flags.writeable)
+        self.assertFalse(model.y.flags.writeable)
+        spectrum = solar._model_spectrum('Kurucz')
+        self.assertFalse(spectrum.x.flags.writeable)
+        self.assertFalse(spectrum.y.flags.writeable)
+        with self.assertRaises(ValueError):
+            spectrum.y[0] = 0.
+
+        # A failed load stores nothing and is retried
+        store = solar._store.ModelStore(mock.Mock(side_effect=[OSError, 1]))
+        with self.assertRaises(OSError):
+            store.get('key')
+        self.assertNotIn('key', store)
+        self.assertEqual(store.get('key'), 1)
+        self.assertIn('key', store)
+
+    def test_data_cache(self):
+        parser = mock.Mock(side_effect=lambda path: np.loadtxt(path))
+        with tempfile.TemporaryDirectory() as tempdir:
+            source = os.path.join(tempdir, 'source.txt')
+            with open(source, 'w') as f:
+                f.write('1 2\n3 4\n')
+
+            cachedir = os.path.join(tempdir, 'cache')
+            with mock.patch.dict(os.environ, {'RMS_SOLAR_CACHE_DIR': cachedir}):
+                array = solar._data.load_array(source, parser)
+                self.assertTrue(np.all(array == [[1, 2], [3, 4]]))
+                self.assertEqual(parser.call_count, 1)
+                self.assertEqual(len(os.listdir(cachedir)), 1)
+
+                # Second load is memory-mapped from the binary copy
+                array = solar._data.load_array(source, parser)
+                self.assertEqual(parser.call_count, 1)
+                self.assertIsInstance(array, np.memmap)
+                self.assertFalse(array.flags.writeable)
+                self.assertTrue(np.all(array == [[1, 2], [3, 4]]))
+                del array       # a memory-mapped file cannot be removed on Windows
+
+                # A changed source makes the binary copy stale
+                with open(source, 'w') as f:
+                    f.write('1 2\n3 4\n5 6\n')
+                array = solar._data.load_array(source, parser)
+                self.assertEqual(parser.call_count, 2)
+                self.assertEqual(array.shape, (3, 2))
+
+                # A corrupt binary copy is replaced
+                path = solar._data.cache_path(source)
+                with open(path, 'w') as f:
+                    f.write('garbage')
+                array = solar._data.load_array(source, parser)
+                self.assertEqual(parser.call_count, 3)
+                self.assertEqual(array.shape, (3, 2))
+
+            # Unwritable or disabled cache falls back to parsing every time
+            with mock.patch.dict(os.environ, {'RMS_SOLAR_CACHE_DIR': source}):
+                array = solar._data.load_array(source, parser)
+                self.assertEqual(parser.call_count, 4)
+                self.assertEqual(array.shape, (3, 2))
+
+            with mock.patch.dict(os.environ, {'RMS_SOLAR_CACHE_DIR': ''}):
+                self.assertIsNone(solar._data.cache_dir())
+                array = solar._data.load_array(source, parser)
+                self.assertEqual(parser.call_count, 5)
+
+        # A prebuilt copy next to the data file takes precedence
+        with tempfile.TemporaryDirectory() as tempdir:
+            source = os.path.join(tempdir, 'source.txt')
+            np.save(os.path.join(tempdir, 'source.npy'), np.arange(4.))
+            array = solar._data.load_array(source, parser)
+            self.assertEqual(parser.call_count, 5)
+            self.assertTrue(np.all(array == np.arange(4.)))
+            del array
+
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': 'xdg'}):
+            os.environ.pop('RMS_SOLAR_CACHE_DIR', None)
+            self.assertEqual(solar._data.cache_dir(), os.path.join('xdg',
+                                                                   'rms-solar'))
+
+    def test_model_data(self):
+        import astropy.io.fits as pyfits
+        import solar.rieke
+        import solar.stis
+
+        for (module, filename) in [(solar.stis, 'stis-sun_reference_stis_002.fits'),
+                                   (solar.rieke, 'rieke-solar_spec.fits')]:
+            with pyfits.open(solar._data.data_file_path(filename)) as hdulist:
+                table = hdulist[1].data
+                self.assertTrue(np.all(module.WAVELENGTH == table['WAVELENGTH']))
+                self.assertTrue(np.all(module.FLUX == table['FLUX']))
+
+            for array in (module.WAVELENGTH, module.FLUX):
+                self.assertEqual(array.dtype, np.dtype('float64'))
+                self.assertTrue(array.flags.c_contiguous)
+                self.assertFalse(array.flags.writeable)
+
+            self.assertTrue(np.all(module.FLUX_DENSITY.x == module.WAVELENGTH))
+            self.assertTrue(np.all(module.FLUX_DENSITY.y == module.FLUX))
+
+            # The model is computed from the memory-mapped arrays themselves
+            spectrum = solar._model_spectrum(module.__name__.split('.')[-1])
+            self.assertIs(spectrum.x, module.WAVELENGTH)
+            self.assertIs(spectrum.y, module.FLUX)
+
+        import solar.colina
+
+        self.assertEqual(solar.colina.COLINA_ARRAY.shape, (1447, 2))
+        self.assertEqual(tuple(solar.colina.COLINA_ARRAY[0]), (0.1195, 1.34269e-18))
+        self.assertEqual(tuple(solar.colina.COLINA_ARRAY[-1]), (2.5, 3.37610e-13))
+        self.assertFalse(solar.colina.WAVELENGTH.flags.writeable)
+        self.assertFalse(solar.colina.FLUX.flags.writeable)
+        self.assertTrue(np.all(solar.colina.FLUX ==
+                               solar.colina.COLINA_ARRAY[:, 1] * np.pi))
+
+        # The prebuilt copies let every model load without astropy
+        code = ('import sys, solar; '
+                'solar.flux_density("STIS_Rieke"); solar.flux_density("Kurucz"); '
+                'print("astropy" in sys.modules)')
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                capture_output=True, text=True).stdout
+        self.assertEqual(output.strip(), 'False')
+
+    def test_composite_model(self):
+        import solar.stis
+        import solar.rieke
+        import solar.stis_rieke
+
+        # STIS_Rieke is spliced from views of the STIS and Rieke arrays
+        stis = solar._model_spectrum('stis')
+        rieke = solar._model_spectrum('rieke')
+        composite = solar._splice_models(('stis', 'rieke'), (None,))
+        self.assertTrue(np.shares_memory(composite.segments[0][0].x, stis.x))
+        self.assertTrue(np.shares_memory(composite.segments[1][0].y, rieke.y))
+
+        mask = rieke.x > stis.x[-1]
+        merged_x = np.hstack((stis.x, rieke.x[mask]))
+        merged_y = np.hstack((stis.y, rieke.y[mask]))
+
+        # Conversion does not concatenate the composite's own arrays
+        for (units, xunits) in [('W/m^2/um', 'um'), ('Jy', 'Hz')]:
+            converted = solar._convert_spectrum(composite, units, xunits)
+            expected = solar._convert_spectrum(
+                solar.Spectrum(merged_x, merged_y, units=composite.units,
+                               xunits=composite.xunits), units, xunits)
+            self.assertTrue(np.all(converted.x == expected.x))
+            self.assertTrue(np.all(converted.y == expected.y))
+        self.assertIsNone(composite._x)
+        self.assertEqual(composite.size, merged_x.size)
+
+        self.assertTrue(np.all(composite.x == merged_x))
+        self.assertTrue(np.all(composite.y == merged_y))
+        self.assertFalse(composite.y.flags.writeable)
+        self.assertTrue(np.all(solar.stis_rieke.FLUX_DENSITY.x == merged_x))
+
+        # Models in other units are converted before splicing
+        composite = solar._splice_models(('colina', 'kurucz'), (2.,))
+        kurucz = solar.flux_density('kurucz', units='W/m^2/Hz', xunits='um')
+        x = np.array([1., 2., 2.5, 3., 10.])
+        self.assertTrue(np.all(composite.evaluate(x)[:2] ==
+                               solar.flux_density('colina', units='W/m^2/Hz')(x[:2])))
+        self.assertTrue(np.allclose(composite.evaluate(x)[3:], kurucz(x[3:]),
+                                    rtol=1e-14))
+        self.assertGreater(composite.x[-1], 2.5)
+
+        self.assertRaises(ValueError, solar._splice_models, ('colina', 'kurucz'),
+                          ())
+        self.assertRaises(ValueError, solar._splice_models,
+                          ('colina', 'kurucz', 'rieke'), (2., 1.))
+
+    def test_register_model(self):
+        x = np.linspace(0.5, 0.6, 11)
+        y = np.linspace(1., 2., 11)
+        frozen = x.copy()
+        frozen.flags.writeable = False
+
+        with mock.patch.dict(solar._MODELS._loaders), \
+                mock.patch.object(solar, '_MODEL_STORE', solar._store.ModelStore(
+                    lambda key: solar._load_model(key))), \
+                mock.patch.object(solar, '_SPECTRUM_CACHE',
+                                  solar._cache.SpectrumCache()):
+            solar.register_model('Test_Arrays', (frozen, y), units='Jy',
+                                 xunits='um')
+            solar.register_model('test_tab', tab.Tabulation(x, y))
+            self.assertIn('test_arrays', solar.registered_models())
+            self.assertIn('stis_rieke', solar.registered_models())
+
+            # Read-only float64 arrays are not copied; other arrays are
+            spectrum = solar._model_spectrum('TEST_ARRAYS')
+            self.assertIs(spectrum.x, frozen)
+            self.assertFalse(np.shares_memory(spectrum.y, y))
+            y[0] = 0.
+            self.assertEqual(spectrum.y[0], 1.)
+
+            # Registered models are converted like the built-in ones
+            fd = solar.flux_density('test_arrays', units='W/m^2/nm', xunits='nm')
+            self.assertTrue(np.allclose(fd.x, 1000. * x))
+            self.assertTrue(np.allclose(
+                fd.y, solar.flux_density('test_tab', units='Jy').y * 1.e-29 *
+                solar.C * 1.e9 / (1000. * x)**2, rtol=1e-12))
+            self.assertAlmostEqual(solar.bandpass_flux_density(((0.5, 0.6), (1, 1)),
+                                                               'test_tab'), 1.5)
+
+            self.assertRaises(ValueError, solar.register_model, 'test_tab',
+                              (x, y))
+            self.assertRaises(ValueError, solar.register_model, 'Kurucz', (x, y))
+            self.assertRaises(ValueError, solar.register_model, 'test',
+                              (x[::-1], y))
+            self.assertRaises(ValueError, solar.register_model, 'test', (x, y[1:]))
+            self.assertRaises(ValueError, solar.register_model, 'test', (x, y),
+                              units='W')
+            self.assertRaisesRegex(ValueError, 'valid models are: colina, kurucz',
+                                   solar.flux_density, 'nonexistent')
+
+        # Models provided by other packages are discovered once, when needed
+        entry_point = importlib.metadata.EntryPoint(
+            name='Fake_Plugin', value='solar._fake', group='rms_solar.models')
+        registry = solar._registry.ModelRegistry(solar._module_spectrum)
+        registry.register('builtin', lambda key: key)
+        with mock.patch('importlib.metadata.entry_points',
+                        return_value=[entry_point]) as entry_points:
+            self.assertEqual(registry.load('builtin'), 'builtin')
+            self.assertEqual(entry_points.call_count, 0)
+            self.assertIn('fake_plugin', registry)
+            spectrum = registry.load('fake_plugin')
+            self.assertTrue(np.all(spectrum.x == solar._fake.FLUX_DENSITY.x))
+            self.assertEqual(spectrum.units, solar._fake.UNITS)
+            self.assertEqual(registry.names(), ['builtin', 'fake_plugin'])
+            self.assertEqual(entry_points.call_count, 1)
+
+    def test_register_composite_model(self):
+        x = np.array([0.5, 0.9, 0.95, 1.0, 1.05, 1.1, 1.5])
+        stis = solar.flux_density('STIS')(x)
+        kurucz = solar.flux_density('Kurucz')(x)
+
+        with tempfile.TemporaryDirectory() as tempdir, \
+                mock.patch.dict(os.environ, {'RMS_SOLAR_CACHE_DIR': tempdir}), \
+                mock.patch.dict(solar._MODELS._loaders), \
+                mock.patch.object(solar, '_MODEL_STORE', solar._store.ModelStore(
+                    lambda key: solar._load_model(key))), \
+                mock.patch.object(solar, '_SPECTRUM_CACHE',
+                                  solar._cache.SpectrumCache()):
+            solar.register_composite_model('STIS_Kurucz', ['STIS', 'Kurucz'],
+                                           [1.], blends=0.2)
+            solar.register_composite_model('stis_kurucz', ('stis', 'kurucz'),
+                                           (1.,), blends=(0.2,))
+            solar.register_composite_model('Stis_Kurucz_Saved', ['STIS', 'Kurucz'],
+                                           [1000.], blends=200., xunits='nm',
+                                           persist=True)
+
+            # The blend meets each model at the limits of its region
+            fd = solar.flux_density('stis_kurucz')(x)
+            self.assertTrue(np.allclose(fd[:2], stis[:2], rtol=1e-14))
+            self.assertTrue(np.allclose(fd[-2:], kurucz[-2:], rtol=1e-14))
+            self.assertTrue(np.all((fd[2:5] - np.minimum(stis, kurucz)[2:5]) *
+                                   (fd[2:5] - np.maximum(stis, kurucz)[2:5]) <= 0.))
+
+            # Registered models work everywhere a model name does
+            bandpass = ((0.95, 1.05), (1., 1.))
+            self.assertAlmostEqual(
+                solar.bandpass_f(bandpass, model='STIS_Kurucz') /
+                solar.mean_f(1., 0.1, model='stis_kurucz'), 1., places=12)
+            self.assertTrue(np.all(solar.sample_flux_density(x, 'stis_kurucz') == fd))
+
+            # Persistent composites are memory-mapped from the cache directory
+            saved = solar.flux_density('stis_kurucz_saved')
+            self.assertTrue(np.all(saved(x) == fd))
+            self.assertTrue(any(name.startswith('composite.stis_kurucz_saved.')
+                                for name in os.listdir(tempdir)))
+
+            self.assertRaises(ValueError, solar.register_composite_model,
+                              'stis_kurucz', ['stis', 'kurucz'], [1.1])
+            self.assertRaises(ValueError, solar.register_composite_model,
+                              'STIS', ['stis', 'kurucz'], [1.])
+            self.assertRaises(ValueError, solar.register_composite_model,
+                              'test', ['stis', 'nonexistent'], [1.])
+            self.assertRaises(ValueError, solar.register_composite_model,
+                              'test', ['stis', 'kurucz'], [1., 2.])
+            self.assertRaises(ValueError, solar.register_composite_model,
+                              'test', ['stis', 'kurucz'], [1.], xunits='Hz')
+
+            # Invalid regions are reported on first use
+            solar.register_composite_model('test', ['stis', 'kurucz'], [0.1],
+                                           blends=0.1)
+            self.assertRaises(ValueError, solar.flux_density, 'test')
+
+            # Splice wavelengths cannot be applied to a model in frequency
+            solar.register_model('test_hz', (x, kurucz), xunits='Hz')
+            solar.register_composite_model('test_hz_kurucz', ['test_hz', 'kurucz'],
+                                           [1.])
+            self.assertRaisesRegex(ValueError, 'must be tabulated in wavelength',
+                                   solar.flux_density, 'test_hz_kurucz')
+
+    def test_share_models(self):
+        code = ('import sys, numpy as np, solar; '
+                'fd = solar.flux_density("Kurucz"); '
+                'print("solar.kurucz" in sys.modules, fd.x.flags.writeable, '
+                'repr(float(np.sum(fd.y))))')
+        import solar.kurucz
+        expected = repr(float(np.sum(solar.kurucz.FLUX_DENSITY.y)))
+
+        solar.share_models(['Kurucz'])
+        try:
+            self.assertIn('kurucz', solar._shared.manifest())
+            output = subprocess.run([sys.executable, '-c', code], check=True,
+                                    capture_output=True, text=True).stdout
+            self.assertEqual(output.split(), ['False', 'False', expected])
+
+            # Publishing again is harmless
+            solar.share_models(['kurucz'])
+            self.assertEqual(list(solar._shared.manifest()), ['kurucz'])
+        finally:
+            solar.unshare_models()
+
+        self.assertNotIn(solar._shared.ENVIRONMENT_VARIABLE, os.environ)
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                capture_output=True, text=True).stdout
+        self.assertEqual(output.split(), ['True', 'False', expected])
+
+        self.assertRaises(ValueError, solar.share_models, ['nonexistent'])
+
+        # Only POSIX systems have a resource tracker to unregister from
+        from multiprocessing import resource_tracker, shared_memory
+        block = shared_memory.SharedMemory(create=True, size=8)
+        try:
+            with mock.patch.object(solar._shared.sys, 'version_info', (3, 12)), \
+                 mock.patch.object(solar._shared.os, 'name', 'nt'), \
+                 mock.patch.object(resource_tracker, 'unregister') as unregister:
+                solar._shared._open(block.name).close()
+            unregister.assert_not_called()
+        finally:
+            block.close()
+            block.unlink()
+
     def test_bandpass_flux_density(self):
         bandpass = tab.Tabulation((0, 1000), (1, 1))
         # Integral of full fake model is 0.16,
@@ -123,6 +936,345 @@ class TestSolar(unittest.TestCase):
         bfd = solar.bandpass_flux_density(bandpass, model=model, solar_f=False)
         self.assertAlmostEqual(bfd, 4)
 
+        # Arrays are accepted for the model, and can be used without validation;
+        # their lookup tables are then kept for later calls
+        bfd = solar.bandpass_flux_density(bandpass, model=(model.x, model.y))
+        self.assertAlmostEqual(bfd, 4.)
+        arrays = (model.x.copy(), model.y.copy())
+        with mock.patch.object(solar, '_SPECTRUM_CACHE',
+                               solar._cache.SpectrumCache()):
+            for sun_range in (1., 2.):
+                bfd = solar.bandpass_flux_density(((0.17, 0.19), (1., 1.)),
+                                                  model=arrays, solar_f=True,
+                                                  sun_range=sun_range,
+                                                  validate=False)
+                self.assertAlmostEqual(bfd, 4. / np.pi / sun_range**2)
+            self.assertEqual(solar.cache_info().hits, 1)
+            self.assertIs(solar._SPECTRUM_CACHE.get(
+                ('arrays', id(arrays[0]), id(arrays[1])), None).x, arrays[0])
+
+        self.assertRaises(ValueError, solar.bandpass_flux_density,
+                          ((0.3, 0.4), (1., 1.)), model=model)
+        self.assertRaises(ValueError, solar.bandpass_flux_density,
+                          ((0.3, 0.4), (1., 1.)), model=model, validate=False)
+
+    def test_result_cache(self):
+        x = np.linspace(0.5, 0.6, 41)
+        bandpasses = [(x, np.exp(-((x - 0.55) / 0.02)**2) + i) for i in range(4)]
+        expected = [solar.bandpass_f(bandpass) for bandpass in bandpasses]
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'results.sqlite')
+            try:
+                solar.configure_result_cache(path=path, max_entries=3)
+
+                # The first call computes and saves; the second reads the saved
+                # value at 1 AU and applies the distance
+                self.assertEqual(solar.bandpass_f(bandpasses[0]), expected[0])
+                with mock.patch.object(solar, '_bandpass_mean') as mean:
+                    self.assertTrue(np.all(
+                        solar.bandpass_f(bandpasses[0], sun_range=[1., 2.])
+                        == np.array([1., 0.25]) * expected[0]))
+                    self.assertEqual(mean.call_count, 0)
+
+                # The factor of pi is also applied after the cache; different
+                # units and models are different entries
+                self.assertAlmostEqual(solar.bandpass_flux_density(bandpasses[0]) /
+                                       (expected[0] * np.pi), 1., places=15)
+                self.assertEqual(len(solar._RESULT_CACHE), 1)
+                solar.bandpass_f(bandpasses[0], units='Jy')
+                self.assertEqual(len(solar._RESULT_CACHE), 2)
+
+                # Least recently used entries are evicted
+                for bandpass in bandpasses[1:]:
+                    solar.bandpass_f(bandpass)
+                self.assertEqual(len(solar._RESULT_CACHE), 3)
+                with mock.patch.object(solar, '_bandpass_mean',
+                                       return_value=0.) as mean:
+                    self.assertEqual(solar.bandpass_f(bandpasses[3]), expected[3])
+                    self.assertEqual(solar.bandpass_f(bandpasses[0]), 0.)
+                    self.assertEqual(mean.call_count, 1)
+
+                # Concurrent writers from a process pool
+                solar._RESULT_CACHE.clear()
+                with concurrent.futures.ProcessPoolExecutor(4) as executor:
+                    futures = [executor.submit(_put_results, path, 100 * i, 100)
+                               for i in range(8)]
+                    self.assertEqual([f.result() for f in futures], [100] * 8)
+                cache = solar._results.ResultCache(path)
+                self.assertEqual(len(cache), 800)
+                self.assertEqual(cache.get('key321'), 321.)
+                self.assertIsNone(cache.get('key800'))
+
+            finally:
+                solar.configure_result_cache(False)
+
+        self.assertIsNone(solar._RESULT_CACHE)
+        with mock.patch.dict(os.environ, {'RMS_SOLAR_CACHE_DIR': ''}):
+            with self.assertRaises(ValueError):
+                solar.configure_result_cache()
+
+    def test_bandpass_accuracy(self):
+        # Narrow bandpasses far from the peak of the spectrum, in wavelength and
+        # in frequency, match Tabulation multiplication and integration
+        for (xunits, centers) in [('um', (200., 150., 40.)),
+                                  ('Hz', (1.5e12, 1.e13, 1.e14, 1.e15))]:
+            model = solar.flux_density('Kurucz', xunits=xunits)
+            for center in centers:
+                delta = 0.00125 * center
+                bandpass = tab.Tabulation((center - delta, center, center + delta),
+                                          (0., 1., 0.))
+                value = solar.bandpass_flux_density(bandpass, 'Kurucz',
+                                                    xunits=xunits)
+                self.assertAlmostEqual(value / _product_mean(bandpass, model), 1.,
+                                       places=14)
+
+    def test_bandpass_flux_densities(self):
+        bandpasses = [tab.Tabulation((0, 1000), (1, 1)),
+                      tab.Tabulation((0.18, 0.19), (1, 1)),
+                      ((0.18, 0.19), (1, 1)),
+                      tab.Tabulation((0.58, 0.62), (.5, .5)),
+                      ((0.62, 0.60, 0.58), (.5, .5, .5)),
+                      ((2., 3.), (1., 1.))]
+        bfd = solar.bandpass_flux_densities(bandpasses, model='_fake',
+                                            solar_f=True)
+        self.assertEqual(bfd.shape, (6,))
+        self.assertTrue(np.allclose(bfd[:5], [0.32, 1, 1, 1, 1]))
+        self.assertTrue(np.isnan(bfd[5]))
+
+        bfd = solar.bandpass_flux_densities(bandpasses[1:2], model='_fake',
+                                            solar_f=True, units='W/m^2/nm',
+                                            sun_range=2)
+        self.assertAlmostEqual(bfd[0], 1/4000)
+
+        # Padded 2-D form
+        x = np.array([[180., 190., np.nan], [580., 600., 620.]])
+        y = np.array([[1., 1., 0.], [.5, .5, .5]])
+        bfd = solar.bandpass_flux_densities((x, y), model='_fake', xunits='nm',
+                                            solar_f=True)
+        self.assertTrue(np.allclose(bfd, [1, 1]))
+
+        with self.assertRaises(ValueError):
+            solar.bandpass_flux_densities((x, y[:, :2]), model='_fake')
+
+        # A tuple of two bandpasses is not the 2-D form
+        for pair in [(((0.18, 0.19), (1, 1)), ((0.58, 0.60, 0.62), (.5, .5, .5))),
+                     (((0.18, 0.19), (1, 1)), ((0.58, 0.62), (1, 1)))]:
+            bfd = solar.bandpass_flux_densities(pair, model='_fake', solar_f=True)
+            self.assertTrue(np.allclose(bfd, [1, 1]))
+        with self.assertRaises(ValueError):
+            solar.bandpass_flux_densities([((0.18, 0.2, 0.19), (1, 1, 1))],
+                                          model='_fake')
+        with self.assertRaises(ValueError):
+            solar.bandpass_flux_densities([((0.18, 0.19), (1, 1, 1))],
+                                          model='_fake')
+
+        # Agreement with the scalar function for real models and shaped filters
+        rng = np.random.default_rng(1234)
+        bandpasses = []
+        for i in range(20):
+            center = rng.uniform(0.2, 2.)
+            x = np.sort(rng.uniform(center - 0.1, center + 0.1, 6))
+            bandpasses.append(tab.Tabulation(x, rng.uniform(0.1, 1., 6)))
+
+        model = tab.Tabulation(np.array([0.15, 0.16, 0.17, 0.18, 0.19, 0.20]),
+                               np.array([1., 2., 3., 4., 5., 6.]))
+        bandpasses.append(tab.Tabulation((0.17, 0.19), (1., 1.)))
+        bfd = solar.bandpass_flux_densities(bandpasses[-1:], model=model)
+        self.assertAlmostEqual(bfd[0], 4)
+
+        for name in NAMES:
+            for (unit, xunit, scale) in [('W/m^2/um', 'um', 1.),
+                                         ('Jy', 'nm', 1.e3)]:
+                scaled = [(b.x * scale, b.y) for b in bandpasses[:-1]]
+                bfd = solar.bandpass_flux_densities(scaled, model=name,
+                                                    units=unit, xunits=xunit)
+                for (value, bandpass) in zip(bfd, scaled):
+                    expected = solar.bandpass_flux_density(bandpass, model=name,
+                                                           units=unit,
+                                                           xunits=xunit)
+                    self.assertAlmostEqual(value / expected, 1., places=8)
+
+            # Frequency grids are increasing, like wavelength grids
+            in_hz = [(solar.C_IN_UM_HZ / b.x, b.y) for b in bandpasses[:-1]]
+            bfd = solar.bandpass_flux_densities(in_hz, model=name, units='Jy',
+                                                xunits='Hz')
+            for (value, bandpass) in zip(bfd, in_hz):
+                expected = solar.bandpass_flux_density(bandpass, model=name,
+                                                       units='Jy', xunits='Hz')
+                self.assertAlmostEqual(value / expected, 1., places=8)
+
+        # Narrow bandpasses far from the peak of the spectrum, in wavelength and
+        # in frequency, match Tabulation multiplication and integration
+        for (xunits, centers) in [('um', (0.2, 10., 100., 199.9)),
+                                  ('Hz', (1.5e12, 1.e14, 1.e15))]:
+            model = solar.flux_density('Kurucz', xunits=xunits)
+            bandpasses = [tab.Tabulation((0.999 * c, c, 1.001 * c), (0., 1., 0.))
+                          for c in centers]
+            bfd = solar.bandpass_flux_densities(bandpasses, 'Kurucz',
+                                                xunits=xunits)
+            for (value, bandpass) in zip(bfd, bandpasses):
+                self.assertAlmostEqual(value / _product_mean(bandpass, model), 1.,
+                                       places=14)
+
+    def test_register_bandpass(self):
+        x = np.linspace(0.5, 0.6, 41)
+        y = np.exp(-((x - 0.55) / 0.02)**2)
+        with tempfile.TemporaryDirectory() as tempdir:
+            with mock.patch.dict(os.environ, {'RMS_SOLAR_CACHE_DIR': tempdir}):
+                solar.register_bandpass('TEST_GRN', (x, y))
+                solar.register_bandpass('TEST_GRN_NM', (x * 1000., y),
+                                        xunits='nm')
+                entry = solar.registered_bandpasses()['TEST_GRN']
+                self.assertEqual(entry.xunits, 'um')
+                self.assertEqual(entry.integral, tab.Tabulation(x, y).integral())
+
+                # Named bandpasses match the same bandpass given explicitly
+                for name in ('TEST_GRN', 'TEST_GRN_NM'):
+                    for model in ('STIS_Rieke', 'Kurucz'):
+                        expected = solar.bandpass_f((x, y), model=model,
+                                                    units='Jy', sun_range=2.)
+                        value = solar.bandpass_f(name, model=model, units='Jy',
+                                                 sun_range=2.)
+                        self.assertAlmostEqual(value / expected, 1., places=12)
+
+                value = solar.bandpass_flux_density('TEST_GRN',
+                                                    solar.flux_density('Kurucz'))
+                self.assertAlmostEqual(value / solar.bandpass_flux_density(
+                    (x, y), 'Kurucz'), 1., places=14)
+
+                # Means are saved for other processes, which do not integrate
+                path = os.path.join(tempdir, 'bandpasses.json')
+                self.assertTrue(os.path.exists(path))
+                expected = solar.bandpass_f('TEST_GRN', model='STIS_Rieke',
+                                            units='Jy')
+                with mock.patch.object(solar, '_BANDPASSES',
+                                       solar._bandpass.BandpassRegistry()):
+                    solar.register_bandpass('TEST_GRN', (x, y))
+                    with mock.patch.object(solar.Spectrum,
+                                           'bandpass_integrals') as integrals:
+                        self.assertEqual(solar.bandpass_f('TEST_GRN',
+                                                          model='STIS_Rieke',
+                                                          units='Jy'),
+                                         expected)
+                        self.assertEqual(integrals.call_count, 0)
+
+                # A change to the model data invalidates the saved mean
+                with mock.patch.object(solar, '_BANDPASSES',
+                                       solar._bandpass.BandpassRegistry()):
+                    solar.register_bandpass('TEST_GRN', (x, y))
+                    with mock.patch.object(solar._composite.CompositeSpectrum,
+                                           'fingerprint', 'new'):
+                        self.assertAlmostEqual(
+                            solar.bandpass_f('TEST_GRN', model='STIS_Rieke') /
+                            solar.bandpass_f((x, y), model='STIS_Rieke'), 1.,
+                            places=12)
+                with open(path) as f:
+                    saved = f.read()
+                self.assertIn('"new"', saved)
+
+                # Means saved by an earlier integration algorithm are recomputed
+                with mock.patch.object(solar, '_BANDPASSES',
+                                       solar._bandpass.BandpassRegistry()), \
+                        mock.patch.object(solar._bandpass,
+                                          'INTEGRATION_VERSION', 1):
+                    solar.register_bandpass('TEST_GRN', (x, y))
+                    store = solar._data.load_json('bandpasses.json')
+                    store['TEST_GRN']['means']['stis_rieke|W/m^2/um'] = {
+                        'fingerprint': solar._model_spectrum('stis_rieke').fingerprint,
+                        'mean': 1.}
+                    solar._data.save_json('bandpasses.json', store)
+                    self.assertEqual(solar.bandpass_flux_density('TEST_GRN'), 1.)
+                with mock.patch.object(solar, '_BANDPASSES',
+                                       solar._bandpass.BandpassRegistry()):
+                    solar.register_bandpass('TEST_GRN', (x, y))
+                    self.assertAlmostEqual(
+                        solar.bandpass_flux_density('TEST_GRN') /
+                        solar.bandpass_flux_density((x, y)), 1., places=12)
+
+                # Re-registering a name replaces the bandpass and its means
+                solar.register_bandpass('TEST_GRN', (x, 2. * y ** 2))
+                self.assertAlmostEqual(solar.bandpass_f('TEST_GRN') /
+                                       solar.bandpass_f((x, y ** 2)), 1.,
+                                       places=12)
+
+        with self.assertRaises(ValueError):
+            solar.bandpass_f('TEST_UNDEFINED')
+        with self.assertRaises(ValueError):
+            solar.register_bandpass('TEST_BAD', (x, y), xunits='mm')
+
+    def test_batch_bandpass_flux_density(self):
+        x = np.linspace(0.4, 0.8, 81)
+        names = []
+        # The bandpasses are registered in a registry of this test only
+        with tempfile.TemporaryDirectory() as tempdir, \
+                mock.patch.dict(os.environ, {'RMS_SOLAR_CACHE_DIR': tempdir}), \
+                mock.patch.object(solar, '_BANDPASSES',
+                                  solar._bandpass.BandpassRegistry()):
+            for i in range(4):
+                names.append(f'TEST_BATCH{i}')
+                solar.register_bandpass(names[-1], (x, np.exp(
+                    -((x - 0.45 - 0.1 * i) / 0.03)**2)))
+
+            rng = np.random.default_rng(19)
+            filters = rng.choice(names, 500)
+            ranges = rng.uniform(0.5, 40., 500)
+            models = rng.choice(['STIS_Rieke', 'kurucz', 'Colina'], 500)
+            units = rng.choice(['W/m^2/um', 'Jy'], 500)
+
+            # Results match the scalar API exactly, in input order
+            results = solar.batch_bandpass_f(filters, ranges, models, units,
+                                             max_workers=2)
+            self.assertEqual(results.shape, (500,))
+            for i in range(0, 500, 7):
+                self.assertEqual(results[i], solar.bandpass_f(
+                    filters[i], model=models[i], units=units[i],
+                    sun_range=ranges[i]))
+
+            # Known combinations are not computed again
+            with mock.patch.object(concurrent.futures,
+                                   'ProcessPoolExecutor') as executor:
+                again = solar.batch_bandpass_f(filters, ranges, models,
+                                               units)
+                self.assertEqual(executor.call_count, 0)
+            self.assertTrue(np.all(again == results))
+
+            # Scalar columns broadcast, and serial execution agrees
+            table = np.array(names * 3).reshape(3, 4)
+            results = solar.batch_bandpass_flux_density(
+                table, [[1.], [2.], [3.]], units='erg/s/cm^2/A',
+                max_workers=1)
+            self.assertEqual(results.shape, (3, 4))
+            self.assertEqual(results[2, 1], solar.bandpass_flux_density(
+                names[1], units='erg/s/cm^2/A', sun_range=3.))
+
+            with self.assertRaises(ValueError):
+                solar.batch_bandpass_f(['TEST_UNDEFINED', names[0]], 1.)
+            with self.assertRaises(ValueError):
+                solar.batch_bandpass_f(names, 1., model='undefined')
+
+            # Workers that are spawned register the run-time models again
+            spawn = multiprocessing.get_context('spawn')
+            with mock.patch.dict(solar._MODELS._loaders), \
+                    mock.patch.object(solar, '_MODEL_STORE', solar._store.ModelStore(
+                        lambda key: solar._load_model(key))), \
+                    mock.patch.object(solar, '_SPECTRUM_CACHE',
+                                      solar._cache.SpectrumCache()), \
+                    mock.patch.object(concurrent.futures, 'ProcessPoolExecutor',
+                                      functools.partial(
+                                          concurrent.futures.ProcessPoolExecutor,
+                                          mp_context=spawn)):
+                solar.register_model('test_batch', (x, 1. + x))
+                solar.register_composite_model('test_batch_ck2', ['kurucz',
+                                                                  'test_batch'],
+                                               [0.5])
+                results = solar.batch_bandpass_flux_density(
+                    names[:2], model='test_batch_ck2', max_workers=2)
+                self.assertEqual(results[0], solar.bandpass_flux_density(
+                    names[0], model='test_batch_ck2'))
+                self.assertEqual(results[1], solar.bandpass_flux_density(
+                    names[1], model='test_batch_ck2'))
+
     def test_mean_flux_density(self):
         # Integral of full fake model is 0.16,
         # mean is 0.16 / 0.5 = 0.32
@@ -158,6 +1310,67 @@ class TestSolar(unittest.TestCase):
         mfd = solar.mean_flux_density(0.18, 0.02, model=model, solar_f=False)
         self.assertAlmostEqual(mfd, 4)
 
+    def test_boxcar_index(self):
+        # The cumulative-integral fast path must agree with integrating the
+        # boxcar Tabulation
+        rng = np.random.default_rng(42)
+        for name in NAMES:
+            for (unit, xunit, scale) in [('W/m^2/um', 'um', 1.),
+                                         ('erg/s/cm^2/A', 'A', 1.e4)]:
+                for i in range(10):
+                    center = rng.uniform(0.2, 2.4) * scale
+                    width = rng.uniform(1.e-4, 0.3) * scale
+                    mfd = solar.mean_flux_density(center, width, model=name,
+                                                  units=unit, xunits=xunit)
+                    bandpass = tab.Tabulation((center - width/2.,
+                                               center + width/2.), (1., 1.))
+                    expected = solar.bandpass_flux_density(bandpass, model=name,
+                                                           units=unit,
+                                                           xunits=xunit)
+                    self.assertAlmostEqual(mfd / expected, 1., places=10)
+
+        # Narrow boxcars far from the peak of the spectrum match Tabulation
+        # multiplication and integration
+        model = solar.flux_density('Kurucz')
+        for (center, width) in [(199.9, 0.05), (150., 0.01), (40., 0.002)]:
+            bandpass = tab.Tabulation((center - width/2., center + width/2.),
+                                      (1., 1.))
+            mfd = solar.mean_flux_density(center, width, model='Kurucz')
+            self.assertAlmostEqual(mfd / _product_mean(bandpass, model), 1.,
+                                   places=14)
+
+        # A boxcar of zero width returns the value at its center
+        mfd = solar.mean_flux_density(0.63, 0., model='_fake', solar_f=True)
+        self.assertAlmostEqual(mfd, 2.)
+
+        with self.assertRaises(ValueError):
+            solar.mean_flux_density(5., 1., model='_fake')
+
+    def test_mean_flux_density_arrays(self):
+        centers = np.linspace(0.3, 2.3, 4000)
+        widths = np.full(4000, 0.0005)
+        for name in NAMES:
+            mfd = solar.mean_flux_density(centers, widths, model=name)
+            self.assertEqual(mfd.shape, (4000,))
+            for i in (0, 1234, 3999):
+                self.assertEqual(mfd[i], solar.mean_flux_density(centers[i],
+                                                                 widths[i],
+                                                                 model=name))
+
+        # Broadcasting of center, width, and sun_range
+        mf = solar.mean_f([[0.185], [0.6]], [0.01, 0.02], model='_fake',
+                          sun_range=[1., 2.])
+        self.assertTrue(np.allclose(mf, [[1., 0.25], [1., 0.25]]))
+
+        mf = solar.mean_f([0.185, 5.], 0.01, model='_fake')
+        self.assertAlmostEqual(mf[0], 1.)
+        self.assertTrue(np.isnan(mf[1]))
+
+        model = tab.Tabulation(np.array([0.15, 0.16, 0.17, 0.18, 0.19, 0.20]),
+                               np.array([1., 2., 3., 4., 5., 6.]))
+        mfd = solar.mean_flux_density([0.18, 0.185], [0.02, 0.01], model=model)
+        self.assertTrue(np.allclose(mfd, [4., 4.5]))
+
     def test_bandpass_f(self):
         bandpass = tab.Tabulation((0, 1000), (1, 1))
         # Integral of full fake model is 0.16,